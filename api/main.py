@@ -18,10 +18,11 @@ from src.database import get_database
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database on startup and close it on shutdown."""
     db = get_database()
     db.init_db()
     yield
+    db.close()
 
 
 app = FastAPI(
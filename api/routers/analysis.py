@@ -13,7 +13,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.database import get_database
 from src.analyzer import PainPointAnalyzer
-from src.models import PainPoint
 from api.websocket import job_manager
 
 
@@ -69,24 +68,10 @@ async def run_analysis(source: Optional[str], unprocessed_only: bool, batch_size
             })
             
             # Run analysis
-            result = await asyncio.to_thread(analyzer.analyze_with_result, batch)
+            result = await asyncio.to_thread(analyzer.analyze_with_result, batch, len(batch))
             
             # Save pain points
-            pain_points = []
-            for extracted in result.pain_points:
-                if extracted.review_number <= len(batch):
-                    review = batch[extracted.review_number - 1]
-                    from src.models import EmotionalIntensity
-                    pain_points.append(PainPoint(
-                        review_id=review.id,
-                        category=extracted.pain_point_category,
-                        verbatim_quote=extracted.verbatim_quote,
-                        emotional_intensity=EmotionalIntensity(extracted.emotional_intensity.lower()),
-                        implied_need=extracted.implied_need,
-                    ))
-            
-            if pain_points:
-                db.insert_pain_points_batch(pain_points)
+            result.persist(db, batch)
             
             # Mark reviews as processed
             review_ids = [r.id for r in batch]
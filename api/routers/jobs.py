@@ -103,9 +103,10 @@ async def run_scrape_job(job_id: int, source: str, query: str, options: dict):
                 max_reviews=options.get("max_reviews", 100),
             )
         
-        # Insert reviews
+        # Insert reviews in one transaction, off the event loop so the
+        # commit doesn't stall other requests and job updates
         if reviews:
-            count = db.insert_reviews_batch(reviews)
+            count = await asyncio.to_thread(db.insert_reviews_batch, reviews)
             db.update_scrape_job(job_id, status=JobStatus.COMPLETED, reviews_found=count)
             await job_manager.broadcast(job_id, {
                 "status": "completed",
@@ -4,6 +4,7 @@ Pain Points API Router
 import io
 import csv
 import json
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Query, HTTPException
@@ -66,6 +67,7 @@ async def get_pain_points(
     all_pain_points = db.get_all_pain_points_with_reviews()
     
     # Apply filters
+    search_lower = search.lower() if search else None
     filtered = []
     for pp, review in all_pain_points:
         # Category filter
@@ -82,8 +84,7 @@ async def get_pain_points(
             continue
         
         # Search filter
-        if search:
-            search_lower = search.lower()
+        if search_lower:
             if not (
                 search_lower in pp.verbatim_quote.lower()
                 or search_lower in pp.category.lower()
@@ -101,7 +102,8 @@ async def get_pain_points(
         elif sort_by == "emotional_intensity":
             return pp.emotional_intensity.value if pp.emotional_intensity else "medium"
         else:  # extracted_at
-            return pp.extracted_at.isoformat() if pp.extracted_at else ""
+            # Compare datetimes directly rather than formatting each row
+            return pp.extracted_at or datetime.min
     
     filtered.sort(key=get_sort_key, reverse=(sort_order == "desc"))
     
@@ -92,7 +92,8 @@ async def get_reviews(
         elif sort_by == "review_date":
             return r.review_date or ""
         else:  # scraped_at
-            return r.scraped_at.isoformat() if r.scraped_at else ""
+            # Compare datetimes directly rather than formatting each row
+            return r.scraped_at or datetime.min
     
     filtered.sort(key=get_sort_key, reverse=(sort_order == "desc"))
     
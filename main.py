@@ -91,13 +91,13 @@ def init():
 
 @app.command("import")
 def import_reviews(
-    file_path: str = typer.Argument(..., help="Path to CSV or JSON file to import"),
+    file_path: str = typer.Argument(..., help="Path to CSV, JSON or JSONL file, or a directory of them, to import"),
     source: str = typer.Option("manual", "--source", "-s", help="Source name for imported reviews"),
 ):
-    """Import reviews from a CSV or JSON file."""
+    """Import reviews from a CSV, JSON or JSON Lines file, or every such file in a directory."""
     from src.database import get_database
     from src.exceptions import DatabaseError
-    from src.scrapers.csv_import import import_reviews as do_import
+    from src.scrapers.csv_import import CSVImporter
     
     path = Path(file_path)
     logger.info("Importing reviews from %s", path)
@@ -107,10 +107,25 @@ def import_reviews(
         console.print(f"[red]Error:[/red] File not found: {file_path}")
         raise typer.Exit(1)
     
+    if path.is_dir():
+        file_paths = sorted(
+            str(child) for child in path.iterdir()
+            if child.is_file() and child.suffix.lower() in CSVImporter.SUPPORTED_SUFFIXES
+        )
+        if not file_paths:
+            logger.error("No importable files in %s", file_path)
+            console.print(f"[red]Error:[/red] No CSV, JSON or JSONL files in {file_path}")
+            raise typer.Exit(1)
+        file_format = f"{len(file_paths)} files"
+    else:
+        file_paths = [file_path]
+        file_format = path.suffix
+    
     try:
         with console.status(f"[bold green]Importing reviews from {path.name}..."):
             try:
-                reviews = do_import(file_path, default_source=source)
+                # Files in a directory are parsed in parallel processes
+                reviews = CSVImporter().import_files(file_paths, default_source=source)
             except ValueError as e:
                 logger.error("Import parsing failed: %s", e)
                 console.print(f"[red]Error:[/red] {e}")
@@ -132,7 +147,7 @@ def import_reviews(
         console.print(Panel.fit(
             f"[green]OK[/green] Imported [bold]{count}[/bold] reviews from [cyan]{path.name}[/cyan]\n"
             f"    Source: [cyan]{source}[/cyan]\n"
-            f"    File format: [cyan]{path.suffix}[/cyan]",
+            f"    File format: [cyan]{file_format}[/cyan]",
             title="[bold]Import Complete[/bold]",
             border_style="green",
         ))
@@ -275,7 +290,6 @@ def analyze(
             # Process in batches
             all_pain_points = []
             failed_batches = 0
-            review_id_map = {i: r.id for i, r in enumerate(reviews)}
             
             for i in range(0, len(reviews), batch_size):
                 batch = reviews[i:i + batch_size]
@@ -283,31 +297,16 @@ def analyze(
                 progress.update(task, description=f"Processing batch {batch_num}...")
                 logger.debug("Processing batch %d (%d reviews)", batch_num, len(batch))
                 
-                try:
-                    pain_points = analyzer.analyze_batch_sync(batch, batch_size=len(batch))
-                    logger.debug("Batch %d extracted %d pain points", batch_num, len(pain_points))
-                except AnalyzerError as e:
-                    logger.warning("Batch %d failed: %s", batch_num, e)
+                result = analyzer.analyze_with_result(batch, batch_size=len(batch))
+                if result.has_failures:
+                    logger.warning("Batch %d failed: %s", batch_num, "; ".join(result.errors))
                     failed_batches += 1
                     progress.update(task, advance=len(batch))
                     continue
+                logger.debug("Batch %d extracted %d pain points", batch_num, len(result.pain_points))
                 
-                # Map pain points to review IDs and store
-                for pp in pain_points:
-                    # The review_number from Claude is 1-indexed within the batch
-                    batch_idx = pp.review_number - 1
-                    global_idx = i + batch_idx
-                    if global_idx in review_id_map and review_id_map[global_idx]:
-                        from src.models import EmotionalIntensity, PainPoint
-                        db_pp = PainPoint(
-                            review_id=review_id_map[global_idx],
-                            category=pp.pain_point_category,
-                            verbatim_quote=pp.verbatim_quote,
-                            emotional_intensity=EmotionalIntensity(pp.emotional_intensity.lower()),
-                            implied_need=pp.implied_need,
-                        )
-                        db.insert_pain_point(db_pp)
-                        all_pain_points.append(db_pp)
+                # Map pain points to review IDs and store them in one insert
+                all_pain_points.extend(result.persist(db, batch))
                 
                 progress.update(task, advance=len(batch))
             
@@ -382,6 +381,7 @@ def scrape_amazon(
     query: str = typer.Argument(..., help="Search query or product URL"),
     max_products: int = typer.Option(10, "--max-products", "-p", help="Maximum products to scrape"),
     max_reviews: int = typer.Option(50, "--max-reviews", "-r", help="Maximum reviews per product"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached pages and fetch everything again"),
 ):
     """Scrape reviews from Amazon."""
     import asyncio
@@ -402,10 +402,10 @@ def scrape_amazon(
             with console.status(f"[bold green]Scraping Amazon for '{query}'..."):
                 if query.startswith("http"):
                     logger.debug("Scraping single URL: %s", query)
-                    reviews = await scraper.scrape_reviews(query, max_reviews=max_reviews)
+                    reviews = await scraper.scrape_reviews(query, max_reviews=max_reviews, force_refresh=refresh)
                 else:
                     logger.debug("Searching for products: %s (max=%d)", query, max_products)
-                    reviews = await scraper.scrape_from_search(query, max_products, max_reviews)
+                    reviews = await scraper.scrape_from_search(query, max_products, max_reviews, force_refresh=refresh)
                 
                 if reviews:
                     count = db.insert_reviews_batch(reviews)
@@ -422,6 +422,9 @@ def scrape_amazon(
             logger.error("Amazon scrape failed: %s", e, exc_info=True)
             console.print(Panel(f"[red]Error:[/red] {e}", title="Scrape Failed", border_style="red"))
             raise typer.Exit(1)
+        finally:
+            # scrape_reviews leaves the browser open; this also saves the session
+            await scraper.close()
     
     asyncio.run(run())
 
@@ -511,6 +514,9 @@ def scrape_reddit(
             logger.error("Reddit scrape failed: %s", e, exc_info=True)
             console.print(Panel(f"[red]Error:[/red] {e}", title="Scrape Failed", border_style="red"))
             raise typer.Exit(1)
+        finally:
+            # The loop ends with asyncio.run, so its pooled connections go too
+            await scraper.close()
     
     asyncio.run(run())
 
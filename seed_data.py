@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 import random
 from pathlib import Path
 
+from src.database import Database
+
 # Database path
 DB_PATH = Path("data/review_miner.db")
 
@@ -736,14 +738,58 @@ SCRAPE_JOBS = [
 ]
 
 
+# Parameter rows built once at import so seeding is pure executemany
+_SEEDED_AT = datetime.now().isoformat()
+
+_REVIEW_ROWS = [
+    (
+        review["source"],
+        review["source_url"],
+        review["product_title"],
+        None,  # product_url
+        review["author"],
+        review["rating"],
+        review["review_text"],
+        review["review_date"],
+        True,  # processed
+        _SEEDED_AT,
+    )
+    for review in REVIEWS
+]
+
+# (category, quote, implied_needs); review, intensity and need are picked per seed
+_PAIN_POINT_ROW_TEMPLATE = [
+    (template["category"], quote, tuple(template["implied_needs"]))
+    for template in PAIN_POINT_TEMPLATES
+    for quote in template["quotes"]
+]
+
+_SCRAPE_JOB_ROWS = [
+    (
+        job["source"],
+        job["query"],
+        job["status"],
+        job["reviews_found"],
+        job["started_at"],
+        job["completed_at"],
+    )
+    for job in SCRAPE_JOBS
+]
+
+_INTENSITIES = ("low", "medium", "high")
+
+
 def seed_database():
     """Seed the database with mock data."""
     print("[SEED] Seeding ReviewMiner database with roofing industry data...\n")
     
     conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     cursor = conn.cursor()
     
-    # Create tables if they don't exist
+    # Create tables if they don't exist (indexes are built after the bulk load)
     cursor.executescript("""
         CREATE TABLE IF NOT EXISTS reviews (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -781,107 +827,74 @@ def seed_database():
             completed_at TEXT,
             error_message TEXT
         );
-
-        CREATE INDEX IF NOT EXISTS idx_reviews_source ON reviews(source);
-        CREATE INDEX IF NOT EXISTS idx_reviews_processed ON reviews(processed);
-        CREATE INDEX IF NOT EXISTS idx_pain_points_category ON pain_points(category);
     """)
     
+    # Drop indexes so inserts don't maintain them row by row (sql is NULL for
+    # the automatic ones backing UNIQUE constraints, which can't be dropped)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+    for (name,) in cursor.fetchall():
+        cursor.execute(f'DROP INDEX "{name}"')
+    
     # Clear existing data
-    cursor.execute("DELETE FROM pain_points")
-    cursor.execute("DELETE FROM reviews")
-    cursor.execute("DELETE FROM scrape_jobs")
+    cursor.executescript("""
+        DELETE FROM pain_points;
+        DELETE FROM reviews;
+        DELETE FROM scrape_jobs;
+    """)
     conn.commit()
     print("[OK] Cleared existing data")
     
     # Insert reviews
-    review_count = 0
-    for review in REVIEWS:
-        cursor.execute(
-            """
-            INSERT INTO reviews (source, source_url, product_title, product_url, author, rating, review_text, review_date, processed, scraped_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                review["source"],
-                review["source_url"],
-                review["product_title"],
-                None,  # product_url
-                review["author"],
-                review["rating"],
-                review["review_text"],
-                review["review_date"],
-                True,  # processed
-                datetime.now().isoformat(),
-            ),
-        )
-        review_count += 1
-    
-    conn.commit()
+    cursor.executemany(
+        """
+        INSERT INTO reviews (source, source_url, product_title, product_url, author, rating, review_text, review_date, processed, scraped_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        _REVIEW_ROWS,
+    )
+    review_count = len(_REVIEW_ROWS)
     print(f"[OK] Inserted {review_count} reviews")
     
     # Get review IDs for pain point assignment
     cursor.execute("SELECT id FROM reviews")
     review_ids = [row[0] for row in cursor.fetchall()]
     
-    # Insert pain points
-    pain_point_count = 0
-    intensities = ["low", "medium", "high"]
-    
-    for template in PAIN_POINT_TEMPLATES:
-        category = template["category"]
-        quotes = template["quotes"]
-        needs = template["implied_needs"]
-        
-        for quote in quotes:
-            # Assign to a random review
-            review_id = random.choice(review_ids)
-            intensity = random.choice(intensities)
-            implied_need = random.choice(needs)
-            
-            cursor.execute(
-                """
-                INSERT INTO pain_points (review_id, category, verbatim_quote, emotional_intensity, implied_need, extracted_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    review_id,
-                    category,
-                    quote,
-                    intensity,
-                    implied_need,
-                    datetime.now().isoformat(),
-                ),
-            )
-            pain_point_count += 1
-    
-    conn.commit()
+    # Insert pain points, each assigned to a random review
+    choice = random.choice
+    pain_point_rows = [
+        (choice(review_ids), category, quote, choice(_INTENSITIES), choice(needs), _SEEDED_AT)
+        for category, quote, needs in _PAIN_POINT_ROW_TEMPLATE
+    ]
+    cursor.executemany(
+        """
+        INSERT INTO pain_points (review_id, category, verbatim_quote, emotional_intensity, implied_need, extracted_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        pain_point_rows,
+    )
+    pain_point_count = len(pain_point_rows)
     print(f"[OK] Inserted {pain_point_count} pain points")
     
     # Insert scrape jobs
-    job_count = 0
-    for job in SCRAPE_JOBS:
-        cursor.execute(
-            """
-            INSERT INTO scrape_jobs (source, query, status, reviews_found, started_at, completed_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                job["source"],
-                job["query"],
-                job["status"],
-                job["reviews_found"],
-                job["started_at"],
-                job["completed_at"],
-            ),
-        )
-        job_count += 1
-    
+    cursor.executemany(
+        """
+        INSERT INTO scrape_jobs (source, query, status, reviews_found, started_at, completed_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        _SCRAPE_JOB_ROWS,
+    )
+    job_count = len(_SCRAPE_JOB_ROWS)
     conn.commit()
     print(f"[OK] Inserted {job_count} scrape jobs")
     
     conn.close()
     
+    # Build the schema's indexes once over the loaded data; init_db() also
+    # gathers planner statistics since it's creating them
+    db = Database(str(DB_PATH))
+    db.init_db()
+    db.close()
+    
     # Print summary
     print("\n" + "=" * 50)
     print("Seed Data Summary")
@@ -1,32 +1,64 @@
 """Claude API integration for pain point extraction."""
 
 import json
-import logging
+import random
 import re
+import time
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 import anthropic
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-    before_sleep_log,
-)
+import httpx
 
+from src.database import Database
 from src.exceptions import AnalyzerAPIError, AnalyzerError, AnalyzerParseError
 from src.logging_config import get_logger
-from src.models import ExtractedPainPoint, Review
+from src.models import EmotionalIntensity, ExtractedPainPoint, PainPoint, Review
 from src.prompts import PAIN_POINT_EXTRACTOR
 
 
 logger = get_logger(__name__)
 
 
+def _build_pain_points(data: list) -> List[ExtractedPainPoint]:
+    """Build ExtractedPainPoint objects from decoded response items.
+    
+    Every field is coerced explicitly with int()/str() before construction,
+    so the model is built with model_construct() instead of being validated
+    a second time by pydantic.
+    """
+    construct = ExtractedPainPoint.model_construct
+    pain_points = [None] * len(data)
+    count = 0
+    for item in data:
+        try:
+            get = item.get
+            quote = str(get("verbatim_quote", ""))
+            if not quote:  # Only add if we have a quote
+                continue
+            pain_points[count] = construct(
+                review_number=int(get("review_number", 0)),
+                pain_point_category=str(get("pain_point_category", "Unknown")),
+                verbatim_quote=quote,
+                emotional_intensity=str(get("emotional_intensity", "medium")).lower(),
+                implied_need=str(get("implied_need", "")),
+            )
+            count += 1
+        except (AttributeError, ValueError, TypeError) as e:
+            logger.debug("Skipping invalid pain point: %s", e)
+            continue
+    del pain_points[count:]
+    return pain_points
+
+
 @dataclass
 class AnalysisResult:
-    """Result of batch analysis with failure tracking."""
+    """
+    Result of batch analysis with failure tracking.
+    
+    Each pain point's review_number is 1-indexed into the full list of
+    reviews that was analyzed, not into the API batch it came from.
+    """
     
     pain_points: List[ExtractedPainPoint] = field(default_factory=list)
     successful_batches: int = 0
@@ -46,6 +78,43 @@ class AnalysisResult:
         if total == 0:
             return 0.0
         return (self.successful_batches / total) * 100
+    
+    def persist(self, db: Database, reviews: List[Review]) -> List[PainPoint]:
+        """
+        Store the extracted pain points in a single batch insert.
+        
+        Args:
+            db: Database to write to
+            reviews: The reviews that were analyzed, in the same order
+        
+        Returns:
+            The pain points that were stored
+        """
+        pain_points = []
+        for extracted in self.pain_points:
+            index = extracted.review_number - 1
+            if not 0 <= index < len(reviews) or not reviews[index].id:
+                continue
+            try:
+                intensity = EmotionalIntensity(extracted.emotional_intensity.lower())
+            except ValueError:
+                # One bad value shouldn't cost the rest of the batch
+                logger.warning(
+                    "Skipping pain point with unknown emotional intensity %r",
+                    extracted.emotional_intensity,
+                )
+                continue
+            pain_points.append(PainPoint(
+                review_id=reviews[index].id,
+                category=extracted.pain_point_category,
+                verbatim_quote=extracted.verbatim_quote,
+                emotional_intensity=intensity,
+                implied_need=extracted.implied_need,
+            ))
+        
+        if pain_points:
+            db.insert_pain_points_batch(pain_points)
+        return pain_points
 
 
 class PainPointAnalyzer:
@@ -58,6 +127,14 @@ class PainPointAnalyzer:
         anthropic.InternalServerError,
     )
     
+    # Backoff bounds between retries, in seconds
+    RETRY_MIN_WAIT = 2.0
+    RETRY_MAX_WAIT = 30.0
+    
+    # Connection pool shared by all batches sent through this analyzer
+    HTTP_MAX_CONNECTIONS = 32
+    HTTP_TIMEOUT = 60.0
+    
     def __init__(
         self,
         api_key: str,
@@ -66,7 +143,14 @@ class PainPointAnalyzer:
     ):
         if not api_key:
             raise ValueError("Anthropic API key is required")
-        self.client = anthropic.Anthropic(api_key=api_key)
+        limits = httpx.Limits(
+            max_connections=self.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=self.HTTP_MAX_CONNECTIONS,
+        )
+        self.client = anthropic.Anthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultHttpxClient(limits=limits, timeout=self.HTTP_TIMEOUT),
+        )
         self.model = model
         self.max_retries = max_retries
         logger.debug("Initialized PainPointAnalyzer with model=%s", model)
@@ -129,11 +213,15 @@ class PainPointAnalyzer:
             
             try:
                 pain_points = self._process_single_batch(batch)
+                if i:
+                    # Renumber from batch-relative to position in reviews
+                    for pp in pain_points:
+                        pp.review_number += i
                 result.pain_points.extend(pain_points)
                 result.successful_batches += 1
                 result.total_reviews_processed += len(batch)
                 logger.debug("Batch %d extracted %d pain points", batch_num, len(pain_points))
-                
+            
             except (AnalyzerError, anthropic.APIError) as e:
                 error_msg = f"Batch {batch_num} failed: {e}"
                 logger.warning(error_msg)
@@ -164,17 +252,6 @@ class PainPointAnalyzer:
         
         return result
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((
-            anthropic.APIConnectionError,
-            anthropic.RateLimitError,
-            anthropic.InternalServerError,
-        )),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
     def _process_single_batch(self, batch: List[Review]) -> List[ExtractedPainPoint]:
         """
         Process a single batch of reviews with retry logic.
@@ -190,20 +267,7 @@ class PainPointAnalyzer:
             AnalyzerParseError: If response parsing fails
         """
         batch_text = self._format_reviews(batch)
-        
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=PAIN_POINT_EXTRACTOR,
-                messages=[{
-                    "role": "user",
-                    "content": f"Analyze these reviews and extract pain points:\n\n{batch_text}"
-                }]
-            )
-        except anthropic.APIError as e:
-            logger.error("Claude API error: %s", e)
-            raise AnalyzerAPIError(f"API call failed: {e}") from e
+        response = self._create_message(batch_text)
         
         response_text = response.content[0].text
         logger.debug("Received response with %d characters", len(response_text))
@@ -216,6 +280,56 @@ class PainPointAnalyzer:
         
         return pain_points
     
+    def _create_message(self, batch_text: str):
+        """
+        Call the Claude API, retrying transient failures with exponential backoff.
+        
+        Rate-limit responses honor the server's Retry-After header when it asks
+        for a longer wait than the current backoff.
+        
+        Raises:
+            AnalyzerAPIError: If the call fails or retries are exhausted
+        """
+        delay = self.RETRY_MIN_WAIT
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                return self.client.messages.create(
+                    model=self.model,
+                    max_tokens=4096,
+                    system=PAIN_POINT_EXTRACTOR,
+                    messages=[{
+                        "role": "user",
+                        "content": f"Analyze these reviews and extract pain points:\n\n{batch_text}"
+                    }]
+                )
+            except self.RETRYABLE_EXCEPTIONS as e:
+                if attempt >= self.max_retries:
+                    logger.error("Claude API error after %d attempts: %s", attempt, e)
+                    raise AnalyzerAPIError(f"API call failed: {e}") from e
+                wait = max(delay, self._retry_after(e)) + random.uniform(0, 0.5)
+                logger.warning(
+                    "Claude API error (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt, self.max_retries, wait, e,
+                )
+                time.sleep(wait)
+                delay = min(delay * 2, self.RETRY_MAX_WAIT)
+            except anthropic.APIError as e:
+                logger.error("Claude API error: %s", e)
+                raise AnalyzerAPIError(f"API call failed: {e}") from e
+        
+        raise AnalyzerAPIError("API call failed: no attempts made")
+    
+    @staticmethod
+    def _retry_after(error: Exception) -> float:
+        """Get the Retry-After delay in seconds from an API error, or 0."""
+        response = getattr(error, "response", None)
+        if response is None:
+            return 0.0
+        try:
+            return float(response.headers.get("retry-after", 0))
+        except (TypeError, ValueError):
+            return 0.0
+    
     async def analyze_batch(
         self,
         reviews: List[Review],
@@ -266,26 +380,16 @@ class PainPointAnalyzer:
             logger.warning("Response is not a JSON array")
             return []
         
-        pain_points = []
-        for item in data:
-            try:
-                pp = ExtractedPainPoint(
-                    review_number=int(item.get("review_number", 0)),
-                    pain_point_category=str(item.get("pain_point_category", "Unknown")),
-                    verbatim_quote=str(item.get("verbatim_quote", "")),
-                    emotional_intensity=str(item.get("emotional_intensity", "medium")).lower(),
-                    implied_need=str(item.get("implied_need", "")),
-                )
-                if pp.verbatim_quote:  # Only add if we have a quote
-                    pain_points.append(pp)
-            except (ValueError, TypeError) as e:
-                logger.debug("Skipping invalid pain point: %s", e)
-                continue
-        
-        return pain_points
+        return _build_pain_points(data)
     
     def _extract_json(self, text: str) -> Optional[str]:
         """Extract JSON array from text, handling markdown code blocks."""
+        # Fast path: most responses are a bare JSON array
+        stripped = text.lstrip()
+        if stripped.startswith("["):
+            bracket_end = stripped.rfind("]")
+            return stripped[:bracket_end + 1] if bracket_end > 0 else None
+        
         # Try to find JSON in markdown code block
         code_block_pattern = r"```(?:json)?\s*([\s\S]*?)```"
         matches = re.findall(code_block_pattern, text)
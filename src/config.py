@@ -1,6 +1,7 @@
 """Configuration loading and management."""
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,10 @@ from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
 
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class AnthropicConfig(BaseModel):
     """Anthropic API configuration."""
     model: str = "claude-sonnet-4-5-20250929"
@@ -22,9 +27,13 @@ class AnthropicConfig(BaseModel):
 class AmazonScraperConfig(BaseModel):
     """Amazon scraper configuration."""
     enabled: bool = True
-    delay_min: float = 3
-    delay_max: float = 7
+    requests_per_minute: float = 12  # Shared by all pages; 0 disables the limit
     delay_between_products: float = 45
+    concurrent_pages: int = 2
+    cache_dir: str = "data/raw/amazon"
+    cache_ttl_days: float = 7  # 0 disables the page cache
+    storage_state_path: str = "data/amazon_state.json"  # "" disables session reuse
+    http_fast_path: bool = True  # Fetch review pages without the browser when possible
     user_agents: list[str] = Field(default_factory=list)
 
 
@@ -33,6 +42,9 @@ class GoodreadsScraperConfig(BaseModel):
     enabled: bool = True
     delay_min: float = 2
     delay_max: float = 4
+    concurrent_books: int = 3
+    cache_dir: str = "data/raw/goodreads"
+    cache_ttl_days: float = 7  # 0 disables the page cache
 
 
 class RedditScraperConfig(BaseModel):
@@ -40,6 +52,9 @@ class RedditScraperConfig(BaseModel):
     enabled: bool = True
     subreddits: list[str] = Field(default_factory=lambda: ["books", "suggestmeabook"])
     pain_keywords: list[str] = Field(default_factory=lambda: ["disappointed", "waste of time"])
+    require_pain_keyword: bool = False  # Keep only text mentioning a pain keyword
+    cache_dir: str = "data/raw/reddit"
+    cache_ttl_days: float = 0.25  # 0 disables the response cache
 
 
 class LibraryThingScraperConfig(BaseModel):
@@ -92,31 +107,46 @@ class AppConfig(BaseModel):
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
 
 
+# Config attributes read from the environment once and then cached
+_ENV_PROPERTIES = (
+    "anthropic_api_key",
+    "reddit_client_id",
+    "reddit_client_secret",
+    "reddit_user_agent",
+    "proxy_url",
+)
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load variables from .env the first time any env value is needed."""
+    load_dotenv()
+
+
 class Config:
-    """Configuration manager that loads from YAML and environment variables."""
-    
-    _instance: Optional["Config"] = None
-    _config: Optional[AppConfig] = None
+    """
+    Configuration manager that loads from YAML and environment variables.
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    Nothing is read up front: config.yaml is parsed on first access to
+    config, and .env on first access to an environment-derived value.
+    """
     
-    def __init__(self):
-        if self._config is None:
-            self.load()
+    _config: Optional[AppConfig] = None
     
     def load(self, config_path: str = "config.yaml") -> None:
         """Load configuration from YAML file and environment variables."""
         # Load environment variables from .env
         load_dotenv()
         
+        # Drop env-derived values cached by a previous load
+        for name in _ENV_PROPERTIES:
+            self.__dict__.pop(name, None)
+        
         # Load YAML config
         config_file = Path(config_path)
         if config_file.exists():
             with open(config_file, "r") as f:
-                yaml_config = yaml.safe_load(f) or {}
+                yaml_config = yaml.load(f, Loader=YAML_LOADER) or {}
         else:
             yaml_config = {}
         
@@ -129,35 +159,41 @@ class Config:
             self.load()
         return self._config
     
-    @property
+    @cached_property
     def anthropic_api_key(self) -> str:
         """Get Anthropic API key from environment."""
+        _load_env()
         key = os.getenv("ANTHROPIC_API_KEY", "")
         if not key:
             raise ValueError("ANTHROPIC_API_KEY not set in environment")
         return key
     
-    @property
+    @cached_property
     def reddit_client_id(self) -> Optional[str]:
         """Get Reddit client ID from environment."""
+        _load_env()
         return os.getenv("REDDIT_CLIENT_ID")
     
-    @property
+    @cached_property
     def reddit_client_secret(self) -> Optional[str]:
         """Get Reddit client secret from environment."""
+        _load_env()
         return os.getenv("REDDIT_CLIENT_SECRET")
     
-    @property
+    @cached_property
     def reddit_user_agent(self) -> str:
         """Get Reddit user agent from environment."""
+        _load_env()
         return os.getenv("REDDIT_USER_AGENT", "review-miner/1.0")
     
-    @property
+    @cached_property
     def proxy_url(self) -> Optional[str]:
         """Get proxy URL from environment."""
+        _load_env()
         return os.getenv("PROXY_URL")
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get the configuration singleton."""
     return Config()
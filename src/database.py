@@ -1,10 +1,13 @@
 """SQLite database operations for Review Miner."""
 
 import sqlite3
+import threading
 from contextlib import contextmanager
-from datetime import datetime
+from functools import lru_cache
+from itertools import product
+from operator import attrgetter
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterator, Optional
 
 from src.models import (
     JobStatus,
@@ -16,7 +19,11 @@ from src.models import (
 )
 
 
-SCHEMA = """
+# Local ISO-8601 timestamp computed by SQLite, matching datetime.now().isoformat()
+_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+
+SCHEMA = f"""
 -- Reviews from all sources
 CREATE TABLE IF NOT EXISTS reviews (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -52,39 +59,224 @@ CREATE TABLE IF NOT EXISTS scrape_jobs (
     query TEXT,
     status TEXT DEFAULT 'pending',
     reviews_found INTEGER DEFAULT 0,
-    started_at TEXT,
+    started_at TEXT DEFAULT ({_NOW_SQL}),
     completed_at TEXT,
     error_message TEXT
 );
 
 -- Indexes for faster queries
 CREATE INDEX IF NOT EXISTS idx_reviews_source ON reviews(source);
-CREATE INDEX IF NOT EXISTS idx_reviews_processed ON reviews(processed);
+CREATE INDEX IF NOT EXISTS idx_reviews_processed_source_id ON reviews(processed, source, id);
 CREATE INDEX IF NOT EXISTS idx_pain_points_category ON pain_points(category);
+-- Serves the case-insensitive lower(category) = lower(?) filters
+CREATE INDEX IF NOT EXISTS idx_pain_points_category_lower ON pain_points(lower(category));
+-- Child-side index for the pain_points -> reviews foreign key
+CREATE INDEX IF NOT EXISTS idx_pain_points_review ON pain_points(review_id);
+
+-- Subsumed by idx_reviews_processed_source_id
+DROP INDEX IF EXISTS idx_reviews_processed;
+"""
+
+# Lets init_db() tell whether SCHEMA just created any index
+_INDEX_NAMES_SQL = "SELECT name FROM sqlite_master WHERE type = 'index'"
+
+
+# Column lists in model field order; rows are unpacked by position
+_REVIEW_COLUMNS = (
+    "id", "source", "source_url", "product_title", "product_url", "author",
+    "rating", "review_text", "review_date", "scraped_at", "processed",
+)
+_PAIN_POINT_COLUMNS = (
+    "id", "review_id", "category", "verbatim_quote", "emotional_intensity",
+    "implied_need", "extracted_at",
+)
+_REVIEW_COLS = ", ".join(_REVIEW_COLUMNS)
+_PAIN_POINT_COLS = ", ".join(_PAIN_POINT_COLUMNS)
+
+_PAIN_POINTS_WITH_REVIEWS_SELECT = f"""
+    SELECT {", ".join("p." + col for col in _PAIN_POINT_COLUMNS)},
+           {", ".join("r." + col for col in _REVIEW_COLUMNS)}
+    FROM pain_points p
+    JOIN reviews r ON p.review_id = r.id
 """
 
 
+def _build_get_reviews_sql(has_source: bool, has_processed: bool, has_limit: bool) -> str:
+    """Build the get_reviews query for one combination of filters."""
+    query = f"SELECT {_REVIEW_COLS} FROM reviews WHERE 1=1"
+    if has_source:
+        query += " AND source = ?"
+    if has_processed:
+        query += " AND processed = ?"
+    query += " ORDER BY id"
+    if has_limit:
+        query += " LIMIT ?"
+    return query
+
+
+def _build_pain_points_with_reviews_sql(has_category: bool, largest_first: bool) -> str:
+    """Build the pain points with reviews query for one filter and ordering."""
+    query = _PAIN_POINTS_WITH_REVIEWS_SELECT
+    if has_category:
+        query += "WHERE lower(p.category) = lower(?) "
+    query += "ORDER BY "
+    if largest_first:
+        query += "COUNT(*) OVER (PARTITION BY p.category) DESC, "
+    return query + "p.category, p.id"
+
+
+def _build_update_scrape_job_sql(
+    has_status: bool,
+    has_completed: bool,
+    has_reviews_found: bool,
+    has_error: bool,
+) -> str:
+    """Build the update_scrape_job statement for one combination of fields."""
+    updates = []
+    if has_status:
+        updates.append("status = ?")
+    if has_completed:
+        updates.append(f"completed_at = {_NOW_SQL}")
+    if has_reviews_found:
+        updates.append("reviews_found = ?")
+    if has_error:
+        updates.append("error_message = ?")
+    return f"UPDATE scrape_jobs SET {', '.join(updates)} WHERE id = ?"
+
+
+# Every statement shape is built once, so each call reuses the identical SQL
+# text and sqlite3's prepared statement cache
+_GET_REVIEWS_SQL = {
+    key: _build_get_reviews_sql(*key) for key in product((False, True), repeat=3)
+}
+_PAIN_POINTS_WITH_REVIEWS_SQL = {
+    key: _build_pain_points_with_reviews_sql(*key) for key in product((False, True), repeat=2)
+}
+_UPDATE_SCRAPE_JOB_SQL = {
+    key: _build_update_scrape_job_sql(*key)
+    for key in product((False, True), repeat=4)
+    if any(key) and (key[0] or not key[1])
+}
+
+
+# Insert parameter tuples pulled from models in one C-level call per row;
+# executemany consumes the map() lazily instead of a prebuilt list
+_review_insert_params = attrgetter(
+    "source", "source_url", "product_title", "product_url", "author",
+    "rating", "review_text", "review_date", "processed",
+)
+_pain_point_insert_params = attrgetter(
+    "review_id", "category", "verbatim_quote", "emotional_intensity.value", "implied_need",
+)
+
+
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Get a cursor that returns plain tuples instead of sqlite3.Row objects."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
 class Database:
     """SQLite database manager for Review Miner."""
     
+    # Largest ID list bound inline as IN (?, ...) parameters
+    MAX_INLINE_IDS = 500
+    
     def __init__(self, db_path: str = "data/review_miner.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # WAL is persistent in the database file, so it only needs setting once
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+        
+        # One connection per thread, reused across calls
+        self._conn_local = threading.local()
     
-    @contextmanager
-    def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with row factory."""
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with row factory and per-connection pragmas."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+    
+    @contextmanager
+    def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Get this thread's database connection, opening it on first use.
+        
+        If the block raises, uncommitted writes are rolled back, unless a
+        transaction was already open when it started: that one belongs to the
+        caller, who decides how it ends.
+        """
+        conn = getattr(self._conn_local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._conn_local.conn = conn
+        in_transaction = conn.in_transaction
         try:
             yield conn
-        finally:
+        except BaseException:
+            # Don't let a failed call's uncommitted writes leak into the next one
+            if not in_transaction:
+                conn.rollback()
+            raise
+    
+    @contextmanager
+    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Run a block of writes in one IMMEDIATE transaction.
+        
+        Commits when the block exits normally and rolls back if it raises.
+        Pass the yielded connection to batch methods to group them. Nested in
+        an open transaction, the block runs as a savepoint: an error undoes
+        only its own writes, and the outer transaction commits the rest.
+        """
+        with self.get_connection() as conn:
+            if conn.in_transaction:
+                conn.execute("SAVEPOINT nested_transaction")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK TO nested_transaction")
+                    conn.execute("RELEASE nested_transaction")
+                    raise
+                conn.execute("RELEASE nested_transaction")
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+    
+    def close(self) -> None:
+        """Close this thread's connection, if one is open."""
+        conn = getattr(self._conn_local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._conn_local.conn = None
     
     def init_db(self) -> None:
-        """Initialize the database with schema."""
+        """
+        Initialize the database with schema.
+        
+        Runs a full ANALYZE only when this call created indexes; otherwise
+        PRAGMA optimize refreshes planner statistics where they've gone stale.
+        """
         with self.get_connection() as conn:
+            indexes_before = set(conn.execute(_INDEX_NAMES_SQL))
             conn.executescript(SCHEMA)
+            if set(conn.execute(_INDEX_NAMES_SQL)) - indexes_before:
+                conn.execute("ANALYZE")
+            else:
+                conn.execute("PRAGMA optimize")
             conn.commit()
     
     def reset_db(self) -> None:
@@ -103,6 +295,8 @@ class Database:
     def insert_review(self, review: Review) -> int:
         """Insert a review and return its ID. Ignores duplicates."""
         with self.get_connection() as conn:
+            # Inside a caller's transaction, the caller decides when to commit
+            in_transaction = conn.in_transaction
             cursor = conn.execute(
                 """
                 INSERT OR IGNORE INTO reviews 
@@ -121,44 +315,43 @@ class Database:
                     review.processed,
                 ),
             )
-            conn.commit()
+            if not in_transaction:
+                conn.commit()
             return cursor.lastrowid or 0
     
-    def insert_reviews_batch(self, reviews: list[Review]) -> int:
-        """Insert multiple reviews. Returns count of inserted rows."""
-        with self.get_connection() as conn:
-            cursor = conn.executemany(
-                """
-                INSERT OR IGNORE INTO reviews 
-                (source, source_url, product_title, product_url, author, rating, review_text, review_date, processed)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    (
-                        r.source,
-                        r.source_url,
-                        r.product_title,
-                        r.product_url,
-                        r.author,
-                        r.rating,
-                        r.review_text,
-                        r.review_date,
-                        r.processed,
-                    )
-                    for r in reviews
-                ],
-            )
-            conn.commit()
-            return cursor.rowcount
+    def insert_reviews_batch(
+        self,
+        reviews: list[Review],
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> int:
+        """
+        Insert multiple reviews. Returns count of inserted rows.
+        
+        Runs in its own transaction unless a connection from transaction()
+        is passed in, in which case the caller commits.
+        """
+        if conn is None:
+            with self.transaction() as conn:
+                return self.insert_reviews_batch(reviews, conn)
+        
+        cursor = conn.executemany(
+            """
+            INSERT OR IGNORE INTO reviews 
+            (source, source_url, product_title, product_url, author, rating, review_text, review_date, processed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            map(_review_insert_params, reviews),
+        )
+        return cursor.rowcount
     
     def get_review(self, review_id: int) -> Optional[Review]:
         """Get a review by ID."""
         with self.get_connection() as conn:
             row = conn.execute(
-                "SELECT * FROM reviews WHERE id = ?", (review_id,)
+                f"SELECT {_REVIEW_COLS} FROM reviews WHERE id = ?", (review_id,)
             ).fetchone()
             if row:
-                return Review(**dict(row))
+                return Review.from_row(row)
             return None
     
     def get_reviews(
@@ -168,48 +361,75 @@ class Database:
         limit: Optional[int] = None,
     ) -> list[Review]:
         """Get reviews with optional filtering."""
-        query = "SELECT * FROM reviews WHERE 1=1"
+        query = _GET_REVIEWS_SQL[(bool(source), processed is not None, bool(limit))]
         params: list = []
         
         if source:
-            query += " AND source = ?"
             params.append(source)
         
         if processed is not None:
-            query += " AND processed = ?"
             params.append(processed)
         
-        query += " ORDER BY id"
-        
         if limit:
-            query += " LIMIT ?"
             params.append(limit)
         
         with self.get_connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [Review(**dict(row)) for row in rows]
+            rows = _tuple_cursor(conn).execute(query, params).fetchall()
+            return [Review.from_row(row) for row in rows]
     
     def get_unprocessed_reviews(self, limit: Optional[int] = None) -> list[Review]:
         """Get reviews that haven't been processed yet."""
         return self.get_reviews(processed=False, limit=limit)
     
+    def get_reviews_by_ids(self, review_ids: list[int]) -> dict[int, Review]:
+        """Get several reviews in one query, keyed by ID. Missing IDs are left out."""
+        if not review_ids:
+            return {}
+        with self.get_connection() as conn:
+            # Inside a caller's transaction, the caller decides when to commit
+            in_transaction = conn.in_transaction
+            clause, params = self._bind_ids(conn, review_ids)
+            rows = _tuple_cursor(conn).execute(
+                f"SELECT {_REVIEW_COLS} FROM reviews WHERE id {clause}", params
+            ).fetchall()
+            # Close the implicit transaction opened by filling the temp table
+            if not in_transaction:
+                conn.commit()
+        return {row[0]: Review.from_row(row) for row in rows}
+    
     def mark_reviews_processed(self, review_ids: list[int]) -> None:
         """Mark reviews as processed."""
         if not review_ids:
             return
-        with self.get_connection() as conn:
-            placeholders = ",".join("?" * len(review_ids))
-            conn.execute(
-                f"UPDATE reviews SET processed = TRUE WHERE id IN ({placeholders})",
-                review_ids,
-            )
-            conn.commit()
+        with self.transaction() as conn:
+            clause, params = self._bind_ids(conn, review_ids)
+            conn.execute(f"UPDATE reviews SET processed = TRUE WHERE id {clause}", params)
+    
+    def _bind_ids(self, conn: sqlite3.Connection, ids: list[int]) -> tuple[str, list]:
+        """
+        Build an "IN (...)" clause and its parameters for a list of IDs.
+        
+        Lists longer than MAX_INLINE_IDS would hit SQLite's bound-variable
+        limit, so they are loaded into a keyed temp table and matched with a
+        subquery instead.
+        """
+        if len(ids) <= self.MAX_INLINE_IDS:
+            return f"IN ({','.join('?' * len(ids))})", list(ids)
+        
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS _bound_ids (id INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM _bound_ids")
+        conn.executemany(
+            "INSERT OR IGNORE INTO _bound_ids (id) VALUES (?)",
+            ((value,) for value in ids),
+        )
+        return "IN (SELECT id FROM _bound_ids)", []
     
     # ========== Pain Point Operations ==========
     
     def insert_pain_point(self, pain_point: PainPoint) -> int:
         """Insert a pain point and return its ID."""
         with self.get_connection() as conn:
+            in_transaction = conn.in_transaction
             cursor = conn.execute(
                 """
                 INSERT INTO pain_points 
@@ -224,31 +444,34 @@ class Database:
                     pain_point.implied_need,
                 ),
             )
-            conn.commit()
+            if not in_transaction:
+                conn.commit()
             return cursor.lastrowid or 0
     
-    def insert_pain_points_batch(self, pain_points: list[PainPoint]) -> int:
-        """Insert multiple pain points. Returns count of inserted rows."""
-        with self.get_connection() as conn:
-            cursor = conn.executemany(
-                """
-                INSERT INTO pain_points 
-                (review_id, category, verbatim_quote, emotional_intensity, implied_need)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                [
-                    (
-                        pp.review_id,
-                        pp.category,
-                        pp.verbatim_quote,
-                        pp.emotional_intensity.value,
-                        pp.implied_need,
-                    )
-                    for pp in pain_points
-                ],
-            )
-            conn.commit()
-            return cursor.rowcount
+    def insert_pain_points_batch(
+        self,
+        pain_points: list[PainPoint],
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> int:
+        """
+        Insert multiple pain points. Returns count of inserted rows.
+        
+        Runs in its own transaction unless a connection from transaction()
+        is passed in, in which case the caller commits.
+        """
+        if conn is None:
+            with self.transaction() as conn:
+                return self.insert_pain_points_batch(pain_points, conn)
+        
+        cursor = conn.executemany(
+            """
+            INSERT INTO pain_points 
+            (review_id, category, verbatim_quote, emotional_intensity, implied_need)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            map(_pain_point_insert_params, pain_points),
+        )
+        return cursor.rowcount
     
     def get_pain_points(
         self,
@@ -256,7 +479,7 @@ class Database:
         review_id: Optional[int] = None,
     ) -> list[PainPoint]:
         """Get pain points with optional filtering."""
-        query = "SELECT * FROM pain_points WHERE 1=1"
+        query = f"SELECT {_PAIN_POINT_COLS} FROM pain_points WHERE 1=1"
         params: list = []
         
         if category:
@@ -270,75 +493,50 @@ class Database:
         query += " ORDER BY id"
         
         with self.get_connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [
-                PainPoint(
-                    id=row["id"],
-                    review_id=row["review_id"],
-                    category=row["category"],
-                    verbatim_quote=row["verbatim_quote"],
-                    emotional_intensity=row["emotional_intensity"],
-                    implied_need=row["implied_need"],
-                    extracted_at=row["extracted_at"],
-                )
-                for row in rows
-            ]
+            rows = _tuple_cursor(conn).execute(query, params).fetchall()
+            return [PainPoint.from_row(row) for row in rows]
+    
+    def get_all_pain_points_with_reviews(
+        self,
+        category: Optional[str] = None,
+    ) -> list[tuple[PainPoint, Review]]:
+        """Get all pain points with their associated reviews, optionally for one category."""
+        return list(self.iter_all_pain_points_with_reviews(category))
     
-    def get_all_pain_points_with_reviews(self) -> list[tuple[PainPoint, Review]]:
-        """Get all pain points with their associated reviews."""
-        query = """
-            SELECT 
-                p.id as p_id, p.review_id, p.category, p.verbatim_quote, 
-                p.emotional_intensity, p.implied_need, p.extracted_at,
-                r.id as r_id, r.source, r.source_url, r.product_title, 
-                r.product_url, r.author, r.rating, r.review_text, 
-                r.review_date, r.scraped_at, r.processed
-            FROM pain_points p
-            JOIN reviews r ON p.review_id = r.id
-            ORDER BY p.category, p.id
+    def iter_all_pain_points_with_reviews(
+        self,
+        category: Optional[str] = None,
+        largest_category_first: bool = False,
+    ) -> Iterator[tuple[PainPoint, Review]]:
+        """
+        Yield all pain points with their associated reviews as rows are read.
+        
+        category, if given, is matched case-insensitively. Rows are grouped by
+        category, alphabetically or, with largest_category_first, from the
+        category with the most pain points down.
         """
+        query = _PAIN_POINTS_WITH_REVIEWS_SQL[(bool(category), largest_category_first)]
+        params = (category,) if category else ()
+        
         with self.get_connection() as conn:
-            rows = conn.execute(query).fetchall()
-            results = []
-            for row in rows:
-                pain_point = PainPoint(
-                    id=row["p_id"],
-                    review_id=row["review_id"],
-                    category=row["category"],
-                    verbatim_quote=row["verbatim_quote"],
-                    emotional_intensity=row["emotional_intensity"],
-                    implied_need=row["implied_need"],
-                    extracted_at=row["extracted_at"],
-                )
-                review = Review(
-                    id=row["r_id"],
-                    source=row["source"],
-                    source_url=row["source_url"],
-                    product_title=row["product_title"],
-                    product_url=row["product_url"],
-                    author=row["author"],
-                    rating=row["rating"],
-                    review_text=row["review_text"],
-                    review_date=row["review_date"],
-                    scraped_at=row["scraped_at"],
-                    processed=row["processed"],
-                )
-                results.append((pain_point, review))
-            return results
+            for row in _tuple_cursor(conn).execute(query, params):
+                yield PainPoint.from_row(row[:len(_PAIN_POINT_COLUMNS)]), Review.from_row(row[len(_PAIN_POINT_COLUMNS):])
     
     # ========== Scrape Job Operations ==========
     
     def create_scrape_job(self, source: str, query: Optional[str] = None) -> int:
         """Create a new scrape job and return its ID."""
         with self.get_connection() as conn:
+            in_transaction = conn.in_transaction
             cursor = conn.execute(
-                """
+                f"""
                 INSERT INTO scrape_jobs (source, query, status, started_at)
-                VALUES (?, ?, ?, ?)
+                VALUES (?, ?, ?, {_NOW_SQL})
                 """,
-                (source, query, JobStatus.RUNNING.value, datetime.now().isoformat()),
+                (source, query, JobStatus.RUNNING.value),
             )
-            conn.commit()
+            if not in_transaction:
+                conn.commit()
             return cursor.lastrowid or 0
     
     def update_scrape_job(
@@ -349,92 +547,97 @@ class Database:
         error_message: Optional[str] = None,
     ) -> None:
         """Update a scrape job."""
-        updates = []
+        completed = status in (JobStatus.COMPLETED, JobStatus.FAILED)
+        key = (bool(status), completed, reviews_found is not None, bool(error_message))
+        if not any(key):
+            return
+        
         params: list = []
         
         if status:
-            updates.append("status = ?")
             params.append(status.value)
-            if status in (JobStatus.COMPLETED, JobStatus.FAILED):
-                updates.append("completed_at = ?")
-                params.append(datetime.now().isoformat())
         
         if reviews_found is not None:
-            updates.append("reviews_found = ?")
             params.append(reviews_found)
         
         if error_message:
-            updates.append("error_message = ?")
             params.append(error_message)
         
-        if not updates:
-            return
-        
         params.append(job_id)
         with self.get_connection() as conn:
-            conn.execute(
-                f"UPDATE scrape_jobs SET {', '.join(updates)} WHERE id = ?",
-                params,
-            )
-            conn.commit()
+            in_transaction = conn.in_transaction
+            conn.execute(_UPDATE_SCRAPE_JOB_SQL[key], params)
+            if not in_transaction:
+                conn.commit()
     
     # ========== Statistics ==========
     
     def get_review_stats(self) -> ReviewStats:
         """Get statistics about reviews."""
         with self.get_connection() as conn:
-            total = conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
-            
-            by_source = {}
-            for row in conn.execute(
-                "SELECT source, COUNT(*) as count FROM reviews GROUP BY source"
-            ).fetchall():
-                by_source[row["source"]] = row["count"]
-            
-            processed = conn.execute(
-                "SELECT COUNT(*) FROM reviews WHERE processed = TRUE"
-            ).fetchone()[0]
-            
-            return ReviewStats(
-                total_reviews=total,
-                by_source=by_source,
-                processed_count=processed,
-                unprocessed_count=total - processed,
-            )
+            rows = conn.execute(
+                """
+                SELECT source, COUNT(*) AS count,
+                       SUM(CASE WHEN processed = TRUE THEN 1 ELSE 0 END) AS processed
+                FROM reviews GROUP BY source
+                """
+            ).fetchall()
+        
+        by_source = {row["source"]: row["count"] for row in rows}
+        total = sum(by_source.values())
+        processed = sum(row["processed"] for row in rows)
+        
+        return ReviewStats(
+            total_reviews=total,
+            by_source=by_source,
+            processed_count=processed,
+            unprocessed_count=total - processed,
+        )
     
-    def get_pain_point_stats(self) -> PainPointStats:
-        """Get statistics about pain points."""
+    def get_pain_point_stats(self, category: Optional[str] = None) -> PainPointStats:
+        """
+        Get statistics about pain points, optionally for one category.
+        
+        category, if given, is matched case-insensitively. Categories with
+        equal counts are listed alphabetically. Only pain points whose review
+        still exists are counted, matching iter_all_pain_points_with_reviews.
+        """
+        query = (
+            "SELECT p.category, p.emotional_intensity, COUNT(*) AS count "
+            "FROM pain_points p JOIN reviews r ON p.review_id = r.id"
+        )
+        params: tuple = ()
+        if category:
+            query += " WHERE lower(p.category) = lower(?)"
+            params = (category,)
+        query += " GROUP BY p.category, p.emotional_intensity"
+        
         with self.get_connection() as conn:
-            total = conn.execute("SELECT COUNT(*) FROM pain_points").fetchone()[0]
-            
-            by_category = {}
-            for row in conn.execute(
-                "SELECT category, COUNT(*) as count FROM pain_points GROUP BY category ORDER BY count DESC"
-            ).fetchall():
-                by_category[row["category"]] = row["count"]
-            
-            by_intensity = {}
-            for row in conn.execute(
-                "SELECT emotional_intensity, COUNT(*) as count FROM pain_points GROUP BY emotional_intensity"
-            ).fetchall():
-                by_intensity[row["emotional_intensity"]] = row["count"]
-            
-            return PainPointStats(
-                total_pain_points=total,
-                by_category=by_category,
-                by_intensity=by_intensity,
-            )
+            rows = conn.execute(query, params).fetchall()
+        
+        # Roll the category x intensity counts up both ways in one pass
+        by_category: dict[str, int] = {}
+        by_intensity: dict[str, int] = {}
+        for category, intensity, count in rows:
+            by_category[category] = by_category.get(category, 0) + count
+            by_intensity[intensity] = by_intensity.get(intensity, 0) + count
+        
+        return PainPointStats(
+            total_pain_points=sum(by_category.values()),
+            by_category=dict(sorted(by_category.items(), key=lambda item: item[1], reverse=True)),
+            by_intensity=by_intensity,
+        )
 
 
-# Singleton instance
-_db: Optional[Database] = None
+@lru_cache(maxsize=None)
+def _database_for(db_path: str) -> Database:
+    """Get the shared Database for a path."""
+    return Database(db_path)
 
 
 def get_database(db_path: Optional[str] = None) -> Database:
-    """Get the database singleton."""
-    global _db
-    if _db is None:
+    """Get the shared Database for db_path, or for the configured path."""
+    if db_path is None:
         from src.config import get_config
-        path = db_path or get_config().config.database.path
-        _db = Database(path)
-    return _db
+        db_path = get_config().config.database.path
+    return _database_for(db_path)
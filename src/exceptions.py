@@ -39,9 +39,17 @@ class RateLimitError(ScraperError):
     - Too many requests in a short time period
     """
     
+    # BaseException always carries a __dict__, so this only moves retry_after
+    # into a faster slot; empty __slots__ elsewhere would save nothing
+    __slots__ = ("retry_after",)
+    
     def __init__(self, message: str = "Rate limit exceeded", retry_after: int | None = None):
         super().__init__(message)
         self.retry_after = retry_after
+    
+    def __reduce__(self):
+        # Slots aren't in the default exception pickle state
+        return (type(self), (*self.args, self.retry_after))
 
 
 class ScraperTimeoutError(ScraperError):
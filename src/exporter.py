@@ -1,14 +1,42 @@
 """Export functionality for pain points and reports."""
 
-import csv
-import json
-from collections import defaultdict
-from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
 from typing import Optional
 
 from src.database import get_database
-from src.models import PainPoint, Review
+from src.models import EmotionalIntensity
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON export
+    orjson = None
+
+
+# Exports are written through a large buffer so rows streamed from the
+# database reach the disk in few, big writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_CSV_HEADER = (
+    "category",
+    "verbatim_quote",
+    "emotional_intensity",
+    "implied_need",
+    "source",
+    "product_title",
+    "rating",
+    "review_date",
+)
+
+_MARKDOWN_HEADER = "# Pain Point Analysis Report\n\n*Generated: {generated}*\n\n"
+
+_INTENSITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+_INTENSITY_EMOJI_GET = _INTENSITY_EMOJI.get
+
+
+def _intensity_value(intensity: EmotionalIntensity | str) -> str:
+    """Get the plain string for an intensity that may or may not be an enum."""
+    return intensity.value if isinstance(intensity, EmotionalIntensity) else intensity
 
 
 class Exporter:
@@ -26,45 +54,39 @@ class Exporter:
         Export pain points to CSV.
         Returns count of exported pain points.
         """
-        pain_points_with_reviews = self.db.get_all_pain_points_with_reviews()
-        
-        if category:
-            pain_points_with_reviews = [
-                (pp, r) for pp, r in pain_points_with_reviews
-                if pp.category.lower() == category.lower()
-            ]
+        # Stream rows straight from the database into the CSV file
+        pain_points_with_reviews = self.db.iter_all_pain_points_with_reviews(category)
         
-        if not pain_points_with_reviews:
+        first = next(pain_points_with_reviews, None)
+        if first is None:
             return 0
         
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        import csv
+        
+        exported = 0
+        with open(
+            output_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
             writer = csv.writer(f)
-            writer.writerow([
-                "category",
-                "verbatim_quote",
-                "emotional_intensity",
-                "implied_need",
-                "source",
-                "product_title",
-                "rating",
-                "review_date",
-            ])
+            writer.writerow(_CSV_HEADER)
             
-            for pp, review in pain_points_with_reviews:
-                writer.writerow([
+            writerow = writer.writerow
+            for pp, review in chain((first,), pain_points_with_reviews):
+                writerow((
                     pp.category,
                     pp.verbatim_quote,
-                    pp.emotional_intensity.value if hasattr(pp.emotional_intensity, 'value') else pp.emotional_intensity,
+                    _intensity_value(pp.emotional_intensity),
                     pp.implied_need or "",
                     review.source,
                     review.product_title or "",
                     review.rating or "",
                     review.review_date or "",
-                ])
+                ))
+                exported += 1
         
-        return len(pain_points_with_reviews)
+        return exported
     
     def to_json(
         self,
@@ -75,39 +97,49 @@ class Exporter:
         Export pain points to JSON.
         Returns count of exported pain points.
         """
-        pain_points_with_reviews = self.db.get_all_pain_points_with_reviews()
-        
-        if category:
-            pain_points_with_reviews = [
-                (pp, r) for pp, r in pain_points_with_reviews
-                if pp.category.lower() == category.lower()
-            ]
+        pain_points_with_reviews = self.db.iter_all_pain_points_with_reviews(category)
         
-        if not pain_points_with_reviews:
+        first = next(pain_points_with_reviews, None)
+        if first is None:
             return 0
         
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        data = []
-        for pp, review in pain_points_with_reviews:
-            data.append({
-                "category": pp.category,
-                "verbatim_quote": pp.verbatim_quote,
-                "emotional_intensity": pp.emotional_intensity.value if hasattr(pp.emotional_intensity, 'value') else pp.emotional_intensity,
-                "implied_need": pp.implied_need,
-                "source": {
-                    "platform": review.source,
-                    "product_title": review.product_title,
-                    "rating": review.rating,
-                    "review_date": review.review_date,
-                    "author": review.author,
-                },
-            })
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        return len(data)
+        if orjson is not None:
+            def dumps(obj: dict) -> bytes:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        else:
+            import json
+            
+            def dumps(obj: dict) -> bytes:
+                return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        
+        # Write the array one object at a time, indenting each to sit inside
+        # the brackets; newlines within strings are escaped, so every literal
+        # newline in an object is a line break
+        exported = 0
+        with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            separator = b"[\n  "
+            for pp, review in chain((first,), pain_points_with_reviews):
+                f.write(separator)
+                f.write(dumps({
+                    "category": pp.category,
+                    "verbatim_quote": pp.verbatim_quote,
+                    "emotional_intensity": _intensity_value(pp.emotional_intensity),
+                    "implied_need": pp.implied_need,
+                    "source": {
+                        "platform": review.source,
+                        "product_title": review.product_title,
+                        "rating": review.rating,
+                        "review_date": review.review_date,
+                        "author": review.author,
+                    },
+                }).replace(b"\n", b"\n  "))
+                separator = b",\n  "
+                exported += 1
+            f.write(b"\n]")
+        
+        return exported
     
     def to_markdown(
         self,
@@ -119,89 +151,74 @@ class Exporter:
         Export pain points to Markdown report.
         Returns count of exported pain points.
         """
-        pain_points_with_reviews = self.db.get_all_pain_points_with_reviews()
+        from datetime import datetime
         
-        if category:
-            pain_points_with_reviews = [
-                (pp, r) for pp, r in pain_points_with_reviews
-                if pp.category.lower() == category.lower()
-            ]
-        
-        if not pain_points_with_reviews:
+        # Summary figures come from one GROUP BY query; only the detailed
+        # findings need the rows themselves
+        stats = self.db.get_pain_point_stats(category)
+        total = stats.total_pain_points
+        if not total:
             return 0
         
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Group by category
-        by_category: dict[str, list[tuple[PainPoint, Review]]] = defaultdict(list)
-        for pp, review in pain_points_with_reviews:
-            by_category[pp.category].append((pp, review))
-        
-        # Sort categories by count
-        sorted_categories = sorted(by_category.items(), key=lambda x: -len(x[1]))
+        category_counts = stats.by_category
+        intensity_counts = stats.by_intensity
         
-        # Count by intensity
-        intensity_counts: dict[str, int] = defaultdict(int)
-        for pp, _ in pain_points_with_reviews:
-            intensity = pp.emotional_intensity.value if hasattr(pp.emotional_intensity, 'value') else pp.emotional_intensity
-            intensity_counts[intensity] += 1
-        
-        # Build report
-        lines = []
-        lines.append("# Pain Point Analysis Report")
-        lines.append("")
-        lines.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
-        lines.append("")
-        
-        if include_summary:
-            lines.append("## Executive Summary")
-            lines.append("")
-            lines.append(f"- **Total Pain Points:** {len(pain_points_with_reviews)}")
-            lines.append(f"- **Categories Identified:** {len(by_category)}")
-            lines.append(f"- **High Intensity:** {intensity_counts.get('high', 0)}")
-            lines.append(f"- **Medium Intensity:** {intensity_counts.get('medium', 0)}")
-            lines.append(f"- **Low Intensity:** {intensity_counts.get('low', 0)}")
-            lines.append("")
-            
-            # Top 5 categories summary
-            lines.append("### Top Pain Point Categories")
-            lines.append("")
-            for cat, items in sorted_categories[:5]:
-                pct = (len(items) / len(pain_points_with_reviews)) * 100
-                lines.append(f"1. **{cat}** - {len(items)} instances ({pct:.1f}%)")
-            lines.append("")
-        
-        # Detailed breakdown by category
-        lines.append("---")
-        lines.append("")
-        lines.append("## Detailed Findings")
-        lines.append("")
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        for cat, items in sorted_categories:
-            lines.append(f"### {cat}")
-            lines.append("")
-            lines.append(f"*{len(items)} pain points identified*")
-            lines.append("")
+        with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            write(_MARKDOWN_HEADER.format(generated=datetime.now().strftime("%Y-%m-%d %H:%M")))
             
-            for pp, review in items:
-                intensity = pp.emotional_intensity.value if hasattr(pp.emotional_intensity, 'value') else pp.emotional_intensity
-                intensity_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(intensity, "⚪")
+            if include_summary:
+                write(
+                    "## Executive Summary\n"
+                    "\n"
+                    f"- **Total Pain Points:** {total}\n"
+                    f"- **Categories Identified:** {len(category_counts)}\n"
+                    f"- **High Intensity:** {intensity_counts.get('high', 0)}\n"
+                    f"- **Medium Intensity:** {intensity_counts.get('medium', 0)}\n"
+                    f"- **Low Intensity:** {intensity_counts.get('low', 0)}\n"
+                    "\n"
+                    "### Top Pain Point Categories\n"
+                    "\n"
+                )
                 
-                lines.append(f"> \"{pp.verbatim_quote}\"")
-                lines.append(">")
-                lines.append(f"> — *{review.source}*{f', {review.product_title}' if review.product_title else ''}{f', {review.rating}★' if review.rating else ''}")
-                lines.append("")
+                # Top 5 categories summary; ties are alphabetical, matching
+                # the order rows arrive in below
+                for cat, cat_count in islice(category_counts.items(), 5):
+                    pct = (cat_count / total) * 100
+                    write(f"1. **{cat}** - {cat_count} instances ({pct:.1f}%)\n")
+                write("\n")
+            
+            # Detailed breakdown by category, streamed largest category first.
+            # Blocks are separated by a leading blank line so the report ends
+            # without one after the last block.
+            write("---\n\n## Detailed Findings\n")
+            
+            current = None
+            for pp, review in self.db.iter_all_pain_points_with_reviews(
+                category, largest_category_first=True
+            ):
+                if pp.category != current:
+                    current = pp.category
+                    write(f"\n### {current}\n\n*{category_counts[current]} pain points identified*\n")
                 
-                if pp.implied_need:
-                    lines.append(f"**Implied Need:** {pp.implied_need}")
-                    lines.append("")
+                intensity = _intensity_value(pp.emotional_intensity)
+                intensity_emoji = _INTENSITY_EMOJI_GET(intensity, "⚪")
+                product = f", {review.product_title}" if review.product_title else ""
+                rating = f", {review.rating}★" if review.rating else ""
+                need = f"**Implied Need:** {pp.implied_need}\n\n" if pp.implied_need else ""
                 
-                lines.append(f"**Intensity:** {intensity_emoji} {intensity.capitalize()}")
-                lines.append("")
-                lines.append("---")
-                lines.append("")
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-        
-        return len(pain_points_with_reviews)
+                write(
+                    "\n"
+                    f"> \"{pp.verbatim_quote}\"\n"
+                    ">\n"
+                    f"> — *{review.source}*{product}{rating}\n"
+                    "\n"
+                    f"{need}"
+                    f"**Intensity:** {intensity_emoji} {intensity.capitalize()}\n"
+                    "\n"
+                    "---\n"
+                )
+        
+        return total
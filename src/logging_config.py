@@ -1,6 +1,7 @@
 """Logging configuration for Review Miner with Rich integration."""
 
 import logging
+import os
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -17,15 +18,97 @@ _loggers_configured = False
 FILE_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Log file written when no other is given
+DEFAULT_LOG_FILE = "logs/review_miner.log"
+
+# Plain console format used instead of Rich in fast mode
+FAST_FORMAT = "%(levelname)s %(name)s: %(message)s"
+
+# Set to 1 to log through a plain StreamHandler instead of Rich
+FAST_LOGGING_ENV = "REVIEWMINER_LOG_FAST"
+
+_CONSOLE_HANDLER_NAME = "console"
+
+# Loggers by the module name passed to get_logger, so repeat lookups skip
+# the name mapping
+_module_loggers: dict[str, logging.Logger] = {}
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once.
+    
+    DATE_FORMAT has second resolution, so every record logged within the
+    same second shares the same asctime string.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
+def _create_console_handler(
+    console: Optional[Console],
+    verbose: bool,
+    fast: bool,
+) -> logging.Handler:
+    """Create the console handler, plain in fast mode and Rich otherwise."""
+    if fast:
+        handler: logging.Handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter(FAST_FORMAT))
+    else:
+        if console is None:
+            console = Console(stderr=True)
+        
+        # Messages are plain text, so skip Rich's markup parsing on every call
+        handler = RichHandler(
+            console=console,
+            show_time=True,
+            show_path=False,
+            rich_tracebacks=True,
+            tracebacks_show_locals=verbose,
+            markup=False,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    handler.set_name(_CONSOLE_HANDLER_NAME)
+    return handler
+
+
+def _create_file_handler(log_file: str) -> logging.Handler:
+    """Create the rotating file handler, creating its directory if needed."""
+    log_path = Path(log_file)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    file_handler = RotatingFileHandler(
+        log_path,
+        maxBytes=5 * 1024 * 1024,  # 5 MB
+        backupCount=3,
+        encoding="utf-8",
+    )
+    file_handler.setLevel(logging.DEBUG)  # Always log everything to file
+    file_handler.setFormatter(_CachedTimeFormatter(FILE_FORMAT, DATE_FORMAT))
+    return file_handler
+
 
 def setup_logging(
     verbose: bool = False,
     quiet: bool = False,
-    log_file: Optional[str] = None,
+    log_file: Optional[str] = DEFAULT_LOG_FILE,
     console: Optional[Console] = None,
 ) -> logging.Logger:
     """Configure logging for the application.
     
+    Quiet runs, and any run with REVIEWMINER_LOG_FAST=1 set, log to the
+    console through a plain StreamHandler instead of Rich.
+    
     Args:
         verbose: Enable DEBUG level logging to console
         quiet: Suppress INFO level, show only WARNING and above
@@ -45,15 +128,23 @@ def setup_logging(
     else:
         console_level = logging.INFO
     
+    fast = quiet or os.getenv(FAST_LOGGING_ENV) == "1"
+    
     # Get or create the root logger for our app
     root_logger = logging.getLogger("review_miner")
     
     # Only configure once
     if _loggers_configured:
-        # Just update the level if already configured
-        for handler in root_logger.handlers:
-            if isinstance(handler, RichHandler):
-                handler.setLevel(console_level)
+        # Just update the console handler if already configured, switching
+        # it between Rich and plain output if the mode changed
+        for handler in list(root_logger.handlers):
+            if handler.get_name() != _CONSOLE_HANDLER_NAME:
+                continue
+            if isinstance(handler, RichHandler) == fast:
+                root_logger.removeHandler(handler)
+                handler = _create_console_handler(console, verbose, fast)
+                root_logger.addHandler(handler)
+            handler.setLevel(console_level)
         return root_logger
     
     root_logger.setLevel(logging.DEBUG)  # Capture all, filter at handler level
@@ -61,35 +152,13 @@ def setup_logging(
     # Clear any existing handlers
     root_logger.handlers.clear()
     
-    # Console handler with Rich
-    if console is None:
-        console = Console(stderr=True)
-    
-    rich_handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=False,
-        rich_tracebacks=True,
-        tracebacks_show_locals=verbose,
-        markup=True,
-    )
-    rich_handler.setLevel(console_level)
-    rich_handler.setFormatter(logging.Formatter("%(message)s"))
-    root_logger.addHandler(rich_handler)
+    # Console handler
+    console_handler = _create_console_handler(console, verbose, fast)
+    console_handler.setLevel(console_level)
+    root_logger.addHandler(console_handler)
     
     # File handler with rotation
-    log_path = Path(log_file) if log_file else Path("logs/review_miner.log")
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    file_handler = RotatingFileHandler(
-        log_path,
-        maxBytes=5 * 1024 * 1024,  # 5 MB
-        backupCount=3,
-        encoding="utf-8",
-    )
-    file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-    file_handler.setFormatter(logging.Formatter(FILE_FORMAT, DATE_FORMAT))
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(_create_file_handler(log_file or DEFAULT_LOG_FILE))
     
     # Prevent propagation to root logger
     root_logger.propagate = False
@@ -120,6 +189,10 @@ def get_logger(name: str) -> logging.Logger:
     if not _loggers_configured:
         setup_logging()
     
+    logger = _module_loggers.get(name)
+    if logger is not None:
+        return logger
+    
     # Create child logger under our namespace
     if name.startswith("src."):
         logger_name = f"review_miner.{name[4:]}"
@@ -128,7 +201,8 @@ def get_logger(name: str) -> logging.Logger:
     else:
         logger_name = f"review_miner.{name}"
     
-    return logging.getLogger(logger_name)
+    logger = _module_loggers[name] = logging.getLogger(logger_name)
+    return logger
 
 
 def reset_logging() -> None:
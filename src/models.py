@@ -1,10 +1,11 @@
-"""Pydantic data models for Review Miner."""
+"""Data models for Review Miner."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobStatus(str, Enum):
@@ -22,25 +23,89 @@ class EmotionalIntensity(str, Enum):
     HIGH = "high"
 
 
-class Review(BaseModel):
-    """A review scraped from a source."""
+@dataclass(slots=True, kw_only=True)
+class Review:
+    """
+    A review scraped from a source.
+    
+    A slotted dataclass rather than a pydantic model: reviews are built in
+    bulk from database rows, so only the rating range is checked here.
+    """
     id: Optional[int] = None
     source: str  # 'amazon', 'goodreads', 'reddit', etc.
     source_url: Optional[str] = None
     product_title: Optional[str] = None
     product_url: Optional[str] = None
     author: Optional[str] = None
-    rating: Optional[int] = Field(None, ge=1, le=5)  # 1-5 stars (NULL for Reddit)
+    rating: Optional[int] = None  # 1-5 stars (NULL for Reddit)
     review_text: str
     review_date: Optional[str] = None
     scraped_at: Optional[datetime] = None
     processed: bool = False
-
-    class Config:
-        from_attributes = True
-
-
-class PainPoint(BaseModel):
+    
+    def __post_init__(self):
+        if self.rating is not None:
+            self.rating = int(self.rating)
+            if not 1 <= self.rating <= 5:
+                raise ValueError(f"rating must be between 1 and 5, got {self.rating}")
+    
+    @classmethod
+    def from_row(cls, row: Sequence) -> "Review":
+        """Build a Review from stored column values in field order."""
+        (
+            id, source, source_url, product_title, product_url, author, rating,
+            review_text, review_date, scraped_at, processed,
+        ) = row
+        return cls(
+            id=id,
+            source=source,
+            source_url=source_url,
+            product_title=product_title,
+            product_url=product_url,
+            author=author,
+            rating=rating,
+            review_text=review_text,
+            review_date=review_date,
+            scraped_at=datetime.fromisoformat(scraped_at) if scraped_at else None,
+            processed=bool(processed),
+        )
+    
+    @classmethod
+    def from_checked(
+        cls,
+        source: str,
+        source_url: Optional[str],
+        product_title: Optional[str],
+        product_url: Optional[str],
+        author: Optional[str],
+        rating: Optional[int],
+        review_text: str,
+        review_date: Optional[str],
+    ) -> "Review":
+        """
+        Build a new, unsaved Review from fields the caller has already checked.
+        
+        Skips the generated __init__ and __post_init__, about three times
+        faster for bulk imports; rating must already be None or an int from 1
+        to 5.
+        """
+        review = cls.__new__(cls)
+        review.id = None
+        review.source = source
+        review.source_url = source_url
+        review.product_title = product_title
+        review.product_url = product_url
+        review.author = author
+        review.rating = rating
+        review.review_text = review_text
+        review.review_date = review_date
+        review.scraped_at = None
+        review.processed = False
+        return review
+
+
+@dataclass(slots=True, kw_only=True)
+class PainPoint:
     """An extracted pain point from a review."""
     id: Optional[int] = None
     review_id: int
@@ -49,9 +114,27 @@ class PainPoint(BaseModel):
     emotional_intensity: EmotionalIntensity = EmotionalIntensity.MEDIUM
     implied_need: Optional[str] = None  # What they actually wanted
     extracted_at: Optional[datetime] = None
-
-    class Config:
-        from_attributes = True
+    
+    def __post_init__(self):
+        if not isinstance(self.emotional_intensity, EmotionalIntensity):
+            self.emotional_intensity = EmotionalIntensity(self.emotional_intensity)
+    
+    @classmethod
+    def from_row(cls, row: Sequence) -> "PainPoint":
+        """Build a PainPoint from stored column values in field order."""
+        (
+            id, review_id, category, verbatim_quote, emotional_intensity,
+            implied_need, extracted_at,
+        ) = row
+        return cls(
+            id=id,
+            review_id=review_id,
+            category=category,
+            verbatim_quote=verbatim_quote,
+            emotional_intensity=emotional_intensity,
+            implied_need=implied_need,
+            extracted_at=datetime.fromisoformat(extracted_at) if extracted_at else None,
+        )
 
 
 class ScrapeJob(BaseModel):
@@ -64,9 +147,8 @@ class ScrapeJob(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
-
-    class Config:
-        from_attributes = True
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExtractedPainPoint(BaseModel):
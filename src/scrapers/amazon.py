@@ -1,27 +1,120 @@
 """Amazon scraper using Playwright with stealth capabilities."""
 
 import asyncio
+import json
 import random
 import re
-from typing import List, Optional
-from urllib.parse import urljoin
+import socket
+from collections import deque
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import httpx
+from bs4 import BeautifulSoup
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:  # Reported when the browser is first needed
+    PlaywrightTimeoutError = TimeoutError
 
 from src.config import get_config
 from src.exceptions import RateLimitError, ScraperError, ScraperTimeoutError
 from src.logging_config import get_logger
 from src.models import Review
 from src.scrapers.base import BaseScraper
+from src.scrapers.page_cache import PageCache
+from src.scrapers.rate_limit import RateLimiter
 
 
 logger = get_logger(__name__)
 
+# Seconds to wait before each retry of a timed-out page load
+_NAVIGATION_RETRY_WAITS = (5, 15)
+
+# Upper bound of the random pause added to each navigation, in seconds
+_NAVIGATION_JITTER = 1.0
+
+_ASIN_RE = re.compile(r"/(?:dp|gp/product|product)/([A-Z0-9]{10})")
+_REVIEW_DATE_RE = re.compile(r"on (.+)$")
+_RATING_RE = re.compile(r"(\d+\.?\d*)")
+
+# Amazon's filterByStar value for each star count, indexed by stars
+_STAR_FILTERS = ("", "one_star", "two_star", "three_star", "four_star", "five_star")
+
+# Resource types aborted by the context's route handler
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet", "other"})
+
+
+async def _block_heavy_resources(route) -> None:
+    """Abort requests for assets the scraper never reads."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _parse_review_cards(html: str, selectors: dict) -> Tuple[List[dict], bool, bool]:
+    """
+    Parse a review page's HTML the way _EXTRACT_REVIEW_CARDS_JS reads it.
+    
+    Returns the review cards, whether there is a next page and whether the
+    page is a CAPTCHA.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    if soup.select_one(selectors["captcha"]) is not None:
+        return [], False, True
+    
+    # innerText renders <br> as a line break
+    for br in soup.find_all("br"):
+        br.replace_with("\n")
+    
+    def text(card, selector: str) -> Optional[str]:
+        """Get the trimmed text of a card's element, None if missing."""
+        elem = card.select_one(selector)
+        return elem.get_text().strip() if elem is not None else None
+    
+    cards = [
+        {
+            "text": text(card, selectors["review_text"]),
+            "author": text(card, selectors["review_author"]),
+            "date": text(card, selectors["review_date"]),
+            "rating": text(card, selectors["review_rating"]),
+        }
+        for card in soup.select(selectors["review_cards"])
+    ]
+    has_next = soup.select_one(selectors["next_page"]) is not None
+    return cards, has_next, False
+
+
+# Runs in the page: reads the text of each review card's fields, trimmed,
+# with null for missing elements
+_EXTRACT_REVIEW_CARDS_JS = """
+(sel) => Array.from(document.querySelectorAll(sel.review_cards), (card) => {
+    const text = (selector) => {
+        const elem = card.querySelector(selector);
+        return elem ? elem.innerText.trim() : null;
+    };
+    return {
+        text: text(sel.review_text),
+        author: text(sel.review_author),
+        date: text(sel.review_date),
+        rating: text(sel.review_rating),
+    };
+})
+"""
+
+# Init script flagging a CAPTCHA page as it is parsed, so the check after each
+# navigation reads one property instead of running a selector query
+_CAPTCHA_OBSERVER_JS = """
+new MutationObserver((mutations, observer) => {
+    if (document.querySelector(%s)) {
+        window.__captcha = true;
+        observer.disconnect();
+    }
+}).observe(document, {childList: true, subtree: true});
+"""
+
 
 class AmazonScraper(BaseScraper):
     """Scrape book reviews from Amazon using Playwright."""
@@ -48,20 +141,32 @@ class AmazonScraper(BaseScraper):
     def __init__(self):
         self.config = get_config()
         scraping_config = self.config.config.scraping.amazon
-        self.delay_min = scraping_config.delay_min
-        self.delay_max = scraping_config.delay_max
         self.delay_between_products = scraping_config.delay_between_products
+        self.concurrent_pages = max(1, scraping_config.concurrent_pages)
         self.user_agents = scraping_config.user_agents or [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         ]
         self._browser = None
         self._context = None
+        # All pages share one request budget instead of each sleeping on its own
+        self._limiter = RateLimiter(scraping_config.requests_per_minute / 60)
+        self._cache = PageCache(scraping_config.cache_dir, scraping_config.cache_ttl_days * 86400)
+        self.storage_state_path = scraping_config.storage_state_path
+        # Titles already looked up by this scraper, by ASIN; unlike the page
+        # cache this also works with caching disabled or force_refresh set
+        self._title_cache: dict[str, str] = {}
+        # Review pages are fetched over plain HTTP until Amazon serves a CAPTCHA
+        self.http_fast_path = scraping_config.http_fast_path
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_blocked = False
+        self._request_timeout = self.config.config.scraping.request_timeout
+        # Picked once per session so the browser and HTTP client match
+        self._user_agent: Optional[str] = None
+        # Long-lived pages reused for every navigation, created with the context
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._context_lock = asyncio.Lock()
         logger.debug("Initialized AmazonScraper")
     
-    async def _get_delay(self) -> float:
-        """Get random delay between requests."""
-        return random.uniform(self.delay_min, self.delay_max)
-    
     async def _get_browser(self):
         """Get or create Playwright browser."""
         if self._browser is None:
@@ -73,60 +178,190 @@ class AmazonScraper(BaseScraper):
                     "Install with: pip install playwright && playwright install chromium"
                 )
             
+            args = [
+                "--disable-blink-features=AutomationControlled",
+                "--disable-dev-shm-usage",
+                "--no-sandbox",
+            ]
+            
+            # Resolve the site once and pin it for the life of the browser,
+            # so page loads don't each wait on DNS
+            host = urlparse(self.BASE_URL).hostname
+            try:
+                addrinfo = await asyncio.get_running_loop().getaddrinfo(
+                    host, 443, family=socket.AF_INET, type=socket.SOCK_STREAM
+                )
+                args.append(f"--host-resolver-rules=MAP {host} {addrinfo[0][4][0]}")
+            except (OSError, IndexError) as e:
+                logger.debug("Could not pre-resolve %s, using normal DNS: %s", host, e)
+            
             logger.debug("Launching browser")
             self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",
-                    "--no-sandbox",
-                ]
-            )
+            self._browser = await self._playwright.chromium.launch(headless=True, args=args)
         
         return self._browser
     
-    async def _get_context(self):
-        """Get or create browser context with stealth settings."""
-        if self._context is None:
-            browser = await self._get_browser()
+    def _get_user_agent(self) -> str:
+        """Get this session's user agent, picking one at random the first time."""
+        if self._user_agent is None:
+            self._user_agent = random.choice(self.user_agents)
+        return self._user_agent
+    
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client, carrying the browser session's cookies."""
+        if self._http is None:
+            if self._context is not None:
+                session_cookies = await self._context.cookies(self.BASE_URL)
+            else:
+                session_cookies = []
+                if self.storage_state_path and Path(self.storage_state_path).exists():
+                    try:
+                        state = json.loads(Path(self.storage_state_path).read_bytes())
+                        session_cookies = state.get("cookies", [])
+                    except (OSError, ValueError) as e:
+                        logger.debug("Failed to read session state: %s", e)
             
-            user_agent = random.choice(self.user_agents)
-            logger.debug("Using user agent: %s", user_agent[:50])
+            cookies = httpx.Cookies()
+            for cookie in session_cookies:
+                cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
             
-            self._context = await browser.new_context(
-                user_agent=user_agent,
-                viewport={"width": 1920, "height": 1080},
-                locale="en-US",
-                timezone_id="America/New_York",
-                extra_http_headers={
+            self._http = httpx.AsyncClient(
+                headers={
+                    "User-Agent": self._get_user_agent(),
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                     "Accept-Language": "en-US,en;q=0.9",
                 },
+                cookies=cookies,
+                timeout=self._request_timeout,
+                follow_redirects=True,
             )
-            
-            # Add stealth scripts
-            await self._context.add_init_script("""
-                // Overwrite the `navigator.webdriver` property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                
-                // Overwrite the `navigator.plugins` property
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                // Overwrite the `navigator.languages` property
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
-            """)
+        return self._http
+    
+    async def _fetch_review_page(self, url: str) -> Optional[Tuple[List[dict], bool]]:
+        """
+        Fetch and parse a review page over plain HTTP, without the browser.
+        
+        Returns the review cards and whether there is a next page, or None
+        when the browser should load the page instead: on a failed request,
+        a CAPTCHA or no review cards. After a CAPTCHA the fast path stays
+        off for the rest of the session.
+        """
+        if not self.http_fast_path or self._http_blocked:
+            return None
         
+        client = await self._get_http_client()
+        await self._limiter.acquire()
+        await asyncio.sleep(random.uniform(0, _NAVIGATION_JITTER))
+        logger.debug("Fetching: %s", url)
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug("HTTP fetch failed, falling back to the browser: %s", e)
+            return None
+        
+        review_cards, has_next, captcha = _parse_review_cards(response.text, self.SELECTORS)
+        if captcha:
+            logger.info("CAPTCHA on HTTP fetch, using the browser for the rest of the session")
+            self._http_blocked = True
+            return None
+        if not review_cards:
+            return None
+        return review_cards, has_next
+    
+    async def _get_context(self):
+        """Get or create browser context with stealth settings, and its page pool."""
+        async with self._context_lock:
+            if self._context is None:
+                await self._create_context()
         return self._context
     
-    async def _close(self):
-        """Close browser and playwright."""
+    async def _create_context(self):
+        """Create the browser context and open concurrent_pages pages in it."""
+        browser = await self._get_browser()
+        
+        user_agent = self._get_user_agent()
+        logger.debug("Using user agent: %s", user_agent[:50])
+        
+        # Resume the last run's cookies so Amazon skips its session bootstrap
+        storage_state = None
+        if self.storage_state_path and Path(self.storage_state_path).exists():
+            storage_state = self.storage_state_path
+            logger.debug("Reusing session state from %s", storage_state)
+        
+        self._context = await browser.new_context(
+            storage_state=storage_state,
+            user_agent=user_agent,
+            viewport={"width": 1920, "height": 1080},
+            locale="en-US",
+            timezone_id="America/New_York",
+            extra_http_headers={
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+        )
+        
+        # Add stealth scripts
+        await self._context.add_init_script("""
+            // Overwrite the `navigator.webdriver` property
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+            });
+            
+            // Overwrite the `navigator.plugins` property
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [1, 2, 3, 4, 5],
+            });
+            
+            // Overwrite the `navigator.languages` property
+            Object.defineProperty(navigator, 'languages', {
+                get: () => ['en-US', 'en'],
+            });
+        """)
+        await self._context.add_init_script(_CAPTCHA_OBSERVER_JS % json.dumps(self.SELECTORS["captcha"]))
+        
+        # Reviews are server-rendered text, so skip downloading assets
+        await self._context.route("**/*", _block_heavy_resources)
+        
+        # Pages are opened once and reused, just navigating to each new URL
+        self._page_pool = asyncio.Queue()
+        for _ in range(self.concurrent_pages):
+            self._page_pool.put_nowait(await self._context.new_page())
+    
+    async def _acquire_page(self):
+        """Take a page from the pool, waiting for one if all are in use."""
+        await self._get_context()
+        return await self._page_pool.get()
+    
+    def _release_page(self, page) -> None:
+        """Return a page to the pool for the next navigation."""
+        # After close the pool is gone and the page closed with its context
+        if self._page_pool is not None:
+            self._page_pool.put_nowait(page)
+    
+    async def close(self):
+        """
+        Save the session state, then close the browser, playwright and HTTP client.
+        
+        scrape_from_search closes when it's done; after scrape_reviews, call
+        this before the event loop ends. A later scrape opens them again.
+        """
+        # Pooled pages are closed along with their context
+        self._page_pool = None
+        # Fresh locks, as asyncio locks bind to the loop that first waits on them
+        self._context_lock = asyncio.Lock()
+        self._limiter = RateLimiter(self._limiter.rate)
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._http_blocked = False
+        self._user_agent = None
         if self._context:
+            if self.storage_state_path:
+                try:
+                    Path(self.storage_state_path).parent.mkdir(parents=True, exist_ok=True)
+                    await self._context.storage_state(path=self.storage_state_path)
+                except Exception as e:
+                    logger.debug("Failed to save session state: %s", e)
             await self._context.close()
             self._context = None
         if self._browser:
@@ -139,43 +374,64 @@ class AmazonScraper(BaseScraper):
     
     async def _check_for_captcha(self, page) -> bool:
         """Check if we've hit a CAPTCHA page."""
-        captcha = await page.query_selector(self.SELECTORS["captcha"])
-        if captcha:
+        if await page.evaluate("window.__captcha === true"):
             logger.warning("CAPTCHA detected")
             return True
         return False
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=5, max=30),
-        retry=retry_if_exception_type((TimeoutError,)),
-        reraise=True,
-    )
-    async def _navigate_with_retry(self, page, url: str):
-        """Navigate to a page with retry logic."""
-        logger.debug("Navigating to: %s", url)
-        try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+    async def _navigate_with_retry(self, page, url: str, wait_selector: Optional[str] = None):
+        """
+        Navigate to a page, retrying timeouts with increasing waits.
+        
+        With wait_selector, returns as soon as a matching element is in the
+        DOM rather than once the whole document is parsed. Only pass it where
+        a single element is read; lists could still be partly parsed.
+        """
+        for attempt, retry_wait in enumerate((*_NAVIGATION_RETRY_WAITS, None), 1):
+            await self._limiter.acquire()
+            await asyncio.sleep(random.uniform(0, _NAVIGATION_JITTER))
+            logger.debug("Navigating to: %s", url)
+            try:
+                if wait_selector is None:
+                    # Reviews are in the initial HTML; networkidle would also wait
+                    # out the blocked asset requests
+                    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                else:
+                    await page.goto(url, wait_until="commit", timeout=30000)
+                    await self._wait_for_element(page, wait_selector)
+            except (TimeoutError, PlaywrightTimeoutError) as e:
+                if retry_wait is None:
+                    logger.warning("Page load timeout: %s", url)
+                    raise ScraperTimeoutError(f"Timeout loading {url}") from e
+                logger.debug("Timeout loading %s (attempt %d), retrying in %ds", url, attempt, retry_wait)
+                await asyncio.sleep(retry_wait)
+                continue
             
             # Check for CAPTCHA
             if await self._check_for_captcha(page):
                 raise RateLimitError("CAPTCHA detected - rate limited by Amazon")
-            
-        except TimeoutError as e:
-            logger.warning("Page load timeout: %s", url)
-            raise ScraperTimeoutError(f"Timeout loading {url}") from e
+            return
+    
+    async def _wait_for_element(self, page, selector: str) -> None:
+        """Wait for selector (or a CAPTCHA) to attach, else for the document to parse."""
+        try:
+            await page.wait_for_selector(
+                f"{selector}, {self.SELECTORS['captcha']}", state="attached", timeout=15000,
+            )
+        except (TimeoutError, PlaywrightTimeoutError):
+            # The element isn't on this page; let the caller see the full page
+            await page.wait_for_load_state("domcontentloaded", timeout=30000)
     
     async def search(self, query: str, max_results: int = 50) -> List[str]:
         """Search for books on Amazon."""
         search_url = f"{self.BASE_URL}/s?k={query.replace(' ', '+')}&i=stripbooks"
         logger.info("Searching Amazon for: %s", query)
         
+        page = None
         try:
-            context = await self._get_context()
-            page = await context.new_page()
+            page = await self._acquire_page()
             
             await self._navigate_with_retry(page, search_url)
-            await asyncio.sleep(await self._get_delay())
             
             # Extract product URLs
             product_urls = []
@@ -191,7 +447,6 @@ class AmazonScraper(BaseScraper):
                         if "/dp/" in full_url:
                             product_urls.append(full_url.split("?")[0])
             
-            await page.close()
             logger.info("Found %d products", len(product_urls))
             return product_urls
             
@@ -200,6 +455,9 @@ class AmazonScraper(BaseScraper):
         except Exception as e:
             logger.error("Search failed: %s", e)
             return []
+        finally:
+            if page is not None:
+                self._release_page(page)
     
     async def scrape_reviews(
         self,
@@ -207,9 +465,16 @@ class AmazonScraper(BaseScraper):
         max_reviews: int = 100,
         min_rating: int = 1,
         max_rating: int = 3,
+        force_refresh: bool = False,
     ) -> List[Review]:
-        """Scrape reviews from an Amazon product page."""
-        reviews = []
+        """
+        Scrape reviews from an Amazon product page.
+        
+        Each star rating is scraped concurrently in its own page, with
+        max_reviews split evenly between them; results are returned lowest
+        rating first. Product titles and review pages are served from the
+        page cache when fresh entries exist, unless force_refresh is set.
+        """
         logger.info("Scraping reviews from: %s", url)
         
         # Convert product URL to reviews URL
@@ -218,72 +483,136 @@ class AmazonScraper(BaseScraper):
             logger.error("Could not extract ASIN from URL: %s", url)
             return []
         
+        star_ratings = range(min_rating, max_rating + 1)
+        if not star_ratings or max_reviews <= 0:
+            return []
+        
+        reviews: List[Review] = []
         try:
-            context = await self._get_context()
-            page = await context.new_page()
-            
             # Get product title first
             product_url = f"{self.BASE_URL}/dp/{asin}"
-            await self._navigate_with_retry(page, product_url)
-            await asyncio.sleep(await self._get_delay())
-            
-            title_elem = await page.query_selector(self.SELECTORS["product_title"])
-            product_title = await title_elem.inner_text() if title_elem else "Unknown Product"
-            product_title = product_title.strip()
+            title_key = f"{asin}:title"
+            product_title = self._title_cache.get(asin)
+            if product_title is None and not force_refresh:
+                product_title = self._cache.get(title_key)
+            if product_title is None:
+                page = await self._acquire_page()
+                try:
+                    await self._navigate_with_retry(page, product_url, self.SELECTORS["product_title"])
+                    title_elem = await page.query_selector(self.SELECTORS["product_title"])
+                    if title_elem:
+                        product_title = (await title_elem.inner_text()).strip()
+                        self._cache.set(title_key, product_title)
+                    else:
+                        product_title = "Unknown Product"
+                finally:
+                    self._release_page(page)
+            if product_title != "Unknown Product":
+                self._title_cache[asin] = product_title
             logger.debug("Product title: %s", product_title)
             
-            # Scrape reviews filtered by star rating
-            for star_rating in range(min_rating, max_rating + 1):
-                if len(reviews) >= max_reviews:
-                    break
-                
-                reviews_url = f"{self.BASE_URL}/product-reviews/{asin}?filterByStar={self._star_filter(star_rating)}&reviewerType=all_reviews"
-                logger.debug("Scraping %d-star reviews", star_rating)
+            # Scrape reviews filtered by star rating, each star in parallel
+            # with an even share of max_reviews (rounded up)
+            quota = -(-max_reviews // len(star_ratings))
+            tasks = [
+                asyncio.create_task(self._scrape_star(
+                    asin, star_rating, quota, product_title, product_url, force_refresh,
+                ))
+                for star_rating in star_ratings
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+            
+            reviews = [review for star_reviews in results for review in star_reviews][:max_reviews]
+            
+        except ScraperError:
+            raise
+        except Exception as e:
+            logger.error("Scraping failed: %s", e, exc_info=True)
+        
+        logger.info("Scraped %d reviews total", len(reviews))
+        return reviews
+    
+    async def _scrape_star(
+        self,
+        asin: str,
+        star_rating: int,
+        max_reviews: int,
+        product_title: str,
+        product_url: str,
+        force_refresh: bool,
+    ) -> List[Review]:
+        """Scrape up to max_reviews reviews with one star rating, in a page of its own."""
+        reviews: List[Review] = []
+        reviews_url = f"{self.BASE_URL}/product-reviews/{asin}?filterByStar={self._star_filter(star_rating)}&reviewerType=all_reviews"
+        logger.debug("Scraping %d-star reviews", star_rating)
+        
+        page = None
+        try:
+            page_num = 1
+            while len(reviews) < max_reviews:
+                page_key = f"{asin}:{star_rating}:{page_num}"
+                cached = None if force_refresh else self._cache.get(page_key)
                 
-                page_num = 1
-                while len(reviews) < max_reviews:
+                if cached is not None:
+                    review_cards, has_next = cached["cards"], cached["has_next"]
+                    logger.debug("Page %d served from cache", page_num)
+                else:
                     paginated_url = f"{reviews_url}&pageNumber={page_num}"
                     
-                    try:
-                        await self._navigate_with_retry(page, paginated_url)
-                        await asyncio.sleep(await self._get_delay())
-                    except ScraperError as e:
-                        logger.warning("Failed to load page %d: %s", page_num, e)
-                        break
-                    
-                    # Extract reviews from page
-                    review_cards = await page.query_selector_all(self.SELECTORS["review_cards"])
-                    
-                    if not review_cards:
-                        logger.debug("No more reviews on page %d", page_num)
-                        break
-                    
-                    for card in review_cards:
-                        if len(reviews) >= max_reviews:
+                    fetched = await self._fetch_review_page(paginated_url)
+                    if fetched is not None:
+                        review_cards, has_next = fetched
+                    else:
+                        try:
+                            if page is None:
+                                page = await self._acquire_page()
+                            await self._navigate_with_retry(page, paginated_url)
+                        except ScraperError as e:
+                            logger.warning("Failed to load page %d: %s", page_num, e)
                             break
                         
-                        review = await self._extract_review(card, product_title, product_url, star_rating)
-                        if review:
-                            reviews.append(review)
-                    
-                    logger.debug("Page %d: extracted %d reviews", page_num, len(review_cards))
+                        # Extract every review card's fields in one round-trip
+                        review_cards = await page.evaluate(_EXTRACT_REVIEW_CARDS_JS, self.SELECTORS)
+                        has_next = await page.query_selector(self.SELECTORS["next_page"]) is not None
                     
-                    # Check for next page
-                    next_btn = await page.query_selector(self.SELECTORS["next_page"])
-                    if not next_btn:
+                    # Empty pages aren't cached so a bad load is retried next run
+                    if review_cards:
+                        self._cache.set(page_key, {"cards": review_cards, "has_next": has_next})
+                
+                if not review_cards:
+                    logger.debug("No more reviews on page %d", page_num)
+                    break
+                
+                for card in review_cards:
+                    if len(reviews) >= max_reviews:
                         break
                     
-                    page_num += 1
-                    await asyncio.sleep(await self._get_delay())
-            
-            await page.close()
-            
+                    review = self._extract_review(card, product_title, product_url, star_rating)
+                    if review:
+                        reviews.append(review)
+                
+                logger.debug("Page %d: extracted %d reviews", page_num, len(review_cards))
+                
+                # Check for next page
+                if not has_next:
+                    break
+                
+                page_num += 1
+        
         except ScraperError:
             raise
         except Exception as e:
-            logger.error("Scraping failed: %s", e, exc_info=True)
+            # Keep what this star produced; the other stars carry on
+            logger.error("Scraping %d-star reviews failed: %s", star_rating, e, exc_info=True)
+        finally:
+            if page is not None:
+                self._release_page(page)
         
-        logger.info("Scraped %d reviews total", len(reviews))
         return reviews
     
     def search_and_scrape(
@@ -291,13 +620,14 @@ class AmazonScraper(BaseScraper):
         query: str,
         max_products: int = 10,
         max_reviews_per_product: int = 50,
+        force_refresh: bool = False,
     ) -> List[Review]:
         """Search for books by topic and scrape reviews. Synchronous wrapper."""
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             return loop.run_until_complete(
-                self.scrape_from_search(query, max_products, max_reviews_per_product)
+                self.scrape_from_search(query, max_products, max_reviews_per_product, force_refresh)
             )
         finally:
             loop.close()
@@ -307,101 +637,89 @@ class AmazonScraper(BaseScraper):
         query: str,
         max_products: int = 10,
         max_reviews_per_product: int = 50,
+        force_refresh: bool = False,
     ) -> List[Review]:
         """Search then scrape reviews from products."""
         logger.info("Starting search and scrape for: %s", query)
         try:
             urls = await self.search(query, max_products)
-            all_reviews = []
             
-            for i, url in enumerate(urls, 1):
-                logger.info("Scraping product %d/%d", i, len(urls))
-                reviews = await self.scrape_reviews(url, max_reviews_per_product)
-                all_reviews.extend(reviews)
-                
-                # Longer delay between products
-                if i < len(urls):
-                    logger.debug("Waiting %d seconds before next product", self.delay_between_products)
-                    await asyncio.sleep(self.delay_between_products)
+            # Each worker scrapes products one at a time, keeping the delays
+            # between its own products, so up to concurrent_pages products
+            # load in parallel from the shared page pool
+            workers = min(self.concurrent_pages, len(urls))
+            
+            pending = deque(enumerate(urls))
+            results: List[List[Review]] = [[] for _ in urls]
+            
+            async def worker() -> None:
+                while pending:
+                    i, url = pending.popleft()
+                    logger.info("Scraping product %d/%d", i + 1, len(urls))
+                    results[i] = await self.scrape_reviews(url, max_reviews_per_product, force_refresh=force_refresh)
+                    
+                    # Longer delay between products
+                    if pending:
+                        logger.debug("Waiting %d seconds before next product", self.delay_between_products)
+                        await asyncio.sleep(self.delay_between_products)
+            
+            tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop the other workers before the browser is closed under them
+                for task in tasks:
+                    task.cancel()
+                raise
             
+            # Keep reviews in search result order
+            all_reviews = [review for reviews in results for review in reviews]
             logger.info("Total reviews scraped: %d", len(all_reviews))
             return all_reviews
         finally:
-            await self._close()
+            await self.close()
     
     def _extract_asin(self, url: str) -> Optional[str]:
         """Extract ASIN from Amazon URL."""
-        # Try /dp/ASIN format
-        match = re.search(r"/dp/([A-Z0-9]{10})", url)
-        if match:
-            return match.group(1)
-        
-        # Try /product/ASIN format
-        match = re.search(r"/product/([A-Z0-9]{10})", url)
-        if match:
-            return match.group(1)
-        
-        # Try /gp/product/ASIN format
-        match = re.search(r"/gp/product/([A-Z0-9]{10})", url)
-        if match:
-            return match.group(1)
-        
-        return None
+        # Matches /dp/ASIN, /product/ASIN and /gp/product/ASIN in one scan
+        match = _ASIN_RE.search(url)
+        return match.group(1) if match else None
     
     def _star_filter(self, stars: int) -> str:
         """Convert star count to Amazon filter value."""
-        mapping = {
-            1: "one_star",
-            2: "two_star",
-            3: "three_star",
-            4: "four_star",
-            5: "five_star",
-        }
-        return mapping.get(stars, "three_star")
+        return _STAR_FILTERS[stars] if 1 <= stars <= 5 else "three_star"
     
-    async def _extract_review(
+    def _extract_review(
         self,
-        card,
+        card: dict,
         product_title: str,
         product_url: str,
         expected_rating: int,
     ) -> Optional[Review]:
-        """Extract review data from a review card element."""
+        """Build a Review from the fields extracted from a review card."""
         try:
             # Get review text
-            text_elem = await card.query_selector(self.SELECTORS["review_text"])
-            if not text_elem:
-                return None
-            
-            review_text = await text_elem.inner_text()
-            review_text = review_text.strip()
-            
-            if len(review_text) < 50:
+            review_text = card.get("text")
+            if not review_text or len(review_text) < 50:
                 return None
             
             # Get author
-            author = None
-            author_elem = await card.query_selector(self.SELECTORS["review_author"])
-            if author_elem:
-                author = await author_elem.inner_text()
-                author = author.strip()
+            author = card.get("author")
             
             # Get date
             review_date = None
-            date_elem = await card.query_selector(self.SELECTORS["review_date"])
-            if date_elem:
-                date_text = await date_elem.inner_text()
+            date_text = card.get("date")
+            if date_text:
                 # Extract date from "Reviewed in the United States on January 1, 2024"
-                match = re.search(r"on (.+)$", date_text)
+                match = _REVIEW_DATE_RE.search(date_text)
                 if match:
                     review_date = match.group(1).strip()
             
             # Get rating (verify it matches expected)
             rating = expected_rating
-            rating_elem = await card.query_selector(self.SELECTORS["review_rating"])
-            if rating_elem:
-                rating_text = await rating_elem.inner_text()
-                match = re.search(r"(\d+\.?\d*)", rating_text)
+            rating_text = card.get("rating")
+            if rating_text:
+                match = _RATING_RE.search(rating_text)
                 if match:
                     rating = int(float(match.group(1)))
             
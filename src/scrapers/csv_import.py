@@ -1,18 +1,62 @@
 """CSV import functionality for manual review data entry."""
 
 import csv
+import io
 import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from src.models import Review
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON import
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: streaming import of large JSON files
+    ijson = None
+
+# Ratings as they usually appear in a file, looked up before parsing with int()
+_VALID_RATINGS = {str(rating): rating for rating in range(1, 6)}
+
+# CSV columns read into a review, in the order the row readers give them
+_CSV_FIELDS = (
+    "review_text",
+    "source",
+    "source_url",
+    "product_title",
+    "product_url",
+    "author",
+    "rating",
+    "review_date",
+)
+
+# CSV files from this size up are parsed with pandas, whose C parser makes
+# up for the time it takes to import
+_PANDAS_MIN_BYTES = 64 * 1024 * 1024
+
+# Rows pandas parses at a time, bounding memory on large files
+_PANDAS_CHUNK_ROWS = 50_000
+
+# JSON files from this size up are parsed incrementally with ijson, when
+# installed, rather than held in memory whole
+_STREAM_JSON_MIN_BYTES = 64 * 1024 * 1024
+
 
 class CSVImporter:
-    """Import reviews from CSV or JSON files."""
+    """Import reviews from CSV, JSON or JSON Lines files."""
     
     source_name: str = "csv_import"
     
+    # File extensions import_file understands
+    SUPPORTED_SUFFIXES = (".csv", ".json", ".jsonl")
+    
     # Expected CSV columns
     REQUIRED_COLUMNS = {"review_text"}
     OPTIONAL_COLUMNS = {
@@ -32,52 +76,52 @@ class CSVImporter:
         Expected CSV format:
         source,product_title,rating,review_text,review_date
         
-        Only review_text is required. Other columns are optional.
+        Only review_text is required. Other columns are optional; empty
+        values import as None.
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"CSV file not found: {file_path}")
-        
-        reviews = []
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            
-            # Validate columns
-            if reader.fieldnames is None:
-                raise ValueError("CSV file is empty or has no headers")
+        return list(self.iter_csv(file_path, default_source))
+    
+    def iter_csv(self, file_path: str, default_source: str = "manual") -> Iterator[Review]:
+        """Yield reviews from a CSV file one row at a time. See import_csv."""
+        return self._reviews_from_csv_rows(_csv_file_rows(file_path), default_source)
+    
+    def import_csv_string(self, text: str, default_source: str = "manual") -> List[Review]:
+        """Import reviews from CSV text in memory, in the format import_csv reads."""
+        return list(self._reviews_from_csv_rows(_csv_stream_rows(io.StringIO(text)), default_source))
+    
+    def _reviews_from_csv_rows(self, rows: Iterator[tuple], default_source: str) -> Iterator[Review]:
+        """Build reviews from the _CSV_FIELDS values of CSV rows, skipping rows without text."""
+        # Rows repeating a source or product title share one string for it
+        shared: Dict[str, str] = {}
+        for review_text, source, source_url, product_title, product_url, author, rating_text, review_date in rows:
+            review_text = (review_text or "").strip()
+            if not review_text:
+                continue  # Skip empty reviews
             
-            columns = set(reader.fieldnames)
-            if "review_text" not in columns:
-                raise ValueError("CSV must contain 'review_text' column")
+            # Parse rating if present
+            rating = _VALID_RATINGS.get(rating_text)
+            if rating is None and rating_text:
+                try:
+                    rating = int(rating_text)
+                    if not 1 <= rating <= 5:
+                        rating = None
+                except ValueError:
+                    pass
             
-            for row in reader:
-                review_text = row.get("review_text", "").strip()
-                if not review_text:
-                    continue  # Skip empty reviews
-                
-                # Parse rating if present
-                rating = None
-                if row.get("rating"):
-                    try:
-                        rating = int(row["rating"])
-                        if not 1 <= rating <= 5:
-                            rating = None
-                    except ValueError:
-                        pass
-                
-                review = Review(
-                    source=row.get("source", default_source) or default_source,
-                    source_url=row.get("source_url"),
-                    product_title=row.get("product_title"),
-                    product_url=row.get("product_url"),
-                    author=row.get("author"),
-                    rating=rating,
-                    review_text=review_text,
-                    review_date=row.get("review_date"),
-                )
-                reviews.append(review)
-        
-        return reviews
+            # Empty and missing optional values both become None: pandas
+            # can't tell a short row's missing cells from empty ones, and
+            # files must import the same whichever parser reads them. The
+            # rating is already checked, so the review skips validation
+            yield Review.from_checked(
+                shared.setdefault(source, source) if source else default_source,
+                source_url or None,
+                shared.setdefault(product_title, product_title) if product_title else None,
+                product_url or None,
+                author or None,
+                rating,
+                review_text,
+                review_date or None,
+            )
     
     def import_json(self, file_path: str, default_source: str = "manual") -> List[Review]:
         """
@@ -94,60 +138,325 @@ class CSVImporter:
             }
         ]
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"JSON file not found: {file_path}")
+        return list(self.iter_json(file_path, default_source))
+    
+    def iter_json(self, file_path: str, default_source: str = "manual") -> Iterator[Review]:
+        """
+        Yield reviews from a JSON file. See import_json.
+        
+        The array is parsed in one go, unless the file is large and ijson is
+        installed to parse it item by item; reviews are built as they are
+        consumed. JSON Lines always streams.
+        """
+        shared: Dict[str, str] = {}
+        for item in _json_file_items(file_path):
+            review = self._review_from_item(item, default_source, shared)
+            if review:
+                yield review
+    
+    def import_json_string(self, text: str, default_source: str = "manual") -> List[Review]:
+        """Import reviews from JSON text in memory, in the format import_json reads."""
+        items = orjson.loads(text) if orjson is not None else json.loads(text)
+        if not isinstance(items, list):
+            raise ValueError("JSON text must contain an array of review objects")
         
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        shared: Dict[str, str] = {}
+        reviews = (self._review_from_item(item, default_source, shared) for item in items)
+        return [review for review in reviews if review]
+    
+    def import_jsonl(self, file_path: str, default_source: str = "manual") -> List[Review]:
+        """
+        Import reviews from a JSON Lines file.
         
-        if not isinstance(data, list):
-            raise ValueError("JSON file must contain an array of review objects")
+        Each non-blank line holds one review object, in the same format as
+        the objects in import_json.
+        """
+        return list(self.iter_jsonl(file_path, default_source))
+    
+    def iter_jsonl(self, file_path: str, default_source: str = "manual") -> Iterator[Review]:
+        """Yield reviews from a JSON Lines file one line at a time. See import_jsonl."""
+        shared: Dict[str, str] = {}
+        for item in _jsonl_file_items(file_path):
+            review = self._review_from_item(item, default_source, shared)
+            if review:
+                yield review
+    
+    def _review_from_item(
+        self,
+        item: dict,
+        default_source: str,
+        shared: Dict[str, str],
+    ) -> Optional[Review]:
+        """
+        Build a Review from a parsed JSON object, or None if it has no text.
         
-        reviews = []
-        for item in data:
-            review_text = item.get("review_text", "").strip()
-            if not review_text:
-                continue
-            
-            # Parse rating if present
-            rating = item.get("rating")
-            if rating is not None:
-                try:
-                    rating = int(rating)
-                    if not 1 <= rating <= 5:
-                        rating = None
-                except (ValueError, TypeError):
+        Sources and product titles are deduplicated through shared, so every
+        review of a file with the same one holds the same string.
+        """
+        review_text = (_json_text(item, "review_text") or "").strip()
+        if not review_text:
+            return None
+        
+        # Parse rating if present
+        rating = item.get("rating")
+        if rating is not None:
+            try:
+                rating = int(rating)
+                if not 1 <= rating <= 5:
                     rating = None
-            
-            review = Review(
-                source=item.get("source", default_source) or default_source,
-                source_url=item.get("source_url"),
-                product_title=item.get("product_title"),
-                product_url=item.get("product_url"),
-                author=item.get("author"),
-                rating=rating,
-                review_text=review_text,
-                review_date=item.get("review_date"),
-            )
-            reviews.append(review)
+            except (ValueError, TypeError):
+                rating = None
         
-        return reviews
+        source = _json_text(item, "source") or default_source
+        product_title = _json_text(item, "product_title")
+        return Review.from_checked(
+            shared.setdefault(source, source),
+            _json_text(item, "source_url"),
+            shared.setdefault(product_title, product_title),
+            _json_text(item, "product_url"),
+            _json_text(item, "author"),
+            rating,
+            review_text,
+            _json_text(item, "review_date"),
+        )
     
     def import_file(self, file_path: str, default_source: str = "manual") -> List[Review]:
         """Import reviews from a file, auto-detecting format by extension."""
+        return list(self.iter_file(file_path, default_source))
+    
+    def import_files(
+        self,
+        file_paths: List[str],
+        default_source: str = "manual",
+        max_workers: Optional[int] = None,
+    ) -> List[Review]:
+        """
+        Import reviews from several files, parsing them in parallel processes.
+        
+        Reviews are returned in file order. A single file is parsed in this
+        process, skipping the cost of starting a pool.
+        """
+        if len(file_paths) <= 1:
+            return [review for file_path in file_paths for review in self.import_file(file_path, default_source)]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # A few files per task once there are many, to cut round trips
+            # to the workers while still spreading the files out evenly
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            batches = executor.map(
+                _import_file, file_paths, [default_source] * len(file_paths), chunksize=chunksize,
+            )
+            return [review for batch in batches for review in batch]
+    
+    def count_valid(self, file_path: str) -> int:
+        """
+        Count the reviews import_file would return for a file, without
+        building them.
+        """
+        suffix = Path(file_path).suffix.lower()
+        
+        if suffix == ".csv":
+            texts = (row[0] for row in _csv_file_rows(file_path))
+        elif suffix == ".json":
+            texts = (item.get("review_text", "") for item in _json_file_items(file_path))
+        elif suffix == ".jsonl":
+            texts = (item.get("review_text", "") for item in _jsonl_file_items(file_path))
+        else:
+            raise ValueError(f"Unsupported file format: {suffix}. Use .csv, .json or .jsonl")
+        
+        return sum(1 for text in texts if text and text.strip())
+    
+    def iter_file(self, file_path: str, default_source: str = "manual") -> Iterator[Review]:
+        """Yield reviews from a file, auto-detecting format by extension."""
         path = Path(file_path)
         suffix = path.suffix.lower()
         
         if suffix == ".csv":
-            return self.import_csv(file_path, default_source)
+            return self.iter_csv(file_path, default_source)
         elif suffix == ".json":
-            return self.import_json(file_path, default_source)
+            return self.iter_json(file_path, default_source)
+        elif suffix == ".jsonl":
+            return self.iter_jsonl(file_path, default_source)
         else:
-            raise ValueError(f"Unsupported file format: {suffix}. Use .csv or .json")
+            raise ValueError(f"Unsupported file format: {suffix}. Use .csv, .json or .jsonl")
+
+
+def _json_text(item: dict, field: str) -> Optional[str]:
+    """
+    Get a text field of a JSON review object, or None if it is absent or null.
+    
+    Numbers and booleans are converted to strings; arrays and objects raise
+    ValueError, since from_checked() trusts its arguments to be strings.
+    """
+    value = item.get(field)
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        raise ValueError(f"Field '{field}' must be a string, got {type(value).__name__}")
+    return str(value)
+
+
+def _csv_file_rows(file_path: str) -> Iterator[tuple]:
+    """Yield the _CSV_FIELDS values of each row of a CSV file, with the parser suiting its size."""
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+    
+    if path.stat().st_size >= _PANDAS_MIN_BYTES:
+        yield from _csv_rows_pandas(path)
+    else:
+        yield from _csv_rows(path)
+
+
+def _json_file_items(file_path: str) -> Iterator:
+    """Yield the items of a JSON array file, streamed when it is large and ijson is installed."""
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"JSON file not found: {file_path}")
+    
+    if ijson is not None and path.stat().st_size >= _STREAM_JSON_MIN_BYTES:
+        yield from _stream_json_items(path)
+        return
+    
+    items = _load_json(path)
+    if not isinstance(items, list):
+        raise ValueError("JSON file must contain an array of review objects")
+    yield from items
+
+
+def _jsonl_file_items(file_path: str) -> Iterator[dict]:
+    """Yield the object on each non-blank line of a JSON Lines file."""
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"JSON Lines file not found: {file_path}")
+    
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            
+            item = loads(line)
+            if not isinstance(item, dict):
+                raise ValueError(f"Line {line_num} must contain a review object")
+            yield item
+
+
+def _csv_positions(header: Optional[List[str]]) -> List[Optional[int]]:
+    """Get the column position of each of _CSV_FIELDS in a CSV header, None if absent."""
+    if header is None:
+        raise ValueError("CSV file is empty or has no headers")
+    
+    # A repeated name keeps its last column, as DictReader would
+    columns = {name: i for i, name in enumerate(header)}
+    if "review_text" not in columns:
+        raise ValueError("CSV must contain 'review_text' column")
+    return [columns.get(name) for name in _CSV_FIELDS]
+
+
+def _csv_rows(path: Path) -> Iterator[tuple]:
+    """Yield the _CSV_FIELDS values of each CSV row, parsed with the csv module."""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from _csv_stream_rows(f)
+
+
+def _csv_stream_rows(f) -> Iterator[tuple]:
+    """Yield the _CSV_FIELDS values of each row of a CSV text stream."""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    positions = _csv_positions(header)
+    
+    # Absent columns read the None appended past the header's width
+    width = len(header)
+    get_fields = itemgetter(*(width if col is None else col for col in positions))
+    padding = [None] * width
+    
+    for row in reader:
+        # Short rows have no value for their missing columns
+        if len(row) != width:
+            row = (row + padding)[:width]
+        row.append(None)
+        yield get_fields(row)
+
+
+def _csv_rows_pandas(path: Path) -> Iterator[tuple]:
+    """Yield the _CSV_FIELDS values of each CSV row, parsed with pandas in chunks."""
+    import pandas as pd
+    
+    # Read the header as plain values; pandas renames repeated column names
+    try:
+        header = pd.read_csv(path, header=None, nrows=1, dtype=str, na_filter=False).iloc[0].tolist()
+    except pd.errors.EmptyDataError:
+        header = None
+    positions = _csv_positions(header)
+    
+    # Reading only the needed columns also lets rows run longer than the header
+    usecols = sorted({col for col in positions if col is not None})
+    chunks = pd.read_csv(
+        path,
+        header=0,
+        usecols=usecols,
+        dtype=str,
+        na_filter=False,
+        chunksize=_PANDAS_CHUNK_ROWS,
+    )
+    
+    # The next chunk is read in the background while this one's reviews are
+    # built; pandas' tokenizer releases the GIL, so the two overlap
+    with chunks, ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(next, chunks, None)
+        while (chunk := pending.result()) is not None:
+            pending = executor.submit(next, chunks, None)
+            values = {col: chunk.iloc[:, i].tolist() for i, col in enumerate(usecols)}
+            missing = [None] * len(chunk)
+            yield from zip(*(values[col] if col is not None else missing for col in positions))
+
+
+def _load_json(path: Path):
+    """
+    Parse a whole JSON file, with orjson straight from a memory map of it.
+    
+    Both parsers decode UTF-8 themselves, so the file is never decoded to a
+    str; mapping it also saves orjson a copy of the file in memory.
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    
+    with open(path, "rb") as f:
+        # An empty file can't be mapped; orjson rejects it as invalid JSON
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _stream_json_items(path: Path) -> Iterator:
+    """Yield the items of a JSON array file one at a time, parsed with ijson."""
+    with open(path, "rb") as f:
+        # Numbers come out as floats rather than Decimals, as with json.loads
+        events = ijson.parse(f, use_float=True)
+        if next(events, (None, None, None))[1] != "start_array":
+            raise ValueError("JSON file must contain an array of review objects")
+        yield from ijson.items(events, "item")
+
+
+def _import_file(file_path: str, default_source: str) -> List[Review]:
+    """Import one file in a worker process for CSVImporter.import_files."""
+    return CSVImporter().import_file(file_path, default_source)
 
 
 def import_reviews(file_path: str, default_source: str = "manual") -> List[Review]:
     """Convenience function to import reviews from a file."""
     importer = CSVImporter()
     return importer.import_file(file_path, default_source)
+
+
+def import_reviews_many(
+    file_paths: List[str],
+    default_source: str = "manual",
+    max_workers: Optional[int] = None,
+) -> List[Review]:
+    """Convenience function to import reviews from several files in parallel."""
+    importer = CSVImporter()
+    return importer.import_files(file_paths, default_source, max_workers)
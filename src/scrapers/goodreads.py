@@ -1,29 +1,79 @@
-"""Goodreads scraper using httpx and BeautifulSoup."""
+"""Goodreads scraper using httpx and selectolax (or BeautifulSoup)."""
 
 import asyncio
 import random
 import re
-from typing import List, Optional
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from src.config import get_config
 from src.exceptions import RateLimitError, ScraperError, ScraperTimeoutError
 from src.logging_config import get_logger
 from src.models import Review
 from src.scrapers.base import BaseScraper
+from src.scrapers.html_parser import AttributeFilter, compile_selector, parse_html
+from src.scrapers.http_client import new_client
+from src.scrapers.page_cache import PageCache
 
 
 logger = get_logger(__name__)
 
+_BOOK_ID_RE = re.compile(r"/book/show/(\d+)")
+_DIGIT_RE = re.compile(r"(\d)")
+_STARS_CLASS_RE = re.compile(r"stars(\d)")
+
+# CSS selectors, compiled once instead of looked up on every query.
+# Alternatives for one field are tried in order rather than as a union,
+# since a union returns whichever match comes first in the document
+_SELECTORS = {name: compile_selector(css) for name, css in {
+    "book_link": "a.bookTitle",
+    "title": "h1.Text__title1",
+    "title_testid": "[data-testid='bookTitle']",
+    "title_legacy": "#bookTitle",
+    "review": "[data-testid='review']",
+    "review_legacy": ".review",
+    "review_card": "[data-testid='reviewCard']",
+    "review_card_legacy": ".ReviewCard",
+    "review_text": "[data-testid='contentContainer']",
+    "review_text_content": ".ReviewText__content",
+    "review_text_span": ".reviewText span",
+    "review_text_legacy": ".reviewText",
+    "author": "[data-testid='name']",
+    "author_legacy": ".user",
+    "rating": "[data-testid='rating']",
+    "rating_legacy": ".staticStars",
+    "filled_star": ".RatingStar__filledStar",
+    "date": "[data-testid='reviewDate']",
+    "date_legacy": ".reviewDate",
+}.items()}
+
+# Rating-filtered review pages of one book fetched at the same time
+_RATING_FETCH_CONCURRENCY = 3
+
+# Ratings of the book-page reviews kept; the rating pages are filtered by URL
+_BOOK_PAGE_RATINGS = frozenset({1, 2, 3})
+
+# Review cards, the only part of a rating-filtered review page that is read
+_REVIEW_CARDS = AttributeFilter({
+    "data-testid": frozenset({"review", "reviewCard"}),
+    "class": frozenset({"review", "ReviewCard"}),
+})
+
+# Review fields kept in the page cache; the rest are set when reviews are stored
+_CACHED_REVIEW_FIELDS = (
+    "source", "source_url", "product_title", "product_url",
+    "author", "rating", "review_text", "review_date",
+)
+
+
+def _review_to_cache(review: Review) -> dict:
+    """Get the cached form of a scraped review."""
+    return {field: getattr(review, field) for field in _CACHED_REVIEW_FIELDS}
+
 
 class GoodreadsScraper(BaseScraper):
     """Scrape book reviews from Goodreads."""
@@ -36,8 +86,6 @@ class GoodreadsScraper(BaseScraper):
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
     }
     
     # Retryable HTTP exceptions
@@ -52,65 +100,99 @@ class GoodreadsScraper(BaseScraper):
         scraping_config = self.config.config.scraping.goodreads
         self.delay_min = scraping_config.delay_min
         self.delay_max = scraping_config.delay_max
+        self.concurrent_books = max(1, scraping_config.concurrent_books)
+        self._cache = PageCache(scraping_config.cache_dir, scraping_config.cache_ttl_days * 86400)
         self.timeout = getattr(
             self.config.config.scraping, "request_timeout", 30.0
         )
+        self.max_retries = max(1, self.config.config.scraping.max_retries)
+        self.retry_min_wait = self.config.config.scraping.retry_min_wait
+        self.retry_max_wait = self.config.config.scraping.retry_max_wait
+        # Client shared by every request while a topic scrape runs
+        self._client: Optional[httpx.AsyncClient] = None
         logger.debug("Initialized GoodreadsScraper")
     
     async def _get_delay(self) -> float:
         """Get random delay between requests."""
         return random.uniform(self.delay_min, self.delay_max)
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            httpx.TimeoutException,
-            httpx.ConnectError,
-            httpx.ReadError,
-        )),
-        reraise=True,
-    )
-    async def _fetch_page(self, client: httpx.AsyncClient, url: str) -> str:
-        """Fetch a page with retry logic."""
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with the scraper's headers and timeout."""
+        return new_client(self.HEADERS, self.timeout)
+    
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Use the shared client when one is open, else a client for this call only."""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with self._new_client() as client:
+                yield client
+    
+    async def _fetch_page(self, client: httpx.AsyncClient, url: str) -> bytes:
+        """
+        Fetch a page's raw bytes, retrying transient failures with exponential
+        backoff; the parser decodes them.
+        
+        Rate-limit responses are retried too, after the server's Retry-After
+        delay when it asks for a longer wait than the current backoff.
+        
+        Raises:
+            RateLimitError: If the site is still rate limiting on the last attempt
+            ScraperTimeoutError: If the last attempt times out
+        """
         logger.debug("Fetching: %s", url)
-        try:
-            response = await client.get(url)
-            
-            # Check for rate limiting
-            if response.status_code == 429:
+        delay = self.retry_min_wait
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = await client.get(url)
+            except self.RETRYABLE_EXCEPTIONS as e:
+                if attempt >= self.max_retries:
+                    if isinstance(e, httpx.TimeoutException):
+                        logger.warning("Request timeout: %s", url)
+                        raise ScraperTimeoutError(f"Timeout fetching {url}") from e
+                    raise
+                wait = delay
+                reason = repr(e)
+            else:
+                if response.status_code != 429:
+                    response.raise_for_status()
+                    return response.content
+                
                 retry_after = int(response.headers.get("Retry-After", 60))
-                logger.warning("Rate limited, retry after %d seconds", retry_after)
-                raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
-            
-            response.raise_for_status()
-            return response.text
+                if attempt >= self.max_retries:
+                    logger.warning("Rate limited, retry after %d seconds", retry_after)
+                    raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
+                wait = max(delay, retry_after)
+                reason = "rate limited"
             
-        except httpx.TimeoutException as e:
-            logger.warning("Request timeout: %s", url)
-            raise ScraperTimeoutError(f"Timeout fetching {url}") from e
+            wait += random.uniform(0, 1)
+            logger.warning(
+                "Fetching %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                url, attempt, self.max_retries, wait, reason,
+            )
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, self.retry_max_wait)
+        
+        raise ScraperError(f"Failed to fetch {url}: no attempts made")
     
     async def search(self, query: str, max_results: int = 50) -> List[str]:
         """Search for books on Goodreads."""
         search_url = f"{self.BASE_URL}/search?q={query.replace(' ', '+')}&search_type=books"
         logger.info("Searching Goodreads for: %s", query)
         
-        async with httpx.AsyncClient(
-            headers=self.HEADERS,
-            follow_redirects=True,
-            timeout=self.timeout,
-        ) as client:
+        async with self._session() as client:
             try:
                 html = await self._fetch_page(client, search_url)
             except (ScraperError, httpx.HTTPError) as e:
                 logger.error("Search failed: %s", e)
                 return []
             
-            soup = BeautifulSoup(html, "lxml")
+            soup = parse_html(html)
             
             # Find book links in search results
             book_urls = []
-            book_links = soup.select("a.bookTitle")
+            book_links = soup.select(_SELECTORS["book_link"])
             
             for link in book_links[:max_results]:
                 href = link.get("href")
@@ -138,47 +220,83 @@ class GoodreadsScraper(BaseScraper):
             logger.error("Could not extract book ID from URL: %s", url)
             return []
         
-        async with httpx.AsyncClient(
-            headers=self.HEADERS,
-            follow_redirects=True,
-            timeout=self.timeout,
-        ) as client:
-            # First, get book page to extract title
-            try:
-                html = await self._fetch_page(client, url)
-            except (ScraperError, httpx.HTTPError) as e:
-                logger.error("Failed to fetch book page: %s", e)
-                return []
-            
-            soup = BeautifulSoup(html, "lxml")
-            book_title = self._extract_book_title(soup)
+        async with self._session() as client:
+            # First, get book page to extract title, unless parsed on an earlier run
+            book_key = f"{book_id}:book"
+            cached = self._cache.get(book_key)
+            if cached is not None:
+                book_title = cached["title"]
+                book_page_reviews = [Review(**fields) for fields in cached["reviews"]]
+            else:
+                try:
+                    html = await self._fetch_page(client, url)
+                except (ScraperError, httpx.HTTPError) as e:
+                    logger.error("Failed to fetch book page: %s", e)
+                    return []
+                
+                # Parsing is CPU-bound, so it runs in a worker thread to keep the
+                # event loop serving the other books' requests meanwhile
+                book_title, book_page_reviews = await asyncio.to_thread(self._parse_book_page, html, url)
+                if book_title != "Unknown Book":
+                    self._cache.set(book_key, {
+                        "title": book_title,
+                        "reviews": [_review_to_cache(review) for review in book_page_reviews],
+                    })
             logger.debug("Book title: %s", book_title)
             
             # Try to scrape reviews from the reviews page
-            # Filter by low ratings
-            for rating in range(min_rating, max_rating + 1):
-                if len(reviews) >= max_reviews:
-                    break
+            # Filter by low ratings, fetching the rating pages concurrently
+            ratings = range(min_rating, max_rating + 1)
+            semaphore = asyncio.Semaphore(_RATING_FETCH_CONCURRENCY)
+            
+            async def scrape_rating_page(rating: int) -> List[Review]:
+                # Cache hits skip both the request and the delay before it; a
+                # page cut short on an earlier run only serves as many reviews
+                rating_key = f"{book_id}:rating:{rating}"
+                cached = self._cache.get(rating_key)
+                if cached is not None and (
+                    not cached["truncated"] or len(cached["reviews"]) >= max_reviews
+                ):
+                    logger.debug("Reviews for rating %d served from cache", rating)
+                    return [Review(**fields) for fields in cached["reviews"][:max_reviews]]
                 
                 reviews_url = f"{self.BASE_URL}/book/reviews/{book_id}?rating={rating}"
+                async with semaphore:
+                    try:
+                        await asyncio.sleep(await self._get_delay())
+                        html = await self._fetch_page(client, reviews_url)
+                    except (ScraperError, httpx.HTTPError) as e:
+                        logger.warning("Failed to fetch reviews for rating %d: %s", rating, e)
+                        return []
                 
-                try:
-                    await asyncio.sleep(await self._get_delay())
-                    html = await self._fetch_page(client, reviews_url)
-                except (ScraperError, httpx.HTTPError) as e:
-                    logger.warning("Failed to fetch reviews for rating %d: %s", rating, e)
-                    continue
-                
-                soup = BeautifulSoup(html, "lxml")
-                page_reviews = self._extract_reviews(soup, book_title, url, rating)
-                reviews.extend(page_reviews)
+                # No one page can contribute more than max_reviews, so
+                # extraction stops there
+                page_reviews = await asyncio.to_thread(
+                    self._parse_reviews_page, html, book_title, url, rating, max_reviews
+                )
                 logger.debug("Extracted %d reviews for rating %d", len(page_reviews), rating)
+                # Empty pages aren't cached so a bad load is retried next run
+                if page_reviews:
+                    self._cache.set(rating_key, {
+                        "reviews": [_review_to_cache(review) for review in page_reviews],
+                        "truncated": len(page_reviews) >= max_reviews,
+                    })
+                return page_reviews
+            
+            rating_reviews = await asyncio.gather(*(scrape_rating_page(rating) for rating in ratings))
             
-            # Also try to get reviews from the main book page
-            # These are often embedded in the page
-            page_reviews = self._extract_reviews_from_book_page(soup, book_title, url)
-            for review in page_reviews:
-                if review not in reviews and len(reviews) < max_reviews:
+            # Collect in rating order so results and the max_reviews cut are stable
+            for page_reviews in rating_reviews:
+                if len(reviews) >= max_reviews:
+                    break
+                reviews.extend(page_reviews)
+            
+            # Also add the reviews embedded in the main book page
+            seen = {(review.author, review.review_text) for review in reviews}
+            for review in book_page_reviews:
+                key = (review.author, review.review_text)
+                if key not in seen and len(reviews) < max_reviews:
+                    seen.add(key)
                     reviews.append(review)
         
         logger.info("Scraped %d reviews total", len(reviews[:max_reviews]))
@@ -187,23 +305,41 @@ class GoodreadsScraper(BaseScraper):
     def _extract_book_id(self, url: str) -> Optional[str]:
         """Extract book ID from Goodreads URL."""
         # URL format: /book/show/12345-book-title
-        match = re.search(r"/book/show/(\d+)", url)
+        match = _BOOK_ID_RE.search(url)
         if match:
             return match.group(1)
         return None
     
-    def _extract_book_title(self, soup: BeautifulSoup) -> str:
+    def _parse_book_page(self, html: bytes, book_url: str) -> Tuple[str, List[Review]]:
+        """Parse a book page into its title and the reviews embedded in it."""
+        soup = parse_html(html)
+        book_title = self._extract_book_title(soup)
+        return book_title, self._extract_reviews_from_book_page(soup, book_title, book_url)
+    
+    def _parse_reviews_page(
+        self,
+        html: bytes,
+        book_title: str,
+        book_url: str,
+        rating: int,
+        limit: Optional[int] = None,
+    ) -> List[Review]:
+        """Parse a reviews page for one rating into at most limit reviews."""
+        soup = parse_html(html, parse_only=_REVIEW_CARDS)
+        return self._extract_reviews(soup, book_title, book_url, rating, limit)
+    
+    def _extract_book_title(self, soup) -> str:
         """Extract book title from page."""
         # Try different selectors
-        title_elem = soup.select_one("h1.Text__title1")
+        title_elem = soup.select_one(_SELECTORS["title"])
         if title_elem:
             return title_elem.get_text(strip=True)
         
-        title_elem = soup.select_one("[data-testid='bookTitle']")
+        title_elem = soup.select_one(_SELECTORS["title_testid"])
         if title_elem:
             return title_elem.get_text(strip=True)
         
-        title_elem = soup.select_one("#bookTitle")
+        title_elem = soup.select_one(_SELECTORS["title_legacy"])
         if title_elem:
             return title_elem.get_text(strip=True)
         
@@ -211,21 +347,25 @@ class GoodreadsScraper(BaseScraper):
     
     def _extract_reviews(
         self,
-        soup: BeautifulSoup,
+        soup,
         book_title: str,
         book_url: str,
         rating: Optional[int] = None,
+        limit: Optional[int] = None,
     ) -> List[Review]:
-        """Extract reviews from a reviews page."""
+        """Extract reviews from a reviews page, stopping after limit reviews."""
         reviews = []
         
         # Try modern Goodreads layout
-        review_cards = soup.select("[data-testid='review']")
+        review_cards = soup.select(_SELECTORS["review"])
         if not review_cards:
             # Try older layout
-            review_cards = soup.select(".review")
+            review_cards = soup.select(_SELECTORS["review_legacy"])
         
         for card in review_cards:
+            if limit is not None and len(reviews) >= limit:
+                break
+            
             review_text = self._extract_review_text(card)
             if not review_text or len(review_text) < 50:
                 continue
@@ -249,7 +389,7 @@ class GoodreadsScraper(BaseScraper):
     
     def _extract_reviews_from_book_page(
         self,
-        soup: BeautifulSoup,
+        soup,
         book_title: str,
         book_url: str,
     ) -> List[Review]:
@@ -257,9 +397,9 @@ class GoodreadsScraper(BaseScraper):
         reviews = []
         
         # Modern layout review containers
-        review_sections = soup.select("[data-testid='reviewCard']")
+        review_sections = soup.select(_SELECTORS["review_card"])
         if not review_sections:
-            review_sections = soup.select(".ReviewCard")
+            review_sections = soup.select(_SELECTORS["review_card_legacy"])
         
         for section in review_sections:
             review_text = self._extract_review_text(section)
@@ -269,7 +409,7 @@ class GoodreadsScraper(BaseScraper):
             rating = self._extract_rating(section)
             
             # Only include low-rated reviews (1-3 stars)
-            if rating and rating > 3:
+            if rating is not None and rating not in _BOOK_PAGE_RATINGS:
                 continue
             
             author = self._extract_author(section)
@@ -290,20 +430,19 @@ class GoodreadsScraper(BaseScraper):
     
     def _extract_review_text(self, element) -> str:
         """Extract review text from a review element."""
-        # Try different selectors
-        text_elem = element.select_one("[data-testid='contentContainer']")
+        text_elem = element.select_one(_SELECTORS["review_text"])
         if text_elem:
             return text_elem.get_text(strip=True)
         
-        text_elem = element.select_one(".ReviewText__content")
+        text_elem = element.select_one(_SELECTORS["review_text_content"])
         if text_elem:
             return text_elem.get_text(strip=True)
         
-        text_elem = element.select_one(".reviewText span")
+        text_elem = element.select_one(_SELECTORS["review_text_span"])
         if text_elem:
             return text_elem.get_text(strip=True)
         
-        text_elem = element.select_one(".reviewText")
+        text_elem = element.select_one(_SELECTORS["review_text_legacy"])
         if text_elem:
             return text_elem.get_text(strip=True)
         
@@ -311,11 +450,11 @@ class GoodreadsScraper(BaseScraper):
     
     def _extract_author(self, element) -> Optional[str]:
         """Extract reviewer name from a review element."""
-        author_elem = element.select_one("[data-testid='name']")
+        author_elem = element.select_one(_SELECTORS["author"])
         if author_elem:
             return author_elem.get_text(strip=True)
         
-        author_elem = element.select_one(".user")
+        author_elem = element.select_one(_SELECTORS["author_legacy"])
         if author_elem:
             return author_elem.get_text(strip=True)
         
@@ -324,24 +463,24 @@ class GoodreadsScraper(BaseScraper):
     def _extract_rating(self, element) -> Optional[int]:
         """Extract star rating from a review element."""
         # Try to find rating from stars
-        stars_elem = element.select_one("[data-testid='rating']")
+        stars_elem = element.select_one(_SELECTORS["rating"])
         if stars_elem:
             rating_text = stars_elem.get("aria-label", "")
-            match = re.search(r"(\d)", rating_text)
+            match = _DIGIT_RE.search(rating_text)
             if match:
                 return int(match.group(1))
         
         # Try older format
-        stars_elem = element.select_one(".staticStars")
+        stars_elem = element.select_one(_SELECTORS["rating_legacy"])
         if stars_elem:
             stars_class = stars_elem.get("class", [])
             for cls in stars_class:
-                match = re.search(r"stars(\d)", cls)
+                match = _STARS_CLASS_RE.search(cls)
                 if match:
                     return int(match.group(1))
         
         # Count filled stars
-        filled_stars = element.select(".RatingStar__filledStar")
+        filled_stars = element.select(_SELECTORS["filled_star"])
         if filled_stars:
             return len(filled_stars)
         
@@ -349,11 +488,11 @@ class GoodreadsScraper(BaseScraper):
     
     def _extract_date(self, element) -> Optional[str]:
         """Extract review date from a review element."""
-        date_elem = element.select_one("[data-testid='reviewDate']")
+        date_elem = element.select_one(_SELECTORS["date"])
         if date_elem:
             return date_elem.get_text(strip=True)
         
-        date_elem = element.select_one(".reviewDate")
+        date_elem = element.select_one(_SELECTORS["date_legacy"])
         if date_elem:
             return date_elem.get_text(strip=True)
         
@@ -369,14 +508,7 @@ class GoodreadsScraper(BaseScraper):
         
         This is a synchronous wrapper for topic-based scraping.
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                self._scrape_book_reviews_async(query, max_reviews, max_books)
-            )
-        finally:
-            loop.close()
+        return asyncio.run(self._scrape_book_reviews_async(query, max_reviews, max_books))
     
     async def _scrape_book_reviews_async(
         self,
@@ -385,6 +517,40 @@ class GoodreadsScraper(BaseScraper):
         max_books: int = 10,
     ) -> List[Review]:
         """Search for books by topic and scrape reviews from multiple books."""
+        # One client for the whole run keeps connections alive between books
+        self._client = self._new_client()
+        try:
+            return await self._scrape_books(query, max_reviews, max_books)
+        finally:
+            await self._client.aclose()
+            self._client = None
+    
+    async def scrape_topics(
+        self,
+        queries: Iterable[str],
+        max_reviews: int = 100,
+        max_books: int = 10,
+    ) -> AsyncIterator[Tuple[str, List[Review]]]:
+        """Scrape several topics in turn, yielding each query with its reviews.
+        
+        All topics share one client, so connections stay open from one topic
+        to the next.
+        """
+        self._client = self._new_client()
+        try:
+            for query in queries:
+                yield query, await self._scrape_books(query, max_reviews, max_books)
+        finally:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _scrape_books(
+        self,
+        query: str,
+        max_reviews: int,
+        max_books: int,
+    ) -> List[Review]:
+        """Search for books by topic and scrape their reviews with the shared client."""
         logger.info("Starting topic-based scrape for: %s", query)
         
         # Search for books matching the topic
@@ -394,30 +560,38 @@ class GoodreadsScraper(BaseScraper):
             logger.warning("No books found for query: %s", query)
             return []
         
-        all_reviews = []
         reviews_per_book = max(1, max_reviews // len(book_urls))
         
-        for i, url in enumerate(book_urls, 1):
-            if len(all_reviews) >= max_reviews:
-                break
-            
-            logger.info("Scraping book %d/%d: %s", i, len(book_urls), url[:80])
-            
-            try:
-                reviews = await self.scrape_reviews(
-                    url,
-                    max_reviews=reviews_per_book,
-                )
-                all_reviews.extend(reviews)
-                logger.info("Got %d reviews from book %d", len(reviews), i)
+        # Each worker scrapes books one at a time, keeping the delays between
+        # its own books, so up to concurrent_books books load in parallel
+        pending = deque(enumerate(book_urls, 1))
+        results: List[List[Review]] = [[] for _ in book_urls]
+        collected = 0
+        
+        async def worker() -> None:
+            nonlocal collected
+            while pending and collected < max_reviews:
+                i, url = pending.popleft()
+                logger.info("Scraping book %d/%d: %s", i, len(book_urls), url[:80])
+                
+                try:
+                    reviews = await self.scrape_reviews(
+                        url,
+                        max_reviews=reviews_per_book,
+                    )
+                    results[i - 1] = reviews
+                    collected += len(reviews)
+                    logger.info("Got %d reviews from book %d", len(reviews), i)
+                except Exception as e:
+                    logger.warning("Failed to scrape book %s: %s", url, e)
                 
                 # Delay between books
-                if i < len(book_urls):
+                if pending and collected < max_reviews:
                     await asyncio.sleep(await self._get_delay() * 2)
-                    
-            except Exception as e:
-                logger.warning("Failed to scrape book %s: %s", url, e)
-                continue
         
+        workers = min(self.concurrent_books, len(book_urls))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        
+        all_reviews = [review for book_reviews in results for review in book_reviews]
         logger.info("Total reviews scraped: %d", len(all_reviews[:max_reviews]))
         return all_reviews[:max_reviews]
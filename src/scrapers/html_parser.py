@@ -0,0 +1,108 @@
+"""HTML parsing for the httpx-based scrapers, on selectolax when installed."""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+
+import soupsieve
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional: faster HTML parsing
+    LexborHTMLParser = None
+
+
+# A CSS selector string, or one compiled with compile_selector
+Selector = Union[str, soupsieve.SoupSieve]
+
+
+def compile_selector(css: str) -> soupsieve.SoupSieve:
+    """
+    Compile a CSS selector once for repeated queries.
+    
+    BeautifulSoup otherwise looks the selector up in soupsieve's cache on every
+    select call; selectolax nodes take the compiled selector's pattern.
+    """
+    return soupsieve.compile(css)
+
+
+def _pattern(selector: Selector) -> str:
+    return selector.pattern if isinstance(selector, soupsieve.SoupSieve) else selector
+
+
+class LexborNode:
+    """
+    A selectolax node behind the part of the BeautifulSoup Tag API the
+    scrapers use, so their extractors work with either parser.
+    """
+    
+    __slots__ = ("_node",)
+    
+    def __init__(self, node):
+        self._node = node
+    
+    def select(self, selector: Selector) -> List["LexborNode"]:
+        return [LexborNode(node) for node in self._node.css(_pattern(selector))]
+    
+    def select_one(self, selector: Selector) -> Optional["LexborNode"]:
+        node = self._node.css_first(_pattern(selector))
+        return LexborNode(node) if node is not None else None
+    
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self._node.text(separator=separator, strip=strip)
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        value = self._node.attributes.get(name)
+        if value is None:
+            return default
+        # BeautifulSoup gives class as a list of names
+        return value.split() if name == "class" else value
+
+
+class AttributeFilter(ElementFilter):
+    """
+    Keep only elements with one of the given attribute values, with all of
+    their contents, when BeautifulSoup parses a page.
+    
+    Takes a mapping of attribute name to accepted values; for class, any one
+    of an element's class names may match.
+    """
+    
+    def __init__(self, values: Dict[str, FrozenSet[str]]):
+        super().__init__()
+        self.values = values
+    
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs) -> bool:
+        # Only consulted for top-level elements; descendants of a kept element
+        # are always kept
+        if not attrs:
+            return False
+        for attr, accepted in self.values.items():
+            value = attrs.get(attr)
+            if not value:
+                continue
+            if attr == "class":
+                if not accepted.isdisjoint(value.split()):
+                    return True
+            elif value in accepted:
+                return True
+        return False
+    
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+def parse_html(html: Union[str, bytes], parse_only: Optional[AttributeFilter] = None):
+    """
+    Parse an HTML page with selectolax's Lexbor parser, or BeautifulSoup without it.
+    
+    Both parsers take the response bytes as is and decode them natively, so
+    pages are best passed undecoded.
+    
+    parse_only limits the BeautifulSoup tree to the elements it keeps, which
+    saves most of the parse when only part of a page is read. selectolax
+    always parses the whole page; it is fast enough not to need it.
+    """
+    if LexborHTMLParser is not None:
+        return LexborNode(LexborHTMLParser(html))
+    return BeautifulSoup(html, "lxml", parse_only=parse_only)
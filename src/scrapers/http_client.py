@@ -0,0 +1,31 @@
+"""HTTP client setup shared by the httpx-based scrapers."""
+
+import importlib.util
+from typing import Dict
+
+import httpx
+
+
+# Connection pool of a client shared by a topic scrape; idle connections
+# are kept open between the delayed requests
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60)
+
+# Optional: HTTP/2 needs h2
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def new_client(headers: Dict[str, str], timeout: float) -> httpx.AsyncClient:
+    """
+    Create an HTTP client for scraping with the given headers.
+    
+    Accept-Encoding is left to httpx, which only advertises what it can
+    decode: zstd and br are added to gzip and deflate when zstandard and
+    brotli are installed.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        follow_redirects=True,
+        timeout=timeout,
+        limits=HTTP_LIMITS,
+        http2=HTTP2,
+    )
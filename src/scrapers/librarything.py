@@ -1,29 +1,53 @@
-"""LibraryThing scraper using httpx and BeautifulSoup."""
+"""LibraryThing scraper using httpx and selectolax (or BeautifulSoup)."""
 
 import asyncio
 import random
 import re
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from src.config import get_config
 from src.exceptions import RateLimitError, ScraperError, ScraperTimeoutError
 from src.logging_config import get_logger
 from src.models import Review
 from src.scrapers.base import BaseScraper
+from src.scrapers.html_parser import AttributeFilter, compile_selector, parse_html
+from src.scrapers.http_client import new_client
 
 
 logger = get_logger(__name__)
 
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_INT_RE = re.compile(r"(\d+)")
+
+# CSS selectors, compiled once instead of looked up on every query.
+# Alternatives for one field are tried in order rather than as a union,
+# since a union returns whichever match comes first in the document
+_SELECTORS = {name: compile_selector(css) for name, css in {
+    "work_link": "a[href*='/work/']",
+    "title": "h1.headsummary",
+    "title_any": ".headsummary",
+    "heading": "h1",
+    "review": ".bookReview",
+    "review_legacy": ".review",
+    "review_text": ".reviewText",
+    "review_text_body": ".bookReviewBody",
+    "paragraph": "p",
+    "author": ".reviewer",
+    "profile_link": "a[href*='/profile/']",
+    "stars": ".stars",
+    "rating": ".rating",
+    "star_image": "img[src*='star']",
+    "date": ".reviewDate",
+    "date_any": ".date",
+}.items()}
+
+# Review elements, the only part of a reviews page that is read
+_REVIEW_ELEMENTS = AttributeFilter({"class": frozenset({"bookReview", "review"})})
+
 
 class LibraryThingScraper(BaseScraper):
     """Scrape book reviews from LibraryThing."""
@@ -36,8 +60,6 @@ class LibraryThingScraper(BaseScraper):
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
     }
     
     # Retryable HTTP exceptions
@@ -55,62 +77,94 @@ class LibraryThingScraper(BaseScraper):
         self.timeout = getattr(
             self.config.config.scraping, "request_timeout", 30.0
         )
+        self.max_retries = max(1, self.config.config.scraping.max_retries)
+        self.retry_min_wait = self.config.config.scraping.retry_min_wait
+        self.retry_max_wait = self.config.config.scraping.retry_max_wait
+        # Client shared by every request while a topic scrape runs
+        self._client: Optional[httpx.AsyncClient] = None
         logger.debug("Initialized LibraryThingScraper")
     
     async def _get_delay(self) -> float:
         """Get random delay between requests."""
         return random.uniform(self.delay_min, self.delay_max)
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            httpx.TimeoutException,
-            httpx.ConnectError,
-            httpx.ReadError,
-        )),
-        reraise=True,
-    )
-    async def _fetch_page(self, client: httpx.AsyncClient, url: str) -> str:
-        """Fetch a page with retry logic."""
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with the scraper's headers and timeout."""
+        return new_client(self.HEADERS, self.timeout)
+    
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Use the shared client when one is open, else a client for this call only."""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with self._new_client() as client:
+                yield client
+    
+    async def _fetch_page(self, client: httpx.AsyncClient, url: str) -> bytes:
+        """
+        Fetch a page's raw bytes, retrying transient failures with exponential
+        backoff; the parser decodes them.
+        
+        Rate-limit responses are retried too, after the server's Retry-After
+        delay when it asks for a longer wait than the current backoff.
+        
+        Raises:
+            RateLimitError: If the site is still rate limiting on the last attempt
+            ScraperTimeoutError: If the last attempt times out
+        """
         logger.debug("Fetching: %s", url)
-        try:
-            response = await client.get(url)
-            
-            # Check for rate limiting
-            if response.status_code == 429:
+        delay = self.retry_min_wait
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = await client.get(url)
+            except self.RETRYABLE_EXCEPTIONS as e:
+                if attempt >= self.max_retries:
+                    if isinstance(e, httpx.TimeoutException):
+                        logger.warning("Request timeout: %s", url)
+                        raise ScraperTimeoutError(f"Timeout fetching {url}") from e
+                    raise
+                wait = delay
+                reason = repr(e)
+            else:
+                if response.status_code != 429:
+                    response.raise_for_status()
+                    return response.content
+                
                 retry_after = int(response.headers.get("Retry-After", 60))
-                logger.warning("Rate limited, retry after %d seconds", retry_after)
-                raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
-            
-            response.raise_for_status()
-            return response.text
+                if attempt >= self.max_retries:
+                    logger.warning("Rate limited, retry after %d seconds", retry_after)
+                    raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
+                wait = max(delay, retry_after)
+                reason = "rate limited"
             
-        except httpx.TimeoutException as e:
-            logger.warning("Request timeout: %s", url)
-            raise ScraperTimeoutError(f"Timeout fetching {url}") from e
+            wait += random.uniform(0, 1)
+            logger.warning(
+                "Fetching %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                url, attempt, self.max_retries, wait, reason,
+            )
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, self.retry_max_wait)
+        
+        raise ScraperError(f"Failed to fetch {url}: no attempts made")
     
     async def search(self, query: str, max_results: int = 50) -> List[str]:
         """Search for books on LibraryThing."""
         search_url = f"{self.BASE_URL}/search.php?search={query.replace(' ', '+')}&searchtype=newwork_titles"
         logger.info("Searching LibraryThing for: %s", query)
         
-        async with httpx.AsyncClient(
-            headers=self.HEADERS,
-            follow_redirects=True,
-            timeout=self.timeout,
-        ) as client:
+        async with self._session() as client:
             try:
                 html = await self._fetch_page(client, search_url)
             except (ScraperError, httpx.HTTPError) as e:
                 logger.error("Search failed: %s", e)
                 return []
             
-            soup = BeautifulSoup(html, "lxml")
+            soup = parse_html(html)
             
             # Find work links in search results
             work_urls = []
-            work_links = soup.select("a[href*='/work/']")
+            work_links = soup.select(_SELECTORS["work_link"])
             
             seen = set()
             for link in work_links:
@@ -134,6 +188,7 @@ class LibraryThingScraper(BaseScraper):
     ) -> List[Review]:
         """Scrape reviews from a LibraryThing work page."""
         reviews = []
+        allowed_ratings = frozenset(range(min_rating, max_rating + 1))
         logger.info("Scraping reviews from: %s", url)
         
         # Ensure we're on the reviews page
@@ -143,11 +198,7 @@ class LibraryThingScraper(BaseScraper):
             else:
                 url = url + "/reviews"
         
-        async with httpx.AsyncClient(
-            headers=self.HEADERS,
-            follow_redirects=True,
-            timeout=self.timeout,
-        ) as client:
+        async with self._session() as client:
             # Get the work page first to extract title
             work_url = url.replace("/reviews", "")
             try:
@@ -157,7 +208,7 @@ class LibraryThingScraper(BaseScraper):
                 logger.error("Failed to fetch work page: %s", e)
                 return []
             
-            soup = BeautifulSoup(html, "lxml")
+            soup = parse_html(html)
             book_title = self._extract_book_title(soup)
             logger.debug("Book title: %s", book_title)
             
@@ -169,12 +220,12 @@ class LibraryThingScraper(BaseScraper):
                 logger.error("Failed to fetch reviews page: %s", e)
                 return []
             
-            soup = BeautifulSoup(html, "lxml")
+            soup = parse_html(html, parse_only=_REVIEW_ELEMENTS)
             
             # Extract reviews
-            review_elements = soup.select(".bookReview")
+            review_elements = soup.select(_SELECTORS["review"])
             if not review_elements:
-                review_elements = soup.select(".review")
+                review_elements = soup.select(_SELECTORS["review_legacy"])
             
             logger.debug("Found %d review elements", len(review_elements))
             
@@ -189,7 +240,7 @@ class LibraryThingScraper(BaseScraper):
                 rating = self._extract_rating(element)
                 
                 # Filter by rating if specified
-                if rating and (rating < min_rating or rating > max_rating):
+                if rating is not None and rating not in allowed_ratings:
                     continue
                 
                 author = self._extract_author(element)
@@ -209,17 +260,17 @@ class LibraryThingScraper(BaseScraper):
         logger.info("Scraped %d reviews total", len(reviews))
         return reviews
     
-    def _extract_book_title(self, soup: BeautifulSoup) -> str:
+    def _extract_book_title(self, soup) -> str:
         """Extract book title from page."""
-        title_elem = soup.select_one("h1.headsummary")
+        title_elem = soup.select_one(_SELECTORS["title"])
         if title_elem:
             return title_elem.get_text(strip=True)
         
-        title_elem = soup.select_one(".headsummary")
+        title_elem = soup.select_one(_SELECTORS["title_any"])
         if title_elem:
             return title_elem.get_text(strip=True)
         
-        title_elem = soup.select_one("h1")
+        title_elem = soup.select_one(_SELECTORS["heading"])
         if title_elem:
             return title_elem.get_text(strip=True)
         
@@ -227,16 +278,16 @@ class LibraryThingScraper(BaseScraper):
     
     def _extract_review_text(self, element) -> str:
         """Extract review text from a review element."""
-        text_elem = element.select_one(".reviewText")
+        text_elem = element.select_one(_SELECTORS["review_text"])
         if text_elem:
             return text_elem.get_text(strip=True)
         
-        text_elem = element.select_one(".bookReviewBody")
+        text_elem = element.select_one(_SELECTORS["review_text_body"])
         if text_elem:
             return text_elem.get_text(strip=True)
         
         # Try to get any paragraph content
-        text_elem = element.select_one("p")
+        text_elem = element.select_one(_SELECTORS["paragraph"])
         if text_elem:
             return text_elem.get_text(strip=True)
         
@@ -244,11 +295,11 @@ class LibraryThingScraper(BaseScraper):
     
     def _extract_author(self, element) -> Optional[str]:
         """Extract reviewer name from a review element."""
-        author_elem = element.select_one(".reviewer")
+        author_elem = element.select_one(_SELECTORS["author"])
         if author_elem:
             return author_elem.get_text(strip=True)
         
-        author_elem = element.select_one("a[href*='/profile/']")
+        author_elem = element.select_one(_SELECTORS["profile_link"])
         if author_elem:
             return author_elem.get_text(strip=True)
         
@@ -257,23 +308,23 @@ class LibraryThingScraper(BaseScraper):
     def _extract_rating(self, element) -> Optional[int]:
         """Extract star rating from a review element."""
         # Try to find rating from stars
-        stars_elem = element.select_one(".stars")
+        stars_elem = element.select_one(_SELECTORS["stars"])
         if stars_elem:
             title = stars_elem.get("title", "")
-            match = re.search(r"(\d+(?:\.\d+)?)", title)
+            match = _NUMBER_RE.search(title)
             if match:
                 return round(float(match.group(1)))
         
         # Try rating text
-        rating_elem = element.select_one(".rating")
+        rating_elem = element.select_one(_SELECTORS["rating"])
         if rating_elem:
             text = rating_elem.get_text()
-            match = re.search(r"(\d+)", text)
+            match = _INT_RE.search(text)
             if match:
                 return int(match.group(1))
         
         # Count star images
-        star_imgs = element.select("img[src*='star']")
+        star_imgs = element.select(_SELECTORS["star_image"])
         if star_imgs:
             # Count filled vs empty stars
             filled = len([img for img in star_imgs if "full" in img.get("src", "").lower()])
@@ -284,11 +335,11 @@ class LibraryThingScraper(BaseScraper):
     
     def _extract_date(self, element) -> Optional[str]:
         """Extract review date from a review element."""
-        date_elem = element.select_one(".reviewDate")
+        date_elem = element.select_one(_SELECTORS["date"])
         if date_elem:
             return date_elem.get_text(strip=True)
         
-        date_elem = element.select_one(".date")
+        date_elem = element.select_one(_SELECTORS["date_any"])
         if date_elem:
             return date_elem.get_text(strip=True)
         
@@ -304,14 +355,7 @@ class LibraryThingScraper(BaseScraper):
         
         This is a synchronous wrapper for topic-based scraping.
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                self._scrape_work_reviews_async(query, max_reviews, max_works)
-            )
-        finally:
-            loop.close()
+        return asyncio.run(self._scrape_work_reviews_async(query, max_reviews, max_works))
     
     async def _scrape_work_reviews_async(
         self,
@@ -320,6 +364,21 @@ class LibraryThingScraper(BaseScraper):
         max_works: int = 10,
     ) -> List[Review]:
         """Search for works by topic and scrape reviews from multiple works."""
+        # One client for the whole run keeps connections alive between works
+        self._client = self._new_client()
+        try:
+            return await self._scrape_works(query, max_reviews, max_works)
+        finally:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _scrape_works(
+        self,
+        query: str,
+        max_reviews: int,
+        max_works: int,
+    ) -> List[Review]:
+        """Search for works by topic and scrape their reviews with the shared client."""
         logger.info("Starting topic-based scrape for: %s", query)
         
         # Search for works matching the topic
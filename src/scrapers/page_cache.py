@@ -0,0 +1,57 @@
+"""On-disk cache for data extracted from scraped pages."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from src.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PageCache:
+    """
+    Cache JSON-serializable page data on disk, one file per key.
+    
+    Entries expire ttl seconds after they were written; a ttl of 0 or less
+    disables the cache entirely.
+    """
+    
+    def __init__(self, directory: str, ttl: float):
+        self.directory = Path(directory)
+        self.ttl = ttl
+    
+    def _path(self, key: str) -> Path:
+        """Get the file for a key, hashed to a filesystem-safe name."""
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get the cached value for a key, or None if missing or expired."""
+        if self.ttl <= 0:
+            return None
+        
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for a key, replacing any previous entry."""
+        if self.ttl <= 0:
+            return
+        
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(value), encoding="utf-8")
+            # Replace atomically so readers never see a partial entry
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.debug("Failed to cache %s: %s", key, e)
@@ -0,0 +1,39 @@
+"""Request rate limiting shared by concurrent scraper tasks."""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket spacing requests out to a fixed overall rate.
+    
+    Up to burst requests may go at once; after that callers wait their turn,
+    in order, so the rate holds however many pages are scraping at the same
+    time. A rate of 0 or less disables limiting.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate  # requests per second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until the next request may be made."""
+        if self.rate <= 0:
+            return
+        
+        # The lock queues waiters, so each sleeps only for its own token
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            
+            self._tokens -= 1
@@ -1,7 +1,13 @@
 """Reddit scraper - supports both PRAW (with API key) and public JSON (no auth)."""
 
 import asyncio
-from typing import List, Optional
+import re
+import sys
+import weakref
+from functools import lru_cache
+from collections import deque
+from itertools import chain, islice
+from typing import Dict, List, Optional
 from datetime import datetime
 
 import httpx
@@ -13,10 +19,18 @@ from tenacity import (
 )
 
 from src.config import get_config
-from src.exceptions import ConfigError, ScraperError
+from src.exceptions import ScraperError
 from src.logging_config import get_logger
 from src.models import Review
 from src.scrapers.base import BaseScraper
+from src.scrapers.http_client import new_client
+from src.scrapers.page_cache import PageCache
+from src.scrapers.rate_limit import RateLimiter
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
 
 
 logger = get_logger(__name__)
@@ -25,6 +39,30 @@ logger = get_logger(__name__)
 # Rate limiting for public JSON API
 JSON_API_DELAY = 2.0  # Reddit wants 1 request per 2 seconds without auth
 
+# PRAW request budget: 60 a minute, in bursts of up to the whole minute's
+PRAW_REQUESTS_PER_SECOND = 1.0
+PRAW_BURST = 60
+
+# JSON API clients shared by every scraper on the same event loop, so
+# repeated scrapes in one process reuse connections; a client can't be used
+# from another loop
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Bodies left by deleted or removed posts and comments
+_DEAD_BODIES = frozenset({"[deleted]", "[removed]"})
+
+# Lowercased authors whose comments are skipped
+_BOT_AUTHORS = frozenset({"automoderator", "bot", "[deleted]"})
+
+# Reply levels walked below each top-level comment
+_COMMENT_DEPTH = 3
+
+# Comment requests trimmed server-side to what gets read: no deeper replies
+# than are walked, and bodies without HTML entity escaping
+_COMMENT_PARAMS = {"depth": _COMMENT_DEPTH, "limit": 100, "raw_json": 1}
+
 
 # Pain keywords to search for in discussions
 PAIN_KEYWORDS = [
@@ -43,6 +81,13 @@ PAIN_KEYWORDS = [
 ]
 
 
+@lru_cache(maxsize=4096)
+def _timestamp_to_datetime(timestamp: float) -> datetime:
+    """Convert a UTC timestamp to a datetime, reusing results for repeated timestamps."""
+    # Datetimes are immutable, so reviews can share a cached instance
+    return datetime.fromtimestamp(timestamp)
+
+
 class RedditScraper(BaseScraper):
     """Scrape reviews and discussions from Reddit.
     
@@ -57,21 +102,33 @@ class RedditScraper(BaseScraper):
         self.config = get_config()
         self._reddit = None
         self._use_json_api = False
-        self._http_client = None
+        # JSON API requests run concurrently but share one request budget
+        self._limiter = RateLimiter(1 / JSON_API_DELAY)
+        self._praw_limiter = RateLimiter(PRAW_REQUESTS_PER_SECOND, burst=PRAW_BURST)
+        reddit_config = self.config.config.scraping.reddit
+        self._cache = PageCache(reddit_config.cache_dir, reddit_config.cache_ttl_days * 86400)
+        # Comments already fetched by this scraper, by post ID; unlike the
+        # response cache this also works with caching disabled
+        self._comments_cache: Dict[str, List[dict]] = {}
+        # With require_pain_keyword, text must mention one of these to become a review
+        self._pain_re = None
+        if reddit_config.require_pain_keyword:
+            keywords = dict.fromkeys([*PAIN_KEYWORDS, *reddit_config.pain_keywords])
+            self._pain_re = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
         logger.debug("Initialized RedditScraper")
     
     @property
     def http_client(self) -> httpx.AsyncClient:
-        """Lazy-load async HTTP client for JSON API."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                headers={
-                    "User-Agent": self.config.reddit_user_agent or "ReviewMiner/1.0 (Educational Project)",
-                },
+        """Get the JSON API client shared on the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        client = _shared_clients.get(loop)
+        if client is None or client.is_closed:
+            client = new_client(
+                {"User-Agent": self.config.reddit_user_agent or "ReviewMiner/1.0 (Educational Project)"},
                 timeout=30.0,
-                follow_redirects=True,
             )
-        return self._http_client
+            _shared_clients[loop] = client
+        return client
     
     @property
     def reddit(self):
@@ -94,16 +151,20 @@ class RedditScraper(BaseScraper):
                 self._use_json_api = True
                 return None
             
-            user_agent = self.config.reddit_user_agent
-            
             logger.debug("Initializing Reddit client with PRAW")
-            self._reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                user_agent=user_agent,
-            )
+            self._reddit = self._new_praw_client()
         return self._reddit
     
+    def _new_praw_client(self):
+        """Create a PRAW Reddit instance from the configured credentials."""
+        import praw
+        
+        return praw.Reddit(
+            client_id=self.config.reddit_client_id,
+            client_secret=self.config.reddit_client_secret,
+            user_agent=self.config.reddit_user_agent,
+        )
+    
     async def _json_search(
         self,
         query: str,
@@ -118,21 +179,31 @@ class RedditScraper(BaseScraper):
             "sort": "relevance",
             "restrict_sr": "on" if subreddit != "all" else "off",
             "type": "link",
+            "raw_json": 1,  # Post text without HTML entity escaping
         }
         
+        # Cache hits skip both the request and its place in the rate limit
+        cache_key = f"{url}?{sorted(params.items())}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("JSON API search served from cache")
+            return cached
+        
         try:
-            await asyncio.sleep(JSON_API_DELAY)  # Rate limit
+            await self._limiter.acquire()
             response = await self.http_client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             
             posts = []
             for child in data.get("data", {}).get("children", []):
                 posts.append(child.get("data", {}))
             
             logger.debug("JSON API search returned %d posts", len(posts))
+            if posts:
+                self._cache.set(cache_key, posts)
             return posts
-            
+        
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
                 logger.warning("Rate limited by Reddit - waiting 60s")
@@ -146,45 +217,64 @@ class RedditScraper(BaseScraper):
     
     async def _json_get_comments(self, post_id: str) -> List[dict]:
         """Get comments for a post using JSON API."""
+        comments = self._comments_cache.get(post_id)
+        if comments is not None:
+            return comments
+        
         url = f"https://www.reddit.com/comments/{post_id}.json"
+        cache_key = f"{url}?{sorted(_COMMENT_PARAMS.items())}"
+        
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Comments for post %s served from cache", post_id)
+            self._comments_cache[post_id] = cached
+            return cached
         
         try:
-            await asyncio.sleep(JSON_API_DELAY)  # Rate limit
-            response = await self.http_client.get(url)
+            await self._limiter.acquire()
+            response = await self.http_client.get(url, params=_COMMENT_PARAMS)
             response.raise_for_status()
-            data = response.json()
+            data = self._parse_json(response)
             
             comments = []
             if len(data) > 1:
-                self._extract_comments_recursive(data[1].get("data", {}).get("children", []), comments)
+                self._extract_comments(data[1].get("data", {}).get("children", []), comments)
             
             logger.debug("JSON API returned %d comments for post %s", len(comments), post_id)
+            self._cache.set(cache_key, comments)
+            self._comments_cache[post_id] = comments
             return comments
-            
+        
         except Exception as e:
             logger.error("Failed to get comments for %s: %s", post_id, e)
             return []
     
-    def _extract_comments_recursive(self, children: list, comments: list, max_depth: int = 3, depth: int = 0):
-        """Recursively extract comments from Reddit JSON structure."""
-        if depth >= max_depth:
-            return
-            
-        for child in children:
+    def _extract_comments(self, children: list, comments: list, max_depth: int = _COMMENT_DEPTH):
+        """
+        Extract comments from Reddit JSON structure, walking reply trees with
+        an explicit stack.
+        
+        Comments come out in thread order, each followed by its replies, down
+        to max_depth levels.
+        """
+        # Children are pushed in reverse so they pop in their original order
+        stack = [(child, 0) for child in reversed(children)]
+        while stack:
+            child, depth = stack.pop()
             if child.get("kind") != "t1":  # t1 = comment
                 continue
             
             data = child.get("data", {})
             body = data.get("body", "")
             
-            if body and body not in ("[deleted]", "[removed]") and len(body) >= 50:
+            if body and body not in _DEAD_BODIES and len(body) >= 50:
                 comments.append(data)
             
-            # Recurse into replies
+            # Walk into replies
             replies = data.get("replies")
-            if isinstance(replies, dict):
+            if isinstance(replies, dict) and depth + 1 < max_depth:
                 reply_children = replies.get("data", {}).get("children", [])
-                self._extract_comments_recursive(reply_children, comments, max_depth, depth + 1)
+                stack.extend((reply, depth + 1) for reply in reversed(reply_children))
     
     def _get_prawcore_exceptions(self):
         """Get prawcore exception types for retry logic."""
@@ -280,69 +370,115 @@ class RedditScraper(BaseScraper):
         """Search and scrape using public JSON API (no auth required)."""
         logger.info("Using JSON API mode (no authentication)")
         
-        all_reviews = []
         seen_ids = set()
         
-        # Build search queries
+        # Build search queries; the pain keywords share one OR query, as
+        # every search costs a rate-limited request
+        keywords = pain_keywords[:5]
         search_queries = [query]
-        for keyword in pain_keywords[:2]:  # Limit queries due to rate limiting
-            search_queries.append(f"{query} {keyword}")
+        if keywords:
+            any_keyword = " OR ".join(f'"{keyword}"' for keyword in keywords)
+            search_queries.append(f"{query} ({any_keyword})")
+        limit = max_posts // len(search_queries)
         
         subreddit_str = "+".join(subreddits) if subreddits else "all"
         
-        for search_query in search_queries:
-            logger.debug("JSON search: %s in r/%s", search_query, subreddit_str)
-            
-            posts = await self._json_search(
-                query=search_query,
-                subreddit=subreddit_str,
-                limit=max_posts // len(search_queries),
-            )
-            
+        logger.debug("JSON search: %s in r/%s", search_queries, subreddit_str)
+        
+        # Run the searches, then fetch every found post's comments, each
+        # batch concurrently; the rate limiter still spaces the requests out,
+        # but their round trips overlap
+        query_posts = await asyncio.gather(*(
+            self._json_search(query=search_query, subreddit=subreddit_str, limit=limit)
+            for search_query in search_queries
+        ))
+        
+        # Reddit search can fail to match a boolean query it doesn't parse;
+        # search the keywords one at a time then. If the bare query found
+        # nothing either, the keyword searches can't find anything
+        if keywords and query_posts[0] and not query_posts[-1]:
+            logger.debug("Combined keyword search found nothing, searching keywords separately")
+            fallback_keywords = keywords[:2]
+            # Split the budget as the bare query and per-keyword searches would
+            fallback_limit = max_posts // (len(fallback_keywords) + 1)
+            query_posts[-1:] = await asyncio.gather(*(
+                self._json_search(query=f"{query} {keyword}", subreddit=subreddit_str, limit=fallback_limit)
+                for keyword in fallback_keywords
+            ))
+        
+        # Dedupe in query order so results come out as with serial searches
+        new_posts = []
+        for posts in query_posts:
             for post in posts:
                 post_id = post.get("id")
                 if not post_id or post_id in seen_ids:
                     continue
                 seen_ids.add(post_id)
-                
-                # Extract from post body
-                selftext = post.get("selftext", "")
-                if selftext and selftext not in ("[deleted]", "[removed]") and len(selftext) >= 50:
-                    all_reviews.append(Review(
-                        source=self.source_name,
-                        source_url=f"https://reddit.com{post.get('permalink', '')}",
-                        product_title=post.get("title", ""),
-                        author=post.get("author"),
-                        rating=None,
-                        review_text=selftext,
-                        review_date=self._parse_utc_timestamp(post.get("created_utc")),
-                    ))
-                
-                # Get comments
-                comments = await self._json_get_comments(post_id)
-                for comment in comments[:30]:  # Limit comments per post
-                    author = comment.get("author", "")
-                    if author.lower() in ("automoderator", "[deleted]"):
-                        continue
-                    
-                    all_reviews.append(Review(
-                        source=self.source_name,
-                        source_url=f"https://reddit.com{comment.get('permalink', '')}",
-                        product_title=post.get("title", ""),
-                        author=author,
-                        rating=None,
-                        review_text=comment.get("body", ""),
-                        review_date=self._parse_utc_timestamp(comment.get("created_utc")),
-                    ))
+                new_posts.append(post)
+        
+        post_reviews = await asyncio.gather(*(self._json_post_reviews(post) for post in new_posts))
+        all_reviews = list(chain.from_iterable(post_reviews))
         
         logger.info("JSON API collected %d reviews", len(all_reviews))
         return all_reviews
     
+    async def _json_post_reviews(self, post: dict) -> List[Review]:
+        """Extract reviews from a JSON API post and its comments."""
+        reviews = []
+        
+        # Extract from post body
+        selftext = post.get("selftext", "")
+        if (
+            selftext and selftext not in _DEAD_BODIES and len(selftext) >= 50
+            and self._mentions_pain(selftext)
+        ):
+            reviews.append(Review(
+                source=self.source_name,
+                source_url=f"https://reddit.com{post.get('permalink', '')}",
+                product_title=post.get("title", ""),
+                author=post.get("author"),
+                rating=None,
+                review_text=selftext,
+                review_date=self._parse_utc_timestamp(post.get("created_utc")),
+            ))
+        
+        # Get comments; posts without any don't spend a request on them
+        comments = await self._json_get_comments(post["id"]) if post.get("num_comments", 1) else []
+        for comment in comments[:30]:  # Limit comments per post
+            # Frequent commenters' reviews share one author string
+            author = sys.intern(comment.get("author", ""))
+            if author.lower() in _BOT_AUTHORS:
+                continue
+            if not self._mentions_pain(comment.get("body", "")):
+                continue
+            
+            reviews.append(Review(
+                source=self.source_name,
+                source_url=f"https://reddit.com{comment.get('permalink', '')}",
+                product_title=post.get("title", ""),
+                author=author,
+                rating=None,
+                review_text=comment.get("body", ""),
+                review_date=self._parse_utc_timestamp(comment.get("created_utc")),
+            ))
+        
+        return reviews
+    
+    def _parse_json(self, response: httpx.Response):
+        """Parse a JSON API response body, with orjson when installed."""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _mentions_pain(self, text: str) -> bool:
+        """Check whether text passes the pain keyword filter, if one is enabled."""
+        return self._pain_re is None or self._pain_re.search(text) is not None
+    
     def _parse_utc_timestamp(self, timestamp) -> Optional[datetime]:
         """Convert Reddit UTC timestamp to datetime."""
         if timestamp:
             try:
-                return datetime.fromtimestamp(float(timestamp))
+                return _timestamp_to_datetime(float(timestamp))
             except (ValueError, TypeError):
                 pass
         return None
@@ -357,52 +493,69 @@ class RedditScraper(BaseScraper):
         """Search and scrape using PRAW (requires API credentials)."""
         logger.info("Using PRAW mode (authenticated)")
         
-        all_reviews = []
         subreddit_str = "+".join(subreddits)
         logger.debug("Searching in subreddits: %s", subreddit_str)
         
-        try:
-            subreddit = self.reddit.subreddit(subreddit_str)
-        except Exception as e:
-            logger.error("Failed to access subreddits: %s", e)
-            raise ScraperError(f"Failed to access subreddits: {e}") from e
-        
         # Search with pain keywords
         search_queries = [f'"{query}"']
         for keyword in pain_keywords[:3]:  # Limit to avoid too many searches
             search_queries.append(f'"{query}" {keyword}')
         
+        # PRAW blocks on network calls, so they run in worker threads to keep
+        # the event loop free. A Reddit instance isn't thread-safe, so each
+        # query runs concurrently on its own, making its calls one at a time
+        try:
+            subreddits_by_query = [self.reddit.subreddit(subreddit_str)]
+            subreddits_by_query += [
+                self._new_praw_client().subreddit(subreddit_str) for _ in search_queries[1:]
+            ]
+        except Exception as e:
+            logger.error("Failed to access subreddits: %s", e)
+            raise ScraperError(f"Failed to access subreddits: {e}") from e
+        
         seen_ids = set()
         
-        for search_query in search_queries:
+        async def run_query(search_query: str, subreddit) -> List[Review]:
             logger.debug("Searching with query: %s", search_query)
+            reviews = []
             try:
-                results = list(subreddit.search(search_query, limit=max_posts // len(search_queries)))
+                await self._praw_limiter.acquire()
+                results = await asyncio.to_thread(
+                    lambda: list(subreddit.search(search_query, limit=max_posts // len(search_queries)))
+                )
                 logger.debug("Found %d results for query", len(results))
                 
                 for submission in results:
+                    # Checked and claimed without an await in between, so
+                    # concurrent queries never both take a post
                     if submission.id in seen_ids:
                         continue
                     seen_ids.add(submission.id)
                     
-                    reviews = self._extract_reviews_from_submission(submission)
-                    all_reviews.extend(reviews)
-                    
-                    # Small delay to be nice to API
-                    await asyncio.sleep(0.1)
-                    
+                    await self._praw_limiter.acquire()
+                    reviews.extend(
+                        await asyncio.to_thread(self._extract_reviews_from_submission, submission)
+                    )
             except Exception as e:
                 logger.warning("Search query failed: %s - %s", search_query, e)
-                continue
+            return reviews
+        
+        query_reviews = await asyncio.gather(*map(run_query, search_queries, subreddits_by_query))
+        all_reviews = list(chain.from_iterable(query_reviews))
         
         logger.info("Total reviews collected: %d", len(all_reviews))
         return all_reviews
     
     async def close(self):
-        """Clean up resources."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """
+        Close the JSON API client shared on the running event loop.
+        
+        Call this before the loop ends, once no other scraper on the loop is
+        still using the client; a later scrape on the loop opens a new one.
+        """
+        client = _shared_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
     
     def _extract_reviews_from_submission(
         self,
@@ -414,7 +567,10 @@ class RedditScraper(BaseScraper):
         
         try:
             # Extract from post body if it has content
-            if submission.selftext and len(submission.selftext) >= 50:
+            if (
+                submission.selftext and len(submission.selftext) >= 50
+                and self._mentions_pain(submission.selftext)
+            ):
                 reviews.append(Review(
                     source=self.source_name,
                     source_url=f"https://reddit.com{submission.permalink}",
@@ -428,19 +584,20 @@ class RedditScraper(BaseScraper):
             # Extract from comments
             submission.comments.replace_more(limit=0)  # Don't load "more comments"
             
-            for comment in submission.comments.list()[:max_comments]:
+            for comment in islice(self._iter_comments(submission.comments), max_comments):
                 if hasattr(comment, "body") and len(comment.body) >= 50:
                     # Skip bot comments and deleted content
-                    if comment.body in ("[deleted]", "[removed]"):
+                    if comment.body in _DEAD_BODIES or not self._mentions_pain(comment.body):
                         continue
-                    if comment.author and str(comment.author).lower() in ("automoderator", "bot"):
+                    author = sys.intern(str(comment.author)) if comment.author else None
+                    if author and author.lower() in _BOT_AUTHORS:
                         continue
                     
                     reviews.append(Review(
                         source=self.source_name,
                         source_url=f"https://reddit.com{comment.permalink}",
                         product_title=submission.title,
-                        author=str(comment.author) if comment.author else None,
+                        author=author,
                         rating=None,
                         review_text=comment.body,
                         review_date=None,
@@ -449,3 +606,16 @@ class RedditScraper(BaseScraper):
             logger.warning("Error extracting from submission: %s", e)
         
         return reviews
+    
+    @staticmethod
+    def _iter_comments(forest):
+        """
+        Yield the comments of a PRAW comment forest breadth-first, in the
+        order CommentForest.list() gives, without building the whole list.
+        """
+        queue = deque(forest)
+        while queue:
+            comment = queue.popleft()
+            yield comment
+            # MoreComments placeholders have no replies
+            queue.extend(getattr(comment, "replies", ()))
@@ -56,7 +56,7 @@ class TestPainPointAnalyzer:
 ]
 ```
 '''
-        
+
         json_text = analyzer._extract_json(text)
         assert json_text is not None
         assert "review_number" in json_text
@@ -71,6 +71,14 @@ class TestPainPointAnalyzer:
         assert json_text is not None
         assert json_text.startswith("[")
     
+    def test_extract_json_raw_with_surrounding_whitespace(self):
+        """Test fast path strips leading whitespace and trailing text."""
+        analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
+        
+        text = '\n  [{"review_number": 1}]\n\nDone.'
+        
+        assert analyzer._extract_json(text) == '[{"review_number": 1}]'
+    
     def test_parse_response(self):
         """Test parsing Claude response into pain points."""
         analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
@@ -91,7 +99,7 @@ class TestPainPointAnalyzer:
     "implied_need": "Wants more depth"
   }
 ]'''
-        
+
         pain_points = analyzer._parse_response(response_text)
         
         assert len(pain_points) == 2
@@ -115,3 +123,130 @@ class TestPainPointAnalyzer:
         """Test that initializing without API key raises error."""
         with pytest.raises(ValueError, match="API key"):
             PainPointAnalyzer("")
+    
+    def test_parse_response_skips_invalid_items(self):
+        """Test that malformed items and quote-less items are skipped."""
+        analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
+        
+        response_text = '''[
+  "not an object",
+  {"review_number": "abc", "verbatim_quote": "Bad number"},
+  {"review_number": 1, "verbatim_quote": ""},
+  {"review_number": "2", "pain_point_category": "Lacks depth", "verbatim_quote": "Too shallow", "emotional_intensity": "HIGH"}
+]'''
+
+        pain_points = analyzer._parse_response(response_text)
+        
+        assert len(pain_points) == 1
+        assert pain_points[0].review_number == 2
+        assert pain_points[0].emotional_intensity == "high"
+        assert pain_points[0].implied_need == ""
+    
+    def test_create_message_retries_with_retry_after(self):
+        """Test that rate limits are retried, honoring the Retry-After header."""
+        import anthropic
+        import httpx
+        
+        analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
+        analyzer.model = "test"
+        analyzer.max_retries = 3
+        analyzer.client = MagicMock()
+        
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        rate_limited = anthropic.RateLimitError(
+            "rate limited",
+            response=httpx.Response(429, headers={"retry-after": "7"}, request=request),
+            body=None,
+        )
+        analyzer.client.messages.create.side_effect = [rate_limited, "ok"]
+        
+        with patch("src.analyzer.time.sleep") as sleep:
+            assert analyzer._create_message("batch") == "ok"
+        
+        assert analyzer.client.messages.create.call_count == 2
+        assert sleep.call_args[0][0] >= 7
+    
+    def test_create_message_gives_up_after_max_retries(self):
+        """Test that exhausted retries surface as AnalyzerAPIError."""
+        import anthropic
+        import httpx
+        from src.exceptions import AnalyzerAPIError
+        
+        analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
+        analyzer.model = "test"
+        analyzer.max_retries = 2
+        analyzer.client = MagicMock()
+        analyzer.client.messages.create.side_effect = anthropic.APIConnectionError(
+            request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"),
+        )
+        
+        with patch("src.analyzer.time.sleep"):
+            with pytest.raises(AnalyzerAPIError):
+                analyzer._create_message("batch")
+        
+        assert analyzer.client.messages.create.call_count == 2
+    
+    def test_analyze_with_result_numbers_reviews_across_batches(self):
+        """Test that review numbers from later batches are offset."""
+        analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
+        reviews = [Review(source="test", review_text=f"Review {i}") for i in range(3)]
+        batch_responses = [
+            analyzer._parse_response('[{"review_number": 1, "verbatim_quote": "First"}]'),
+            analyzer._parse_response('[{"review_number": 1, "verbatim_quote": "Third"}]'),
+        ]
+        
+        with patch.object(analyzer, "_process_single_batch", side_effect=batch_responses):
+            result = analyzer.analyze_with_result(reviews, batch_size=2)
+        
+        assert [pp.review_number for pp in result.pain_points] == [1, 3]
+
+
+class TestAnalysisResult:
+    """Tests for AnalysisResult."""
+    
+    def test_persist_inserts_mapped_pain_points(self, tmp_path):
+        """Test that persist maps review numbers to IDs and stores them."""
+        from src.analyzer import AnalysisResult
+        from src.database import Database
+        
+        db = Database(str(tmp_path / "test.db"))
+        db.init_db()
+        reviews = [Review(source="test", source_url=f"url{i}", review_text=f"Review {i}") for i in range(2)]
+        for review in reviews:
+            review.id = db.insert_review(review)
+        
+        analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
+        result = AnalysisResult(pain_points=analyzer._parse_response('''[
+  {"review_number": 2, "pain_point_category": "Cost", "verbatim_quote": "Too pricey", "emotional_intensity": "HIGH"},
+  {"review_number": 5, "pain_point_category": "Ghost", "verbatim_quote": "No such review"}
+]'''))
+
+        stored = result.persist(db, reviews)
+        
+        assert len(stored) == 1
+        pain_points = db.get_pain_points()
+        assert len(pain_points) == 1
+        assert pain_points[0].review_id == reviews[1].id
+        assert pain_points[0].emotional_intensity.value == "high"
+    
+    def test_persist_skips_unknown_intensity(self, tmp_path):
+        """Test that an out-of-range intensity drops only that pain point."""
+        from src.analyzer import AnalysisResult
+        from src.database import Database
+        
+        db = Database(str(tmp_path / "test.db"))
+        db.init_db()
+        review = Review(source="test", review_text="Review")
+        review.id = db.insert_review(review)
+        
+        analyzer = PainPointAnalyzer.__new__(PainPointAnalyzer)
+        result = AnalysisResult(pain_points=analyzer._parse_response('''[
+  {"review_number": 1, "pain_point_category": "Cost", "verbatim_quote": "Way too much", "emotional_intensity": "extreme"},
+  {"review_number": 1, "pain_point_category": "Cost", "verbatim_quote": "No answer", "emotional_intensity": null},
+  {"review_number": 1, "pain_point_category": "Delay", "verbatim_quote": "Took weeks", "emotional_intensity": "low"}
+]'''))
+
+        stored = result.persist(db, [review])
+        
+        assert [pp.category for pp in stored] == ["Delay"]
+        assert [pp.category for pp in db.get_pain_points()] == ["Delay"]
@@ -0,0 +1,194 @@
+"""Tests for the database module."""
+
+import pytest
+
+from src.database import Database
+from src.models import Review
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create an initialized database in a temp directory."""
+    database = Database(str(tmp_path / "test.db"))
+    database.init_db()
+    yield database
+    database.close()
+
+
+class TestDatabase:
+    """Tests for Database."""
+    
+    def test_get_connection_reuses_connection(self, db):
+        """Test that the same thread gets the same connection."""
+        with db.get_connection() as first, db.get_connection() as second:
+            assert first is second
+    
+    def test_transaction_groups_batches(self, db):
+        """Test that batches sharing a transaction commit together."""
+        with db.transaction() as conn:
+            db.insert_reviews_batch([Review(source="a", review_text="One")], conn)
+            db.insert_reviews_batch([Review(source="b", review_text="Two")], conn)
+        
+        assert len(db.get_reviews()) == 2
+    
+    def test_transaction_rolls_back_on_error(self, db):
+        """Test that a failed transaction leaves no rows behind."""
+        with pytest.raises(RuntimeError):
+            with db.transaction() as conn:
+                db.insert_reviews_batch([Review(source="a", review_text="One")], conn)
+                raise RuntimeError("boom")
+        
+        assert db.get_reviews() == []
+    
+    def test_rows_are_converted_to_model_types(self, db):
+        """Test that rows read back get the same types validation would give."""
+        from datetime import datetime
+        from src.models import EmotionalIntensity, PainPoint
+        
+        db.insert_reviews_batch([Review(source="a", review_text="One")])
+        review = db.get_reviews()[0]
+        db.insert_pain_points_batch([PainPoint(
+            review_id=review.id,
+            category="Cost",
+            verbatim_quote="Too pricey",
+            emotional_intensity=EmotionalIntensity.HIGH,
+        )])
+        
+        pain_point, joined_review = db.get_all_pain_points_with_reviews()[0]
+        
+        assert review.processed is False
+        assert isinstance(review.scraped_at, datetime)
+        assert pain_point.emotional_intensity is EmotionalIntensity.HIGH
+        assert isinstance(pain_point.extracted_at, datetime)
+        assert joined_review == review
+    
+    def test_mark_reviews_processed_large_batch(self, db):
+        """Test that ID lists past the inline limit go through the temp table."""
+        reviews = [Review(source="a", review_text=f"Review {i}") for i in range(db.MAX_INLINE_IDS + 5)]
+        db.insert_reviews_batch(reviews)
+        review_ids = [review.id for review in db.get_reviews()]
+        
+        db.mark_reviews_processed(review_ids[:-1])
+        
+        assert [r.id for r in db.get_unprocessed_reviews()] == review_ids[-1:]
+    
+    def test_foreign_keys_enforced(self, db):
+        """Test that pain points must reference an existing review."""
+        import sqlite3
+        from src.models import PainPoint
+        
+        with pytest.raises(sqlite3.IntegrityError):
+            db.insert_pain_points_batch([PainPoint(review_id=999, category="Cost", verbatim_quote="Quote")])
+    
+    @pytest.mark.parametrize("extra", [0, Database.MAX_INLINE_IDS])
+    def test_get_reviews_by_ids(self, db, extra):
+        """Test bulk lookup by ID for both inline and temp-table ID lists."""
+        db.insert_reviews_batch([Review(source="a", review_text=f"Review {i}") for i in range(3)])
+        review_ids = [review.id for review in db.get_reviews()]
+        missing_ids = list(range(1000, 1000 + extra))
+        
+        reviews = db.get_reviews_by_ids(review_ids[:2] + missing_ids)
+        
+        assert sorted(reviews) == review_ids[:2]
+        assert reviews[review_ids[0]].review_text == "Review 0"
+    
+    def test_get_reviews_by_ids_keeps_caller_transaction(self, db):
+        """Test that a temp-table ID lookup doesn't commit the caller's writes."""
+        review_ids = list(range(1000, 1001 + Database.MAX_INLINE_IDS))
+        
+        with pytest.raises(RuntimeError):
+            with db.transaction() as conn:
+                db.insert_reviews_batch([Review(source="a", review_text="One")], conn)
+                db.get_reviews_by_ids(review_ids)
+                raise RuntimeError("abort")
+        
+        assert db.get_reviews() == []
+    
+    def test_iter_pain_points_largest_category_first(self, db):
+        """Test that rows can be grouped by category size, ties alphabetical."""
+        from src.models import PainPoint
+        
+        review_id = db.insert_review(Review(source="a", review_text="Review"))
+        db.insert_pain_points_batch([
+            PainPoint(review_id=review_id, category=category, verbatim_quote=f"Quote {i}")
+            for i, category in enumerate(["Cost", "Length", "Depth", "Length", "Cost", "Length"])
+        ])
+        
+        rows = db.iter_all_pain_points_with_reviews(largest_category_first=True)
+        
+        assert [pp.category for pp, _ in rows] == ["Length"] * 3 + ["Cost"] * 2 + ["Depth"]
+    
+    def test_pain_point_stats_skip_orphans(self, db):
+        """Test that stats count only pain points the exported rows include."""
+        from src.models import PainPoint
+        
+        review_id = db.insert_review(Review(source="a", review_text="Review"))
+        db.insert_pain_points_batch([PainPoint(review_id=review_id, category="Cost", verbatim_quote="Quote")])
+        with db.get_connection() as conn:
+            conn.execute("PRAGMA foreign_keys = OFF")
+            conn.execute(
+                "INSERT INTO pain_points (review_id, category, verbatim_quote) VALUES (999, 'Orphan', 'Quote')"
+            )
+            conn.commit()
+            conn.execute("PRAGMA foreign_keys = ON")
+        
+        stats = db.get_pain_point_stats()
+        
+        assert stats.total_pain_points == 1
+        assert stats.by_category == {"Cost": 1}
+        assert len(list(db.iter_all_pain_points_with_reviews())) == 1
+    
+    def test_abandoned_stream_keeps_transaction(self, db):
+        """Test that dropping a streaming read doesn't roll back the caller's writes."""
+        from src.models import PainPoint
+        
+        review_id = db.insert_review(Review(source="a", review_text="Review"))
+        db.insert_pain_points_batch([
+            PainPoint(review_id=review_id, category="Cost", verbatim_quote=f"Quote {i}") for i in range(2)
+        ])
+        
+        with db.transaction() as conn:
+            db.insert_reviews_batch([Review(source="b", review_text="Two")], conn)
+            rows = db.iter_all_pain_points_with_reviews()
+            next(rows)
+            rows.close()
+        
+        assert len(db.get_reviews()) == 2
+    
+    def test_transaction_nests_and_holds_single_writes(self, db):
+        """Test that writes inside transaction() all commit or roll back with it."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.insert_review(Review(source="a", review_text="One"))
+                job_id = db.create_scrape_job("a")
+                db.update_scrape_job(job_id, reviews_found=1)
+                raise RuntimeError("boom")
+        
+        assert db.get_reviews() == []
+        
+        with db.transaction():
+            db.insert_review(Review(source="a", review_text="One"))
+            db.insert_reviews_batch([Review(source="b", review_text="Two")])
+            with pytest.raises(RuntimeError):
+                with db.transaction() as conn:
+                    db.insert_reviews_batch([Review(source="c", review_text="Three")], conn)
+                    raise RuntimeError("boom")
+        
+        assert sorted(r.source for r in db.get_reviews()) == ["a", "b"]
+    
+    def test_init_db_analyzes_only_new_indexes(self, db):
+        """Test that init_db() gathers full statistics only when it creates indexes."""
+        db.insert_review(Review(source="a", review_text="One"))
+        with db.get_connection() as conn:
+            conn.execute("DELETE FROM sqlite_stat1")
+            conn.commit()
+        
+        db.init_db()
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] == 0
+            conn.execute("DROP INDEX idx_reviews_source")
+            conn.commit()
+        
+        db.init_db()
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
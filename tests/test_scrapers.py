@@ -3,32 +3,38 @@
 import pytest
 from pathlib import Path
 
-from src.scrapers.csv_import import CSVImporter, import_reviews
+from src.models import Review
+from src.scrapers.csv_import import CSVImporter, import_reviews, import_reviews_many
 
 
 class TestCSVImporter:
     """Tests for CSV import functionality."""
     
-    def test_import_csv(self, tmp_path):
-        """Test importing reviews from CSV file."""
+    def test_import_csv(self):
+        """Test importing reviews from CSV text."""
         csv_content = """source,product_title,rating,review_text,review_date
 test,Test Book,2,This is a test review with enough content to pass the minimum length requirement for reviews.,2024-01-15
 test,Another Book,3,Another test review that also needs to be long enough to be considered valid content.,2024-01-16
 """
-        csv_file = tmp_path / "test_reviews.csv"
-        csv_file.write_text(csv_content)
-        
         importer = CSVImporter()
-        reviews = importer.import_csv(str(csv_file))
+        reviews = importer.import_csv_string(csv_content)
         
         assert len(reviews) == 2
         assert reviews[0].source == "test"
         assert reviews[0].product_title == "Test Book"
         assert reviews[0].rating == 2
         assert "test review" in reviews[0].review_text
+        # Built without validation, but equal to a review built with it
+        assert reviews[1] == Review(
+            source="test",
+            product_title="Another Book",
+            rating=3,
+            review_text=reviews[1].review_text,
+            review_date="2024-01-16",
+        )
     
-    def test_import_json(self, tmp_path):
-        """Test importing reviews from JSON file."""
+    def test_import_json(self):
+        """Test importing reviews from JSON text."""
         json_content = """[
     {
         "source": "test",
@@ -38,16 +44,119 @@ test,Another Book,3,Another test review that also needs to be long enough to be
         "review_date": "2024-01-15"
     }
 ]"""
-        json_file = tmp_path / "test_reviews.json"
-        json_file.write_text(json_content)
-        
         importer = CSVImporter()
-        reviews = importer.import_json(str(json_file))
+        reviews = importer.import_json_string(json_content)
         
         assert len(reviews) == 1
         assert reviews[0].source == "test"
         assert reviews[0].rating == 2
     
+    def test_import_json_checks_text_fields(self):
+        """Test that JSON scalars become strings and nested values are rejected."""
+        importer = CSVImporter()
+        
+        reviews = importer.import_json_string('[{"review_text": "Text", "author": 12, "review_date": null}]')
+        
+        assert (reviews[0].author, reviews[0].review_date) == ("12", None)
+        with pytest.raises(ValueError):
+            importer.import_json_string('[{"review_text": "Text", "product_title": {"name": "Book"}}]')
+    
+    def test_import_json_streaming(self, tmp_path, monkeypatch):
+        """Test that large JSON files parse item by item with ijson."""
+        pytest.importorskip("ijson")
+        from src.scrapers import csv_import
+        
+        monkeypatch.setattr(csv_import, "_STREAM_JSON_MIN_BYTES", 0)
+        json_file = tmp_path / "test_reviews.json"
+        json_file.write_text('[{"rating": 2.0, "review_text": "First review"}, {"review_text": ""}]')
+        
+        reviews = CSVImporter().import_json(str(json_file))
+        
+        assert [(r.review_text, r.rating) for r in reviews] == [("First review", 2)]
+        assert type(next(csv_import._stream_json_items(json_file))["rating"]) is float
+        
+        json_file.write_text('{"review_text": "Not in an array"}')
+        with pytest.raises(ValueError):
+            CSVImporter().import_json(str(json_file))
+    
+    def test_import_jsonl(self, tmp_path):
+        """Test importing reviews from a JSON Lines file, skipping blank lines."""
+        jsonl_file = tmp_path / "test_reviews.jsonl"
+        jsonl_file.write_text(
+            '{"source": "test", "rating": 2, "review_text": "First review"}\n'
+            '\n'
+            '{"rating": 9, "review_text": "Second review"}\n'
+            '{"review_text": ""}\n'
+        )
+        
+        reviews = import_reviews(str(jsonl_file))
+        
+        assert [r.review_text for r in reviews] == ["First review", "Second review"]
+        assert CSVImporter().count_valid(str(jsonl_file)) == 2
+        assert reviews[1].source == "manual"
+        assert reviews[1].rating is None
+    
+    def test_iter_csv_is_lazy(self, tmp_path):
+        """Test that iter_csv yields reviews without reading the whole file first."""
+        csv_file = tmp_path / "test_reviews.csv"
+        csv_file.write_text("review_text\nFirst\nSecond\n")
+        
+        reviews = CSVImporter().iter_csv(str(csv_file))
+        
+        assert next(reviews).review_text == "First"
+        assert [r.review_text for r in reviews] == ["Second"]
+    
+    def test_import_csv_with_pandas_matches_csv_module(self, tmp_path, monkeypatch):
+        """Test that large-file pandas parsing reads rows as the csv module does."""
+        from src.scrapers import csv_import
+        
+        csv_file = tmp_path / "test_reviews.csv"
+        csv_file.write_text(
+            "review_text,rating,author,review_text,product_title\n"
+            "Ignored,3,ann,First review,Book\n"
+            "Short row\n"
+            "Ignored,7,bob,\"Second, quoted\",,extra\n"
+            "Ignored,,,Short with text\n"
+        )
+        
+        def import_with_min_bytes(min_bytes):
+            monkeypatch.setattr(csv_import, "_PANDAS_MIN_BYTES", min_bytes)
+            return [
+                (r.review_text, r.rating, r.author, r.product_title)
+                for r in CSVImporter().import_csv(str(csv_file))
+            ]
+        
+        expected = [
+            ("First review", 3, "ann", "Book"),
+            ("Second, quoted", None, "bob", None),
+            ("Short with text", None, None, None),
+        ]
+        assert import_with_min_bytes(float("inf")) == expected
+        assert import_with_min_bytes(0) == expected
+    
+    def test_import_files_keeps_file_order(self, tmp_path):
+        """Test importing several files in parallel, in the order given."""
+        csv_file = tmp_path / "a.csv"
+        csv_file.write_text("review_text\nFrom CSV\n")
+        jsonl_file = tmp_path / "b.jsonl"
+        jsonl_file.write_text('{"review_text": "From JSONL"}\n')
+        
+        reviews = CSVImporter().import_files([str(jsonl_file), str(csv_file)], max_workers=2)
+        
+        assert [r.review_text for r in reviews] == ["From JSONL", "From CSV"]
+    
+    def test_import_reviews_many(self, tmp_path):
+        """Test importing many files with several per worker task."""
+        paths = []
+        for i in range(10):
+            csv_file = tmp_path / f"{i}.csv"
+            csv_file.write_text(f"review_text\nReview {i}\n")
+            paths.append(str(csv_file))
+        
+        reviews = import_reviews_many(paths, max_workers=2)
+        
+        assert [r.review_text for r in reviews] == [f"Review {i}" for i in range(10)]
+    
     def test_import_sample_json(self):
         """Test importing the sample reviews JSON file."""
         sample_file = Path("tests/sample_reviews.json")
@@ -76,3 +185,262 @@ test,Another Book,3,Valid review content that is long enough.,2024-01-16
         
         assert len(reviews) == 1
         assert reviews[0].product_title == "Another Book"
+        assert importer.count_valid(str(csv_file)) == 1
+
+
+class TestAmazonScraper:
+    """Tests for Amazon scraper parsing helpers."""
+    
+    @pytest.mark.parametrize("url, asin", [
+        ("https://www.amazon.com/Deep-Work/dp/1455586692/ref=sr_1_1", "1455586692"),
+        ("https://www.amazon.com/product/B00ABCDEFG", "B00ABCDEFG"),
+        ("https://www.amazon.com/gp/product/B00ABCDEFG?th=1", "B00ABCDEFG"),
+        ("https://www.amazon.com/s?k=books", None),
+    ])
+    def test_extract_asin(self, url, asin):
+        """Test ASIN extraction from the supported URL formats."""
+        from src.scrapers.amazon import AmazonScraper
+        
+        scraper = AmazonScraper.__new__(AmazonScraper)
+        assert scraper._extract_asin(url) == asin
+    
+    def test_extract_review_from_card_fields(self):
+        """Test building a review from fields extracted in the page."""
+        from src.scrapers.amazon import AmazonScraper
+        
+        scraper = AmazonScraper.__new__(AmazonScraper)
+        card = {
+            "text": "A long enough review text that goes past the fifty character minimum.",
+            "author": "Reader",
+            "date": "Reviewed in the United States on January 1, 2024",
+            "rating": "2.0 out of 5 stars",
+        }
+        
+        review = scraper._extract_review(card, "Test Book", "https://www.amazon.com/dp/1455586692", 3)
+        
+        assert review.rating == 2
+        assert review.review_date == "January 1, 2024"
+        assert review.author == "Reader"
+        assert scraper._extract_review({**card, "text": None}, "Test Book", "url", 3) is None
+    
+    def test_parse_review_cards_from_html(self):
+        """Test parsing review cards from plain HTML, as the HTTP fast path does."""
+        from src.scrapers.amazon import AmazonScraper, _parse_review_cards
+        
+        html = """
+        <div data-hook="review">
+            <span class="a-profile-name">Reader</span>
+            <i data-hook="review-star-rating"><span>2.0 out of 5 stars</span></i>
+            <span data-hook="review-date">Reviewed in the United States on January 15, 2024</span>
+            <span data-hook="review-body"><span> Too basic.<br>Skip it. </span></span>
+        </div>
+        <ul class="a-pagination"><li class="a-last"><a href="?pageNumber=2">Next</a></li></ul>
+        """
+        
+        cards, has_next, captcha = _parse_review_cards(html, AmazonScraper.SELECTORS)
+        
+        assert cards == [{
+            "text": "Too basic.\nSkip it.",
+            "author": "Reader",
+            "date": "Reviewed in the United States on January 15, 2024",
+            "rating": "2.0 out of 5 stars",
+        }]
+        assert has_next and not captcha
+        assert _parse_review_cards('<input id="captchacharacters">', AmazonScraper.SELECTORS)[2]
+    
+    def test_navigate_retries_timeouts_then_gives_up(self):
+        """Test that page load timeouts are retried before raising."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from src.exceptions import ScraperTimeoutError
+        from src.scrapers.amazon import AmazonScraper
+        from src.scrapers.rate_limit import RateLimiter
+        
+        scraper = AmazonScraper.__new__(AmazonScraper)
+        scraper._limiter = RateLimiter(0)
+        scraper._check_for_captcha = AsyncMock(return_value=False)
+        page = AsyncMock()
+        page.goto.side_effect = [TimeoutError(), None]
+        
+        with patch("src.scrapers.amazon.asyncio.sleep", new=AsyncMock()) as sleep:
+            asyncio.run(scraper._navigate_with_retry(page, "https://www.amazon.com/dp/1455586692"))
+            assert page.goto.call_count == 2
+            # One retry wait, besides the jitter before each attempt
+            assert [c.args[0] for c in sleep.await_args_list if c.args[0] >= 5] == [5]
+            
+            page.goto.reset_mock(side_effect=True)
+            page.goto.side_effect = TimeoutError()
+            with pytest.raises(ScraperTimeoutError):
+                asyncio.run(scraper._navigate_with_retry(page, "https://www.amazon.com/dp/1455586692"))
+            assert page.goto.call_count == 3
+    
+    def test_navigate_with_wait_selector_falls_back_to_parsed_page(self):
+        """Test that a missing wait_selector element falls back to the parsed document."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from src.scrapers.amazon import AmazonScraper
+        from src.scrapers.rate_limit import RateLimiter
+        
+        scraper = AmazonScraper.__new__(AmazonScraper)
+        scraper._limiter = RateLimiter(0)
+        scraper._check_for_captcha = AsyncMock(return_value=False)
+        page = AsyncMock()
+        page.wait_for_selector.side_effect = TimeoutError()
+        
+        with patch("src.scrapers.amazon._NAVIGATION_JITTER", 0):
+            asyncio.run(scraper._navigate_with_retry(page, "https://www.amazon.com/dp/1455586692", "#productTitle"))
+        
+        assert page.goto.call_args.kwargs["wait_until"] == "commit"
+        assert "#productTitle" in page.wait_for_selector.call_args.args[0]
+        page.wait_for_load_state.assert_awaited_once()
+
+
+class TestGoodreadsScraper:
+    """Tests for Goodreads scraper."""
+    
+    def test_fetch_page_retries_then_honors_retry_after(self):
+        """Test that transient errors and 429s are retried, and 429s raise once retries run out."""
+        import asyncio
+        import httpx
+        from unittest.mock import AsyncMock, patch
+        from src.exceptions import RateLimitError
+        from src.scrapers.goodreads import GoodreadsScraper
+        
+        scraper = GoodreadsScraper()
+        responses = iter([
+            httpx.ConnectError("refused"),
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, content=b"<html></html>"),
+        ])
+        
+        def handler(request):
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        
+        async def fetch(handler):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await scraper._fetch_page(client, "https://www.goodreads.com/book/show/1")
+        
+        with patch("src.scrapers.goodreads.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert asyncio.run(fetch(handler)) == b"<html></html>"
+            waits = [c.args[0] for c in sleep.await_args_list]
+            assert len(waits) == 2
+            assert 2 <= waits[0] < 3
+            assert 7 <= waits[1] < 8
+            
+            with pytest.raises(RateLimitError):
+                asyncio.run(fetch(lambda request: httpx.Response(429)))
+            assert sleep.await_count == 2 + scraper.max_retries - 1
+    
+    def test_extract_review_text_prefers_inner_container(self):
+        """Test that the preferred text selector wins over an element that wraps it."""
+        from src.scrapers.goodreads import GoodreadsScraper
+        from src.scrapers.html_parser import parse_html
+        
+        scraper = GoodreadsScraper.__new__(GoodreadsScraper)
+        soup = parse_html(
+            '<article><div class="ReviewText__content"><span>Spoiler</span>'
+            '<div data-testid="contentContainer">The review</div></div></article>'
+        )
+        
+        assert scraper._extract_review_text(soup.select_one("article")) == "The review"
+
+
+class TestHTMLParser:
+    """Tests for the shared HTML parsing helper."""
+    
+    def test_parse_html_tag_api(self):
+        """Test the Tag-like API the scrapers use, whichever parser is installed."""
+        from src.scrapers.html_parser import compile_selector, parse_html
+        
+        soup = parse_html('<div class="a b" title="2 stars"><p> Hi <b>there</b> </p><p>x</p></div>')
+        
+        div = soup.select_one("div")
+        assert div.get("class") == ["a", "b"]
+        assert div.get("title") == "2 stars"
+        assert div.get("missing", "") == ""
+        assert div.select_one("p").get_text(strip=True) == "Hithere"
+        assert len(div.select("p")) == 2
+        assert len(div.select(compile_selector("p, b"))) == 3
+        assert soup.select_one(compile_selector("span")) is None
+    
+    def test_parse_only_keeps_matching_elements_whole(self):
+        """Test that a parse_only filter keeps matched elements and their contents."""
+        from bs4 import BeautifulSoup
+        from src.scrapers.html_parser import AttributeFilter
+        
+        html = (
+            '<h1>Title</h1><div data-testid="reviewCard"><span class="user">Ann</span></div>'
+            '<article class="ReviewCard wide"><p>Text</p></article><p class="other">Skip</p>'
+        )
+        cards = AttributeFilter({
+            "data-testid": frozenset({"reviewCard"}),
+            "class": frozenset({"ReviewCard"}),
+        })
+        
+        soup = BeautifulSoup(html, "lxml", parse_only=cards)
+        
+        assert soup.select_one("[data-testid='reviewCard'] .user").get_text() == "Ann"
+        assert soup.select_one(".ReviewCard p").get_text() == "Text"
+        assert soup.select_one("h1") is None
+        assert soup.select_one(".other") is None
+
+
+class TestRateLimiter:
+    """Tests for the shared request rate limiter."""
+    
+    def test_spaces_concurrent_requests(self):
+        """Test that concurrent callers share one rate after the burst."""
+        import asyncio
+        import time
+        from src.scrapers.rate_limit import RateLimiter
+        
+        async def run() -> float:
+            limiter = RateLimiter(rate=20, burst=2)
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+            return time.monotonic() - start
+        
+        # Two go at once, the other two wait 1/20s each
+        assert 0.09 <= asyncio.run(run()) < 0.5
+    
+    def test_zero_rate_disables_limit(self):
+        """Test that a rate of 0 never waits."""
+        import asyncio
+        from src.scrapers.rate_limit import RateLimiter
+        
+        limiter = RateLimiter(rate=0)
+        asyncio.run(asyncio.wait_for(limiter.acquire(), timeout=1))
+        asyncio.run(asyncio.wait_for(limiter.acquire(), timeout=1))
+
+
+class TestPageCache:
+    """Tests for the on-disk page cache."""
+    
+    def test_round_trip_and_expiry(self, tmp_path):
+        """Test that entries are returned until they expire."""
+        import os
+        from src.scrapers.page_cache import PageCache
+        
+        cache = PageCache(str(tmp_path / "cache"), ttl=60)
+        assert cache.get("B000:1:1") is None
+        
+        cache.set("B000:1:1", {"cards": [{"text": "Review"}], "has_next": False})
+        assert cache.get("B000:1:1") == {"cards": [{"text": "Review"}], "has_next": False}
+        
+        # Age the entry past its TTL
+        path = next((tmp_path / "cache").iterdir())
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime - 120))
+        assert cache.get("B000:1:1") is None
+    
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        """Test that a TTL of zero never stores anything."""
+        from src.scrapers.page_cache import PageCache
+        
+        cache = PageCache(str(tmp_path / "cache"), ttl=0)
+        cache.set("key", "value")
+        
+        assert cache.get("key") is None
+        assert not (tmp_path / "cache").exists()